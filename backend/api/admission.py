@@ -0,0 +1,42 @@
+import os
+
+from fastapi import HTTPException, Request
+
+from services.admission_control import AdmissionRejected, admission_control
+
+# true면 X-Forwarded-For의 첫 번째 주소를 클라이언트로 사용 (리버스 프록시 뒤에서 실행할 때만 설정)
+RATE_LIMIT_TRUST_PROXY = os.getenv("RATE_LIMIT_TRUST_PROXY", "false").lower() == "true"
+
+
+def client_address(request: Request) -> str:
+    if RATE_LIMIT_TRUST_PROXY:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def admission(route_class: str):
+    """
+    라우트별 요청 제한 의존성
+    @router.post(..., dependencies=[Depends(admission("analyze"))]) 형태로 사용
+    제한을 넘으면 대기하지 않고 429 + Retry-After
+    """
+    if route_class not in admission_control.policies:
+        raise ValueError(f"알 수 없는 라우트 클래스입니다: {route_class}")
+
+    async def dependency(request: Request):
+        try:
+            admission_control.acquire(route_class, client_address(request))
+        except AdmissionRejected as e:
+            raise HTTPException(
+                status_code=429,
+                detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": str(e.retry_after)},
+            )
+        try:
+            yield
+        finally:
+            admission_control.release(route_class)
+
+    return dependency
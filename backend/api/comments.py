@@ -1,107 +1,187 @@
-from fastapi import APIRouter, Depends, HTTPException, Body
+from fastapi import APIRouter, Depends, HTTPException, Body, Query
+from sqlalchemy import and_, delete, or_
 from sqlalchemy.orm import Session
+from typing import Optional
 from models.post import Post
 from models.comment import Comment
-from database import SessionLocal
 from dto.comment import CommentCreate
-import bcrypt
+from api.db import DbSession, get_db, get_read_db, run_db
+from api.passwords import hash_password_async, check_password_async
+from api.admission import admission
+from api.encoding import JSONBytesResponse
+from api.pagination import encode_cursor, parse_cursor
+from services.search_index import search_index
+from services.response_cache import response_cache, post_tag
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+def serialize_comment(comment) -> dict:
+    """Comment 객체 또는 (id, post_id, content, created_at) 조회 행 → 응답 항목"""
+    return {
+        "id": comment.id,
+        "postId": comment.post_id,
+        "content": comment.content,
+        "createdAt": comment.created_at.isoformat() + 'Z',
+    }
 
-# 댓글 생성 API
-@router.post("/comments")
-def create_comment(comment: CommentCreate, db: Session = Depends(get_db)):
-    post = db.query(Post).filter(Post.id == comment.postId).first()
-    if not post:
-        raise HTTPException(status_code=404, detail="Post not found")
-    password_hash = bcrypt.hashpw(comment.password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+# 라우터는 async def, DB 작업은 아래 동기 함수로 작성해 run_db로 실행 (api/db.py 참고)
+
+def post_exists(db: Session, post_id: int) -> bool:
+    return db.query(Post.id).filter(Post.id == post_id).first() is not None
+
+def find_comment(db: Session, comment_id: int) -> Comment:
+    comment = db.query(Comment).filter(Comment.id == comment_id).first()
+    if not comment:
+        raise HTTPException(status_code=404, detail="Comment not found")
+    return comment
+
+def insert_comment(db: Session, comment: CommentCreate, password_hash: str) -> dict:
     new_comment = Comment(
         post_id=comment.postId,
         content=comment.content,
         password_hash=password_hash,
     )
     db.add(new_comment)
+    db.query(Post).filter(Post.id == comment.postId).update(
+        {Post.comment_count: Post.comment_count + 1}, synchronize_session=False
+    )
+    search_index.index_comment_change(db, comment.postId, None, comment.content)
     db.commit()
     db.refresh(new_comment)
-    return {
-        "id": new_comment.id,
-        "postId": new_comment.post_id,
-        "content": new_comment.content,
-        "createdAt": new_comment.created_at.isoformat() + 'Z',
-    }
+    return serialize_comment(new_comment)
+
+def apply_comment_update(db: Session, comment: Comment, content: str) -> dict:
+    # 동시에 같은 댓글을 수정해도 색인에서 빼는 내용이 최신이 되도록 잠근 뒤 다시 읽음
+    db.refresh(comment, with_for_update=True)
+    search_index.index_comment_change(db, comment.post_id, comment.content, content)
+    comment.content = content
+    db.commit()
+    db.refresh(comment)
+    return serialize_comment(comment)
+
+def delete_comment_record(db: Session, comment: Comment):
+    # 같은 댓글을 동시에 삭제하면 둘 다 비밀번호 확인을 통과하므로, 실제로 지운 요청만 댓글 수/색인에 반영
+    # (잠근 뒤 읽은 최신 내용을 색인에서 제거)
+    content = db.query(Comment.content).filter(Comment.id == comment.id).with_for_update().scalar()
+    deleted = db.execute(delete(Comment).where(Comment.id == comment.id)).rowcount
+    if deleted != 1:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Comment not found")
+    db.query(Post).filter(Post.id == comment.post_id).update(
+        {Post.comment_count: Post.comment_count - 1}, synchronize_session=False
+    )
+    search_index.index_comment_change(db, comment.post_id, content, None)
+    db.commit()
+
+# 댓글 생성 API
+@router.post("/comments", dependencies=[Depends(admission("password"))])
+async def create_comment(comment: CommentCreate, db: DbSession = Depends(get_db)):
+    if not await run_db(db, post_exists, comment.postId):
+        raise HTTPException(status_code=404, detail="Post not found")
+    password_hash = await hash_password_async(comment.password)
+    body = await run_db(db, insert_comment, comment, password_hash)
+    response_cache.invalidate(post_tag(comment.postId))
+    return body
 
 # 댓글 수정 API
-@router.patch("/comments/{comment_id}")
-def update_comment(
+@router.patch("/comments/{comment_id}", dependencies=[Depends(admission("password"))])
+async def update_comment(
     comment_id: int,
     data: dict = Body(...),
-    db: Session = Depends(get_db)
+    db: DbSession = Depends(get_db)
 ):
-    comment = db.query(Comment).filter(Comment.id == comment_id).first()
-    if not comment:
-        raise HTTPException(status_code=404, detail="Comment not found")
+    comment = await run_db(db, find_comment, comment_id)
     password = data.get("password")
     content = data.get("content")
     if not password or not content:
         raise HTTPException(status_code=400, detail="Password and content required")
-    if not bcrypt.checkpw(password.encode("utf-8"), comment.password_hash.encode("utf-8")):
+    if not await check_password_async(password, comment.password_hash):
         raise HTTPException(status_code=403, detail="Incorrect password")
-    comment.content = content
-    db.commit()
-    db.refresh(comment)
-    return {
-        "id": comment.id,
-        "postId": comment.post_id,
-        "content": comment.content,
-        "createdAt": comment.created_at.isoformat() + 'Z',
-    }
+    body = await run_db(db, apply_comment_update, comment, content)
+    response_cache.invalidate(post_tag(body["postId"]))
+    return body
 
 # 댓글 삭제 API
-@router.delete("/comments/{comment_id}")
-def delete_comment(
+@router.delete("/comments/{comment_id}", dependencies=[Depends(admission("password"))])
+async def delete_comment(
     comment_id: int,
     data: dict = Body(...),
-    db: Session = Depends(get_db)
+    db: DbSession = Depends(get_db)
 ):
-    comment = db.query(Comment).filter(Comment.id == comment_id).first()
-    if not comment:
-        raise HTTPException(status_code=404, detail="Comment not found")
+    comment = await run_db(db, find_comment, comment_id)
     password = data.get("password")
     if not password:
         raise HTTPException(status_code=400, detail="Password required")
-    if not bcrypt.checkpw(password.encode("utf-8"), comment.password_hash.encode("utf-8")):
+    if not await check_password_async(password, comment.password_hash):
         raise HTTPException(status_code=403, detail="Incorrect password")
-    db.delete(comment)
-    db.commit()
+    post_id = comment.post_id
+    await run_db(db, delete_comment_record, comment)
+    response_cache.invalidate(post_tag(post_id))
     return {"success": True}
 
 # 댓글 페이징 조회 API
+# - offset 모드: ?offset=&limit= (기존 방식, 댓글 배열 반환)
+# - cursor 모드: ?after=<created_at,id>&limit= (첫 페이지는 ?after=), next_cursor로 다음 페이지 조회
+# - ?order=desc: 최신 댓글부터 (마지막 댓글로 바로 이동할 때 사용)
+# 게시글 존재 확인과 댓글 페이지를 한 쿼리로 조회 (post LEFT JOIN comment)
 @router.get("/comments/{post_id}")
-def get_comments(post_id: int, offset: int = 0, limit: int = 20, db: Session = Depends(get_db)):
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
-        raise HTTPException(status_code=404, detail="Post not found")
-    comments = (
-        db.query(Comment)
-        .filter(Comment.post_id == post_id)
-        .order_by(Comment.created_at.asc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+async def get_comments(
+    post_id: int,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    after: Optional[str] = Query(None),
+    order: str = Query("asc", pattern="^(asc|desc)$"),
+    db: DbSession = Depends(get_read_db),
+):
+    return JSONBytesResponse(await run_db(db, list_comments, post_id, offset, limit, after, order))
+
+def list_comments(db: Session, post_id: int, offset: int, limit: int, after: Optional[str], order: str):
+    descending = order == "desc"
+    join_on = Comment.post_id == Post.id
+    if after:
+        after_created_at, after_id = parse_cursor(after)
+        if descending:
+            keyset = or_(
+                Comment.created_at < after_created_at,
+                and_(Comment.created_at == after_created_at, Comment.id < after_id),
+            )
+        else:
+            keyset = or_(
+                Comment.created_at > after_created_at,
+                and_(Comment.created_at == after_created_at, Comment.id > after_id),
+            )
+        join_on = and_(join_on, keyset)
+    ordering = (
+        (Comment.created_at.desc(), Comment.id.desc())
+        if descending
+        else (Comment.created_at.asc(), Comment.id.asc())
+    )
+    query = (
+        db.query(Post.id.label("found_post_id"), Comment.id, Comment.post_id, Comment.content, Comment.created_at)
+        .select_from(Post)
+        .outerjoin(Comment, join_on)
+        .filter(Post.id == post_id)
+        .order_by(*ordering)
     )
-    return [
-        {
-            "id": c.id,
-            "postId": c.post_id,
-            "content": c.content,
-            "createdAt": c.created_at.isoformat() + 'Z',
-        }
-        for c in comments
-    ] 
\ No newline at end of file
+    if after is None:
+        query = query.offset(offset)
+    # 다음 페이지 존재 여부는 limit + 1개를 조회해서 판단
+    rows = query.limit(limit + 1).all()
+    if not rows:
+        # 게시글이 없을 때만 행이 없음 (해당 페이지에 댓글이 없으면 댓글 컬럼이 NULL인 행 하나)
+        # 단, offset 모드에서 offset이 댓글 수 이상이면 행이 없으므로 그때만 게시글 존재를 따로 확인
+        if after is not None or offset == 0 or db.query(Post.id).filter(Post.id == post_id).first() is None:
+            raise HTTPException(status_code=404, detail="Post not found")
+    rows = [row for row in rows if row.id is not None]
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+    comments = [serialize_comment(row) for row in rows]
+
+    if after is None:
+        return comments
+    last = rows[-1] if rows else None
+    return {
+        "comments": comments,
+        "has_next": has_next,
+        "next_cursor": encode_cursor(last.created_at, last.id) if has_next else None,
+    }
@@ -0,0 +1,63 @@
+from typing import Callable, TypeVar, Union
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from database import DB_ASYNC, AsyncSessionLocal, SessionLocal
+from services.read_routing import read_routing
+
+# 게시글/댓글 API의 DB 세션 의존성과 실행 도우미
+# - DB_ASYNC=true: AsyncSession (aiomysql), 쿼리는 이벤트 루프에서 실행되어 스레드를 점유하지 않음
+# - DB_ASYNC=false: 기존 동기 Session, 쿼리는 스레드풀에서 실행 (비교용)
+# 라우터는 async def로 두고 DB 작업은 동기 Session을 받는 함수로 작성해 run_db로 실행하므로
+# 두 방식이 같은 쿼리 코드를 공유함
+
+DbSession = Union[AsyncSession, Session]
+T = TypeVar("T")
+
+
+async def _close(db: DbSession):
+    if isinstance(db, AsyncSession):
+        await db.close()
+    else:
+        # 연결 반납 시 ROLLBACK이 DB를 왕복하므로 이벤트 루프 밖에서 실행
+        await run_in_threadpool(db.close)
+
+
+# 쓰기 API용 세션 (항상 주 DB)
+async def get_db():
+    db = AsyncSessionLocal() if DB_ASYNC else SessionLocal()
+    try:
+        yield db
+    finally:
+        await _close(db)
+
+
+# 조회 API용 세션 (복제본이 있으면 복제본, 방금 쓰기를 한 클라이언트는 주 DB)
+async def get_read_db(request: Request):
+    db = read_routing.async_session_for(request) if DB_ASYNC else read_routing.session_for(request)
+    try:
+        yield db
+    finally:
+        await _close(db)
+
+
+# 동기 라우터(def)용 조회 세션 (DB_ASYNC와 무관하게 항상 동기 Session, 라우터는 스레드풀에서 실행됨)
+def get_sync_read_db(request: Request):
+    db = read_routing.session_for(request)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def run_db(db: DbSession, fn: Callable[..., T], *args, **kwargs) -> T:
+    """
+    fn(session, *args, **kwargs) 실행
+    AsyncSession이면 run_sync로 (동기 ORM 코드를 비동기 드라이버 위에서 실행), 아니면 스레드풀에서 실행
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
@@ -1,33 +1,35 @@
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
-from database import SessionLocal
+from api.db import get_sync_read_db
+from api.admission import admission
 from services.email_service import email_service
+from services.email_jobs import email_job_runner
 from scheduler.scheduler import email_scheduler
 from datetime import datetime, timedelta
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+@router.post("/email/send-weekly", status_code=202, dependencies=[Depends(admission("email"))])
+def send_weekly_email():
+    """주간 이메일 발송 작업을 등록합니다. 발송은 백그라운드에서 진행되며 작업 id로 진행 상황을 조회합니다."""
+    if not email_service.is_configured():
+        raise HTTPException(
+            status_code=400,
+            detail="이메일 설정이 완료되지 않았습니다. 환경 변수를 확인해주세요."
+        )
+    job = email_job_runner.submit_weekly()
+    return {"message": "주간 이메일 발송 작업이 등록되었습니다.", "success": True, **job}
 
-@router.post("/email/send-weekly")
-async def send_weekly_email(db: Session = Depends(get_db)):
-    """수동으로 주간 이메일을 발송합니다."""
-    try:
-        success = email_service.send_weekly_email()
-        if success:
-            return {"message": "주간 이메일 발송이 완료되었습니다.", "success": True}
-        else:
-            raise HTTPException(status_code=500, detail="이메일 발송에 실패했습니다.")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"이메일 발송 중 오류가 발생했습니다: {str(e)}")
+@router.get("/email/jobs/{job_id}")
+def get_email_job(job_id: str):
+    """메일 발송 작업의 상태와 진행 상황(성공/실패 건수)을 조회합니다."""
+    job = email_job_runner.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
 
 @router.get("/email/weekly-posts")
-async def get_weekly_posts(db: Session = Depends(get_db)):
+def get_weekly_posts(db: Session = Depends(get_sync_read_db)):
     """지난 주 게시글 목록을 조회합니다."""
     try:
         posts = email_service.get_weekly_posts(db)
@@ -82,44 +84,19 @@ async def get_email_status():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"상태 확인 중 오류가 발생했습니다: {str(e)}")
 
-@router.post("/email/test")
-async def test_email_config():
-    """이메일 설정을 테스트합니다."""
-    try:
-        if not all([
-            email_service.smtp_username,
-            email_service.smtp_password,
-            email_service.sender_email,
-            email_service.recipient_emails
-        ]):
-            raise HTTPException(
-                status_code=400, 
-                detail="이메일 설정이 완료되지 않았습니다. 환경 변수를 확인해주세요."
-            )
-        
-        # 간단한 테스트 이메일 발송
-        test_html = """
-        <html>
-        <body>
-            <h1>Tech Talk 이메일 설정 테스트</h1>
-            <p>이메일 발송이 정상적으로 설정되었습니다.</p>
-            <p>발송 시간: {}</p>
-        </body>
-        </html>
-        """.format(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        
-        for recipient in email_service.recipient_emails:
-            email_service._send_email(
-                recipient, 
-                test_html, 
-                "테스트", 
-                "테스트"
-            )
-        
-        return {
-            "message": "테스트 이메일이 발송되었습니다.",
-            "recipients": email_service.recipient_emails,
-            "success": True
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"테스트 이메일 발송 실패: {str(e)}") 
\ No newline at end of file
+@router.post("/email/test", status_code=202, dependencies=[Depends(admission("email"))])
+def test_email_config():
+    """이메일 설정을 테스트합니다. 테스트 메일은 백그라운드 작업으로 발송됩니다."""
+    if not email_service.is_configured():
+        raise HTTPException(
+            status_code=400, 
+            detail="이메일 설정이 완료되지 않았습니다. 환경 변수를 확인해주세요."
+        )
+    
+    job = email_job_runner.submit_test()
+    return {
+        "message": "테스트 이메일 발송 작업이 등록되었습니다.",
+        "recipients": email_service.recipient_emails,
+        "success": True,
+        **job
+    }
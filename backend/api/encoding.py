@@ -0,0 +1,32 @@
+import json
+from typing import Any
+
+from fastapi import Response
+
+# 응답 본문 전용 JSON 인코더 (모듈 로드 시 한 번만 생성)
+# - 라우터가 만드는 값은 dict/list/str/int/None뿐이므로 FastAPI의 jsonable_encoder 변환을 거치지 않음
+# - 순환 참조 검사 생략, 한글은 이스케이프하지 않고 UTF-8로 그대로 기록 (본문 크기 감소)
+_encoder = json.JSONEncoder(
+    ensure_ascii=False,
+    check_circular=False,
+    allow_nan=False,
+    separators=(",", ":"),
+)
+
+
+def encode_json(body: Any) -> bytes:
+    return _encoder.encode(body).encode("utf-8")
+
+
+class JSONBytesResponse(Response):
+    """
+    dict/list는 미리 만든 인코더로, bytes는 (캐시에 저장된 인코딩 결과) 그대로 본문에 기록
+    라우터에서 이 응답을 직접 반환하면 FastAPI의 응답 직렬화 단계를 건너뜀
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return encode_json(content)
@@ -1,34 +1,44 @@
-from fastapi import APIRouter, Body, HTTPException
-import os
-import httpx
-from bs4 import BeautifulSoup
-import openai
+from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from typing import Optional
+import re
+import json
 from dotenv import load_dotenv
+from services.analysis_cache import (
+    ANALYSIS_URL_CACHE_TTL,
+    analysis_cache,
+    analysis_flight,
+    make_cache_key,
+    make_url_cache_key,
+    normalize_url,
+)
+from services.openai_client import openai_gateway
+from services.page_fetcher import page_fetcher, PageFetchError
+from services.html_text_extractor import HtmlTextExtractor, ExtractedPage
+from services.post_classifier import post_classifier
+from api.admission import admission
 
 router = APIRouter()
 
 # 환경 변수 로드
 load_dotenv()
 
-@router.post("/analyze-url")
-async def analyze_url(url: str = Body(..., embed=True)):
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (compatible; TechTalkBot/1.0)'
-        }
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=10.0)
-            response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        for script in soup(["script", "style"]):
-            script.decompose()
-        text_content = soup.get_text()
-        lines = (line.strip() for line in text_content.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text_content = ' '.join(chunk for chunk in chunks if chunk)
-        if len(text_content) > 8000:
-            text_content = text_content[:8000]
-        prompt = f"""
+# 분석에 사용하는 본문 최대 글자 수
+URL_ANALYSIS_MAX_CHARS = 8000
+
+async def _fetch_page(url: str) -> ExtractedPage:
+    """
+    페이지를 받는 동시에 텍스트를 추출하고, 글자 수가 채워지면 다운로드 중단
+    """
+    extractor = HtmlTextExtractor(URL_ANALYSIS_MAX_CHARS)
+    await page_fetcher.fetch(url, on_chunk=extractor.feed_bytes)
+    return extractor.result()
+
+async def _request_url_analysis(url: str, text_content: str) -> Optional[dict]:
+    """
+    OpenAI로 title, summary, tags를 추출. JSON 파싱에 실패하면 None 반환
+    """
+    prompt = f"""
 아래 웹페이지의 내용을 분석해서 title, summary, tags를 뽑아주세요.
 
 - title: 웹페이지의 핵심 주제를 잘 나타내는 간결한 제목 (한국어)
@@ -58,61 +68,85 @@ async def analyze_url(url: str = Body(..., embed=True)):
 웹페이지 URL: {url}
 내용: {text_content}
 """
-        client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        response = client.chat.completions.create(
-            model="gpt-4.1",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "당신은 웹페이지 내용을 분석하고 요약하는 전문가입니다. 항상 JSON 형식으로 응답하세요."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            temperature=0.3,
-            max_tokens=500,
-        )
-        response_text = response.choices[0].message.content
-        print("\n[OpenAI 응답 원문]\n", response_text)
-        if not response_text:
-            raise HTTPException(status_code=500, detail="OpenAI 응답이 비어 있습니다.")
-        import re
-        def fix_json_newlines(s: str) -> str:
-            return re.sub(r'("[^"]*")', lambda m: m.group(0).replace('\n', '\\n'), s)
-        cleaned = response_text.strip()
-        if cleaned.startswith("```"):
-            cleaned = re.sub(r"^```[a-zA-Z]*\n?", "", cleaned)
-            cleaned = re.sub(r"```$", "", cleaned)
-        cleaned = fix_json_newlines(cleaned)
-        print("\n[cleaned]\n", cleaned)
-        import json
-        try:
-            analysis = json.loads(cleaned)
-            print("[파싱된 분석 결과]", analysis)
-            return {
-                "url": url,
-                "title": analysis.get("title", "제목 추출 실패"),
-                "summary": analysis.get("summary", "요약을 생성할 수 없습니다."),
-                "tags": analysis.get("tags", [])
+    response_text = await openai_gateway.chat(
+        model="gpt-4.1",
+        messages=[
+            {
+                "role": "system",
+                "content": "당신은 웹페이지 내용을 분석하고 요약하는 전문가입니다. 항상 JSON 형식으로 응답하세요."
+            },
+            {
+                "role": "user",
+                "content": prompt
             }
-        except json.JSONDecodeError:
-            print("[JSON 파싱 실패!] 원문:\n", response_text)
+        ],
+        temperature=0.3,
+        max_tokens=500,
+    )
+    print("\n[OpenAI 응답 원문]\n", response_text)
+    if not response_text:
+        raise HTTPException(status_code=500, detail="OpenAI 응답이 비어 있습니다.")
+    def fix_json_newlines(s: str) -> str:
+        return re.sub(r'("[^"]*")', lambda m: m.group(0).replace('\n', '\\n'), s)
+    cleaned = response_text.strip()
+    if cleaned.startswith("```"):
+        cleaned = re.sub(r"^```[a-zA-Z]*\n?", "", cleaned)
+        cleaned = re.sub(r"```$", "", cleaned)
+    cleaned = fix_json_newlines(cleaned)
+    print("\n[cleaned]\n", cleaned)
+    try:
+        analysis = json.loads(cleaned)
+        print("[파싱된 분석 결과]", analysis)
+        return {
+            "title": analysis.get("title", "제목 추출 실패"),
+            "summary": analysis.get("summary", "요약을 생성할 수 없습니다."),
+            "tags": analysis.get("tags", [])
+        }
+    except json.JSONDecodeError:
+        print("[JSON 파싱 실패!] 원문:\n", response_text)
+        return None
+
+async def _analyze_url(url: str) -> dict:
+    # 최근에 분석한 URL이면 페이지를 다시 받지 않고 바로 반환
+    url_cache_key = make_url_cache_key(url)
+    cached = await run_in_threadpool(analysis_cache.get, url_cache_key)
+    if cached is not None:
+        return {"url": url, **cached}
+
+    page = await _fetch_page(url)
+    text_content = page.text
+    # 같은 URL + 같은 본문이면 캐시된 분석 결과 재사용
+    cache_key = make_cache_key(url, text_content)
+    analysis = await run_in_threadpool(analysis_cache.get, cache_key)
+    if analysis is None:
+        analysis = await _request_url_analysis(url, text_content)
+        if analysis is None:
             return {
                 "url": url,
                 "title": "제목 추출 실패",
                 "summary": "요약을 생성할 수 없습니다.",
-                "tags": []
+                "tags": [],
+                "thumbnailUrl": page.image,
             }
+        await run_in_threadpool(analysis_cache.put, cache_key, url, analysis)
+    result = {**analysis, "thumbnailUrl": page.image}
+    await run_in_threadpool(analysis_cache.put, url_cache_key, url, result, ANALYSIS_URL_CACHE_TTL)
+    return {"url": url, **result}
+
+@router.post("/analyze-url", dependencies=[Depends(admission("analyze"))])
+async def analyze_url(url: str = Body(..., embed=True)):
+    try:
+        # 같은 URL에 대한 동시 요청은 하나의 분석으로 합침 (결과는 공유하므로 url은 요청마다 다시 지정)
+        result = await analysis_flight.do(normalize_url(url), lambda: _analyze_url(url))
+        return {**result, "url": url}
+    except HTTPException:
+        raise
+    except PageFetchError as e:
+        raise HTTPException(status_code=400, detail=f"URL 분석 실패: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"URL 분석 실패: {str(e)}")
 
-@router.post("/analyze-post")
-async def analyze_post(content: str = Body(..., embed=True)):
-    """
-    글 내용이 기술 관련 글인지 OpenAI로 판단. 'true'면 True, 그 외는 모두 400 반환
-    """
+async def _classify_with_model(content: str) -> bool:
     prompt = f"""
 아래 글이 IT, 소프트웨어, 하드웨어, 프로그래밍, 컴퓨터, 인터넷, 기술 트렌드 등 기술과 직접적으로 관련된 내용인지 판단하세요.
 
@@ -126,11 +160,8 @@ async def analyze_post(content: str = Body(..., embed=True)):
 
 글: {content}
 """
-    import openai
-    import os
     try:
-        client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        response = client.chat.completions.create(
+        content_raw = await openai_gateway.chat(
             model="gpt-3.5-turbo",
             messages=[
                 {"role": "system", "content": "당신은 기술 관련 글을 분류하는 전문가입니다. 반드시 'true' 또는 'false'로만 답하세요."},
@@ -139,15 +170,31 @@ async def analyze_post(content: str = Body(..., embed=True)):
             temperature=0,
             max_tokens=5,
         )
-        content_raw = response.choices[0].message.content
         if not content_raw:
             raise HTTPException(status_code=500, detail="OpenAI 응답이 비어 있습니다.")
         result = content_raw.strip().lower().replace('\n', '').replace('"', '').replace("'", "")
         print(f"[기술 관련 글 여부] GPT 응답: {result}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"OpenAI 판별 실패: {str(e)}")
+    return result == "true"
 
-    if result == "true":
+@router.post("/analyze-post", dependencies=[Depends(admission("analyze"))])
+async def analyze_post(content: str = Body(..., embed=True)):
+    """
+    글 내용이 기술 관련 글인지 판단. 'true'면 True, 그 외는 모두 400 반환
+    같은 내용의 재제출과 명백한 경우(욕설/도배, 광고 신호 없이 기술 키워드 다수)는 모델을 호출하지 않음
+    """
+    key, is_tech = post_classifier.classify_locally(content)
+    if is_tech is None:
+        is_tech = await _classify_with_model(content)
+        post_classifier.record_model_decision(key, is_tech)
+
+    if is_tech:
         return {"is_tech": True}
     else:
-        raise HTTPException(status_code=400, detail="기술 관련 글이 아닙니다.") 
\ No newline at end of file
+        raise HTTPException(status_code=400, detail="기술 관련 글이 아닙니다.")
+
+@router.get("/analyze-post/stats")
+def get_analyze_post_stats():
+    """판별 단계별(메모/사전 판별/모델) 결정 횟수"""
+    return post_classifier.stats() 
\ No newline at end of file
@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import Optional, Tuple
+
+from fastapi import HTTPException
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """
+    (created_at, id) 쌍을 "<created_at ISO>,<id>" 형식의 커서 문자열로 변환
+    """
+    return f"{created_at.isoformat()},{row_id}"
+
+
+def parse_cursor(cursor: str) -> Optional[Tuple[datetime, int]]:
+    """
+    커서 문자열을 (created_at, id)로 변환
+    빈 문자열은 첫 페이지를 의미하므로 None 반환, 형식이 잘못되면 400
+    """
+    if not cursor:
+        return None
+    try:
+        created_at_str, id_str = cursor.rsplit(",", 1)
+        return datetime.fromisoformat(created_at_str), int(id_str)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서 형식입니다.")
+
+
+def encode_rank_cursor(score: int, row_id: int) -> str:
+    """
+    검색 결과처럼 (점수, id) 순으로 정렬된 목록의 커서 문자열 "<score>,<id>"
+    """
+    return f"{score},{row_id}"
+
+
+def parse_rank_cursor(cursor: str) -> Optional[Tuple[int, int]]:
+    if not cursor:
+        return None
+    try:
+        score_str, id_str = cursor.split(",", 1)
+        return int(score_str), int(id_str)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서 형식입니다.")
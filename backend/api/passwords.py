@@ -0,0 +1,43 @@
+import os
+from typing import Optional
+
+from fastapi import HTTPException
+
+from services.edit_token import verify_edit_token
+from services.password_hasher import HashingOverloadedError, password_hasher
+
+# true면 게시글 수정/삭제 시 X-Edit-Token 헤더가 반드시 필요
+REQUIRE_EDIT_TOKEN = os.getenv("REQUIRE_EDIT_TOKEN", "false").lower() == "true"
+
+
+def _overloaded() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="요청이 많아 잠시 후 다시 시도해주세요.",
+        headers={"Retry-After": "1"},
+    )
+
+
+# 비동기 라우터용 (해싱 전용 스레드 풀 결과를 await, 이벤트 루프를 막지 않음)
+async def hash_password_async(password: str) -> str:
+    try:
+        return await password_hasher.hash_async(password)
+    except HashingOverloadedError:
+        raise _overloaded()
+
+
+async def check_password_async(password: str, password_hash: str) -> bool:
+    try:
+        return await password_hasher.verify_async(password, password_hash)
+    except HashingOverloadedError:
+        raise _overloaded()
+
+
+def require_edit_token(post_id: int, edit_token: Optional[str]):
+    """
+    verify-password에서 발급한 수정 토큰 확인 (bcrypt 재검증 없이 수정/삭제 허용)
+    """
+    if edit_token is None and not REQUIRE_EDIT_TOKEN:
+        return
+    if not edit_token or not verify_edit_token(edit_token, post_id):
+        raise HTTPException(status_code=403, detail="수정 권한이 없거나 토큰이 만료되었습니다.")
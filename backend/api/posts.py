@@ -1,179 +1,248 @@
-from fastapi import APIRouter, Depends, HTTPException, Body, Query
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Body, Query, Header, Request, Response
+from sqlalchemy.orm import Session
 from models.post import Post
 from models.comment import Comment
-from database import SessionLocal
 from dto.post import PostCreate, PostUpdate
-import bcrypt
-from sqlalchemy import func
+from api.pagination import encode_cursor, parse_cursor
+from api.encoding import JSONBytesResponse, encode_json
+from api.comments import serialize_comment
+from api.db import DbSession, get_db, get_read_db, run_db
+from api.passwords import hash_password_async, check_password_async, require_edit_token
+from api.admission import admission
+from services.view_counter import view_counter
+from services.read_routing import read_routing
+from services.edit_token import issue_edit_token, EDIT_TOKEN_TTL
+from services.confluence_service import enqueue_confluence_event
+from services.weekly_digest import weekly_digest_store
+from services.search_index import search_index
+from services.tag_index import tag_index
+from services.response_cache import response_cache, CachedResponse, POST_LIST_TAG, post_tag, etag_matches
+from sqlalchemy import func, or_, and_
+from typing import List, Optional
+import time
 import os
-import requests
-from requests.auth import HTTPBasicAuth
 from dotenv import load_dotenv
-import re
-import html
-import json
 
 # 환경 변수 로드
 load_dotenv()
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# 전체 게시글 수 캐시 (COUNT(*)는 테이블 크기에 비례하므로 짧게 캐싱)
+POST_TOTAL_CACHE_TTL = int(os.getenv("POST_TOTAL_CACHE_TTL", "30"))
+_post_total_cache = {"value": None, "expires_at": 0.0}
+# 목록 excerpt 보기에서 내려줄 본문 앞부분 길이 (DB에서 잘라서 전송량도 줄임)
+POST_EXCERPT_CHARS = int(os.getenv("POST_EXCERPT_CHARS", "200"))
 
-def auto_link_urls(text: str) -> str:
+def get_post_total(db: Session) -> int:
     """
-    본문 내 http/https로 시작하는 URL을 <a href="...">...</a>로 변환
-    href 속성의 URL 내 & 등 특수문자는 html.escape로 이스케이프
-    텍스트(보여지는 부분) 내 & 등도 html.escape로 이스케이프
+    전체 게시글 수를 반환 (POST_TOTAL_CACHE_TTL초 동안 캐싱)
     """
-    url_pattern = re.compile(r"(https?://[\w\-._~:/?#\[\]@!$&'()*+,;=%]+)")
-    def escape_url(match):
-        url = match.group(1)
-        safe_url = html.escape(url, quote=True)  # href용
-        safe_text = html.escape(url)             # 텍스트 노드용 (&, <, >)
-        return f'<a href="{safe_url}">{safe_text}</a>'
-    return url_pattern.sub(escape_url, text)
+    now = time.monotonic()
+    if _post_total_cache["value"] is None or now >= _post_total_cache["expires_at"]:
+        _post_total_cache["value"] = db.query(func.count(Post.id)).scalar()
+        _post_total_cache["expires_at"] = now + POST_TOTAL_CACHE_TTL
+    return _post_total_cache["value"]
 
-def text_to_html_paragraphs(text: str) -> str:
+def invalidate_post_total():
+    _post_total_cache["value"] = None
+
+def cached_response(request: Request, entry: CachedResponse, body=None):
     """
-    두 줄 이상 줄바꿈은 <p>문단</p>, 한 줄 줄바꿈은 <br/>로 변환
-    연속 줄바꿈(빈 줄)도 <p><br/></p>로 보존
-    URL은 자동으로 <a href>로 변환
+    캐시 항목의 ETag가 If-None-Match와 같으면 본문 없이 304, 아니면 ETag와 함께 본문 반환
+    body를 따로 주지 않으면 캐시 항목에 저장된 인코딩 결과(bytes)를 그대로 사용
     """
-    text = auto_link_urls(text)
-    # 문단 분리 (두 줄 이상 줄바꿈 기준, 구분자도 보존)
-    paragraphs = re.split(r'(\n{2,})', text)
-    html_paragraphs = []
-    for para in paragraphs:
-        if para.startswith('\n'):
-            # 연속 줄바꿈(빈 줄)은 개수만큼 <p><br/></p> 추가
-            count = para.count('\n') // 2  # 두 줄마다 한 번
-            html_paragraphs.extend(['<p><br/></p>'] * count)
-        elif para.strip() == '':
-            continue  # 완전 빈 문자열은 무시
-        else:
-            html_paragraphs.append('<p>' + para.replace('\n', '<br/>') + '</p>')
-    return ''.join(html_paragraphs)
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        response_cache.record_not_modified()
+        return Response(status_code=304, headers=headers)
+    if body is not None:
+        return JSONBytesResponse(body, headers=headers)
+    if entry.encoded is None:
+        entry.encoded = encode_json(entry.body)
+    return JSONBytesResponse(entry.encoded, headers=headers)
 
-def make_tag_html(tags):
-    if not tags:
-        return ''
-    tag_str = ' '.join(f'#{tag}' for tag in tags)
+def post_summary_columns(view: str = "full"):
+    """
+    목록 응답에 필요한 컬럼만 조회 (password_hash 등 제외)
+    excerpt 보기는 본문 앞부분(POST_EXCERPT_CHARS + 1자)만 DB에서 잘라서 가져옴
+    """
+    if view == "excerpt":
+        content = func.substr(Post.content, 1, POST_EXCERPT_CHARS + 1).label("content")
+    else:
+        content = Post.content
     return (
-        '<br/><br/>'  # 본문과 태그 사이 두 줄 띄우기
-        '<div style="color: #888; font-size: 0.95em; margin-top: 16px; '
-        'border-top: 1px solid #eee; padding-top: 8px;">'
-        f'{tag_str}</div>'
+        Post.id, Post.title, content, Post.created_at, Post.views,
+        Post.tags, Post.url, Post.thumbnail_url, Post.comment_count,
     )
 
-def post_to_confluence_blog(title: str, content: str, tags=None):
-    url = os.getenv("CONFLUENCE_BLOG_API_URL")
-    email = os.getenv("CONFLUENCE_EMAIL")
-    api_token = os.getenv("CONFLUENCE_API_TOKEN")
-    space_key = os.getenv("CONFLUENCE_SPACE_KEY")
-    if not all([url, email, api_token, space_key]):
-        print("[Confluence] 환경변수 누락: URL, EMAIL, API_TOKEN, SPACE_KEY를 모두 설정하세요.")
-        return
-    url = str(url)
-    email = str(email)
-    api_token = str(api_token)
-    space_key = str(space_key)
-    auth = HTTPBasicAuth(email, api_token)
-    headers = {
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-    html_content = text_to_html_paragraphs(content)
-    if tags:
-        html_content += make_tag_html(tags)
-    payload = {
-        "type": "blogpost",
+def make_excerpt(content: str) -> str:
+    text = " ".join(content.split())
+    if len(content) > POST_EXCERPT_CHARS:
+        return text[:POST_EXCERPT_CHARS].rstrip() + "..."
+    return text
+
+def serialize_post_summary(row, view: str = "full") -> dict:
+    """post_summary_columns()로 조회한 행 → 목록 응답 항목"""
+    post_id, title, content, created_at, views, tags, url, thumbnail_url, comment_count = row
+    return {
+        "id": post_id,
         "title": title,
-        "space": {"key": space_key},
-        "body": {
-            "storage": {
-                "value": html_content,  # HTML 변환된 본문 + 태그
-                "representation": "storage"
-            }
-        }
+        "content": make_excerpt(content) if view == "excerpt" else content,
+        "createdAt": created_at.isoformat() + 'Z',
+        "views": views,
+        "tags": tags,
+        "url": url,
+        "thumbnailUrl": thumbnail_url,
+        "commentCount": comment_count,
     }
-    print("[Confluence] 전체 payload 미리보기:")
-    print(json.dumps(payload, ensure_ascii=False, indent=2))
-    try:
-        response = requests.post(url, headers=headers, json=payload, auth=auth, timeout=10)
-        if not response.ok:
-            print(f"[Confluence] 업로드 실패: {response.status_code} {response.text}")
-        else:
-            print(f"[Confluence] 블로그 포스트 업로드 성공: {title}")
-    except Exception as e:
-        print(f"[Confluence] 예외 발생: {e}")
 
 # 게시글 목록 조회 API (페이징 지원)
+# - offset 모드: ?offset=&limit= (기존 방식, total 포함)
+# - cursor 모드: ?cursor=<created_at,id>&limit= (첫 페이지는 ?cursor=)
+#   COUNT 없이 다음 페이지로 바로 이동하며, total은 with_total=true일 때만 계산
+# - 태그 필터: ?tag=A&tag=B&tag_mode=or|and (항상 cursor 모드, 태그 색인만 조회)
+# - ?view=excerpt: 본문 대신 앞부분 POST_EXCERPT_CHARS자만 반환 (기본값 full)
+# 라우터는 async def, DB 작업은 동기 Session을 받는 함수로 작성해 run_db로 실행 (api/db.py 참고)
 @router.get("/posts")
-def read_posts(
-    db: Session = Depends(get_db),
+async def read_posts(
+    request: Request,
+    db: DbSession = Depends(get_read_db),
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    with_total: bool = Query(False),
+    tag: Optional[List[str]] = Query(None),
+    tag_mode: str = Query("or", pattern="^(and|or)$"),
+    view: str = Query("full", pattern="^(full|excerpt)$"),
 ):
-    total = db.query(Post).count()
-    posts_with_count = (
-        db.query(
-            Post,
-            func.count(Comment.id).label("comment_count")
-        )
-        .outerjoin(Comment, Comment.post_id == Post.id)
-        .group_by(Post.id)
-        .order_by(Post.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
-    )
-    posts = [
-        {
-            "id": post.id,
-            "title": post.title,
-            "content": post.content,
-            "createdAt": post.created_at.isoformat() + 'Z',
-            "views": post.views,
-            "tags": post.tags,
-            "url": post.url,
-            "thumbnailUrl": post.thumbnail_url,
-            "commentCount": comment_count,
+    key = ("posts", offset, limit, cursor, with_total, tuple(tag or ()), tag_mode, view)
+    entry = response_cache.get(key)
+    if entry is None:
+        generation = response_cache.generation()
+        if tag:
+            body = await run_db(db, read_posts_by_tag, tag, tag_mode, limit, cursor, with_total, view)
+        else:
+            body = await run_db(db, read_posts_page, offset, limit, cursor, with_total, view)
+        tags = [POST_LIST_TAG] + [post_tag(post["id"]) for post in body["posts"]]
+        entry = response_cache.put(key, body, tags, generation, settle_seconds=read_routing.lag_window(db))
+    return cached_response(request, entry)
+
+def read_posts_page(
+    db: Session, offset: int, limit: int, cursor: Optional[str], with_total: bool, view: str = "full"
+):
+    query = db.query(*post_summary_columns(view)).order_by(Post.created_at.desc(), Post.id.desc())
+    if cursor is not None:
+        position = parse_cursor(cursor)
+        if position:
+            cursor_created_at, cursor_id = position
+            query = query.filter(
+                or_(
+                    Post.created_at < cursor_created_at,
+                    and_(Post.created_at == cursor_created_at, Post.id < cursor_id),
+                )
+            )
+    else:
+        query = query.offset(offset)
+    # 다음 페이지 존재 여부는 limit + 1개를 조회해서 판단
+    rows = query.limit(limit + 1).all()
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
+    posts = [serialize_post_summary(row, view) for row in rows]
+
+    if cursor is not None:
+        last_post = rows[-1] if rows else None
+        result = {
+            "posts": posts,
+            "has_next": has_next,
+            "next_cursor": encode_cursor(last_post.created_at, last_post.id) if has_next else None,
         }
-        for post, comment_count in posts_with_count
-    ]
-    has_next = offset + limit < total
+        if with_total:
+            result["total"] = get_post_total(db)
+        return result
+
     return {
         "posts": posts,
         "has_next": has_next,
-        "total": total
+        "total": get_post_total(db)
+    }
+
+def read_posts_by_tag(
+    db: Session, tags: List[str], tag_mode: str, limit: int, cursor: Optional[str], with_total: bool, view: str = "full"
+):
+    """
+    태그 색인(post_tag)에서 최신순 id를 구한 뒤 해당 게시글만 PK로 조회
+    with_total은 태그 하나일 때만 tag.post_count로 제공
+    """
+    entries = tag_index.list_posts(db, tags, tag_mode, limit + 1, parse_cursor(cursor or ""))
+    has_next = len(entries) > limit
+    entries = entries[:limit]
+
+    by_id = {}
+    if entries:
+        by_id = {
+            row.id: row
+            for row in db.query(*post_summary_columns(view)).filter(Post.id.in_([post_id for _, post_id in entries]))
+        }
+
+    result = {
+        "posts": [serialize_post_summary(by_id[post_id], view) for _, post_id in entries if post_id in by_id],
+        "has_next": has_next,
+        "next_cursor": encode_cursor(*entries[-1]) if has_next else None,
     }
+    if with_total and len(tags) == 1:
+        found = tag_index.find_tags(db, tags)
+        result["total"] = found[0][1] if found else 0
+    return result
 
 # 게시글 단일 조회 API
+# 댓글은 comments_limit개까지만 조회하고, 댓글 수는 post.comment_count를 사용 (쿼리 2회 고정)
+# 응답은 캐시하며, 캐시 적중 시 DB를 읽지 않고 조회수만 메모리 누적값으로 보정
 @router.get("/posts/{post_id}")
-def read_post(post_id: int, db: Session = Depends(get_db)):
-    post = db.query(Post).options(joinedload(Post.comments)).filter(Post.id == post_id).first()
+async def read_post(
+    post_id: int,
+    request: Request,
+    comments_limit: int = Query(10, ge=0, le=100),
+    db: DbSession = Depends(get_read_db),
+):
+    key = ("post", post_id, comments_limit)
+    entry = response_cache.get(key)
+    if entry is not None:
+        view_counter.increment(post_id)
+        # 캐싱 이후 이 프로세스에서 늘어난 조회수를 더함 (extra = 캐싱 시점 조회수 - 누적 조회수)
+        views = entry.extra + view_counter.total(post_id)
+        return cached_response(request, entry, {**entry.body, "views": views})
+
+    generation = response_cache.generation()
+    post, comments = await run_db(db, load_post, post_id, comments_limit)
+    # 조회수는 메모리에 누적 후 스케줄러가 일괄 반영 (응답에는 미반영분까지 포함)
+    views = post.views + view_counter.increment(post.id)
+
+    body = serialize_post_summary(post)
+    body["views"] = views
+    body["comments"] = [serialize_comment(comment) for comment in comments]
+    entry = response_cache.put(
+        key, body, [post_tag(post.id)], generation, extra=views - view_counter.total(post.id),
+        settle_seconds=read_routing.lag_window(db),
+    )
+    return cached_response(request, entry)
+
+def load_post(db: Session, post_id: int, comments_limit: int):
+    """게시글 조회 행과 앞쪽 댓글 comments_limit개"""
+    post = db.query(*post_summary_columns()).filter(Post.id == post_id).first()
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
-    post.views += 1
-    db.commit()
-    db.refresh(post)
-    
-    # 댓글 10개만 페이징해서 가져오기 및 댓글 카운트
     comments = (
-        db.query(Comment)
+        db.query(Comment.id, Comment.post_id, Comment.content, Comment.created_at)
         .filter(Comment.post_id == post.id)
-        .order_by(Comment.created_at.asc())
-        .limit(10)
+        .order_by(Comment.created_at.asc(), Comment.id.asc())
+        .limit(comments_limit)
         .all()
-    )
-    comment_count = db.query(Comment).filter(Comment.post_id == post.id).count()
+    ) if comments_limit else []
+    return post, comments
+
+def serialize_post(post: Post) -> dict:
     return {
         "id": post.id,
         "title": post.title,
@@ -183,22 +252,18 @@ def read_post(post_id: int, db: Session = Depends(get_db)):
         "tags": post.tags,
         "url": post.url,
         "thumbnailUrl": post.thumbnail_url,
-        "commentCount": comment_count,
-        "comments": [
-            {
-                "id": comment.id,
-                "postId": comment.post_id,
-                "content": comment.content,
-                "createdAt": comment.created_at.isoformat() + 'Z',
-            }
-            for comment in comments
-        ],
     }
 
-# 게시글 생성 API에서 post_to_confluence_blog를 호출하도록 변경
-@router.post("/posts")
-def create_post(post: PostCreate, db: Session = Depends(get_db)):
-    password_hash = bcrypt.hashpw(post.password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+# 게시글 생성 API (Confluence 복제는 아웃박스에 기록 후 백그라운드에서 처리)
+@router.post("/posts", dependencies=[Depends(admission("password"))])
+async def create_post(post: PostCreate, db: DbSession = Depends(get_db)):
+    password_hash = await hash_password_async(post.password)
+    body = await run_db(db, insert_post, post, password_hash)
+    invalidate_post_total()
+    response_cache.invalidate(POST_LIST_TAG)
+    return body
+
+def insert_post(db: Session, post: PostCreate, password_hash: str) -> dict:
     new_post = Post(
         title=post.title,
         content=post.content,
@@ -208,63 +273,93 @@ def create_post(post: PostCreate, db: Session = Depends(get_db)):
         password_hash=password_hash,
     )
     db.add(new_post)
+    db.flush()
+    # Confluence 블로그 포스트로 복제 (게시글과 같은 트랜잭션)
+    enqueue_confluence_event(db, new_post.id, "create", new_post.title, new_post.content, new_post.tags)
+    tag_index.sync_post(db, new_post.id, new_post.created_at, new_post.tags)
+    search_index.index_post_change(db, new_post.id, None, (new_post.title, new_post.content, new_post.tags))
     db.commit()
     db.refresh(new_post)
-
-    # Confluence 블로그 포스트로 복제
-    post_to_confluence_blog(new_post.title, new_post.content, new_post.tags)
-
-    return {
-        "id": new_post.id,
-        "title": new_post.title,
-        "content": new_post.content,
-        "createdAt": new_post.created_at.isoformat() + 'Z',
-        "views": new_post.views,
-        "tags": new_post.tags,
-        "url": new_post.url,
-        "thumbnailUrl": new_post.thumbnail_url,
-    }
+    weekly_digest_store.mark_changed(db, new_post.created_at)
+    return serialize_post(new_post)
 
 # 게시글 수정 API
 @router.put("/posts/{post_id}")
-def update_post(post_id: int, post_update: PostUpdate, db: Session = Depends(get_db)):
-    post = db.query(Post).filter(Post.id == post_id).first()
+async def update_post(
+    post_id: int,
+    post_update: PostUpdate,
+    edit_token: Optional[str] = Header(None, alias="X-Edit-Token"),
+    db: DbSession = Depends(get_db),
+):
+    require_edit_token(post_id, edit_token)
+    body, tags_changed = await run_db(db, apply_post_update, post_id, post_update)
+    # 태그가 바뀌면 태그별 목록에 새로 포함될 수 있으므로 목록 전체 무효화
+    response_cache.invalidate(post_tag(post_id), *([POST_LIST_TAG] if tags_changed else []))
+    return body
+
+def apply_post_update(db: Session, post_id: int, post_update: PostUpdate):
+    """게시글 수정 후 (응답, 태그 변경 여부) 반환"""
+    # 동시에 같은 게시글을 수정해도 색인에서 빼는 내용(before)이 최신이 되도록 먼저 잠근 뒤 읽음
+    post = db.query(Post).filter(Post.id == post_id).with_for_update().first()
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
+    tags_changed = post.tags != post_update.tags
+    before = (post.title, post.content, post.tags)
     post.title = post_update.title
     post.content = post_update.content
     post.tags = post_update.tags
     post.url = post_update.url
     post.thumbnail_url = post_update.thumbnailUrl
+    enqueue_confluence_event(db, post.id, "update", post.title, post.content, post.tags)
+    tag_index.sync_post(db, post.id, post.created_at, post.tags)
+    search_index.index_post_change(db, post.id, before, (post.title, post.content, post.tags))
     db.commit()
     db.refresh(post)
-    return {
-        "id": post.id,
-        "title": post.title,
-        "content": post.content,
-        "createdAt": post.created_at.isoformat() + 'Z',
-        "views": post.views,
-        "tags": post.tags,
-        "url": post.url,
-        "thumbnailUrl": post.thumbnail_url,
-    }
+    weekly_digest_store.mark_changed(db, post.created_at)
+    return serialize_post(post), tags_changed
 
 # 게시글 삭제 API
 @router.delete("/posts/{post_id}")
-def delete_post(post_id: int, db: Session = Depends(get_db)):
+async def delete_post(
+    post_id: int,
+    edit_token: Optional[str] = Header(None, alias="X-Edit-Token"),
+    db: DbSession = Depends(get_db),
+):
+    require_edit_token(post_id, edit_token)
+    await run_db(db, delete_post_record, post_id)
+    view_counter.discard(post_id)
+    invalidate_post_total()
+    response_cache.invalidate(POST_LIST_TAG, post_tag(post_id))
+    return {"ok": True}
+
+def delete_post_record(db: Session, post_id: int):
     post = db.query(Post).filter(Post.id == post_id).first()
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
+    created_at = post.created_at
     db.delete(post)
+    enqueue_confluence_event(db, post_id, "delete")
+    tag_index.remove_post(db, post_id)
+    search_index.remove_post(db, post_id)
     db.commit()
-    return {"ok": True}
+    weekly_digest_store.mark_changed(db, created_at)
 
-# 게시글 비밀번호 검증 API
-@router.post("/posts/{post_id}/verify-password")
-def verify_post_password(post_id: int, password: str = Body(..., embed=True), db: Session = Depends(get_db)):
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
+def find_password_hash(db: Session, post_id: int) -> str:
+    password_hash = db.query(Post.password_hash).filter(Post.id == post_id).scalar()
+    if password_hash is None:
         raise HTTPException(status_code=404, detail="Post not found")
-    if not bcrypt.checkpw(password.encode("utf-8"), post.password_hash.encode("utf-8")):
+    return password_hash
+
+# 게시글 비밀번호 검증 API
+@router.post("/posts/{post_id}/verify-password", dependencies=[Depends(admission("password"))])
+async def verify_post_password(post_id: int, password: str = Body(..., embed=True), db: DbSession = Depends(get_db)):
+    password_hash = await run_db(db, find_password_hash, post_id)
+    if not await check_password_async(password, password_hash):
         raise HTTPException(status_code=403, detail="비밀번호가 일치하지 않습니다.")
-    return {"ok": True} 
\ No newline at end of file
+    # 이후 PUT/DELETE 요청은 X-Edit-Token 헤더로 이 토큰을 보내면 bcrypt 재검증 없이 처리
+    return {"ok": True, "editToken": issue_edit_token(post_id), "expiresIn": EDIT_TOKEN_TTL} 
+
+# 게시글 응답 캐시 적중/실패 통계
+@router.get("/cache/stats")
+async def read_cache_stats():
+    return response_cache.stats()
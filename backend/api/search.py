@@ -0,0 +1,61 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from models.post import Post
+from api.db import get_sync_read_db
+from api.pagination import encode_rank_cursor, parse_rank_cursor
+from api.encoding import JSONBytesResponse
+from services.search_index import search_index, query_terms, make_snippet
+
+router = APIRouter()
+
+# 게시글 검색 API (제목/본문/태그/댓글)
+# - 모든 검색어 토큰을 포함하는 게시글을 점수 순으로 반환
+# - ?cursor=<score,id>로 다음 페이지 조회 (첫 페이지는 cursor 생략)
+@router.get("/search")
+def search_posts(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = Query(None),
+    db: Session = Depends(get_sync_read_db),
+):
+    terms = query_terms(q)
+    rows = search_index.search(db, terms, limit + 1, parse_rank_cursor(cursor))
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
+    posts = {}
+    if rows:
+        posts = {
+            post.id: post
+            for post in db.query(
+                Post.id, Post.title, Post.content, Post.created_at, Post.tags,
+                Post.url, Post.thumbnail_url, Post.views, Post.comment_count,
+            ).filter(Post.id.in_([post_id for post_id, _ in rows]))
+        }
+
+    results = []
+    for post_id, score in rows:
+        post = posts.get(post_id)
+        if post is None:
+            continue
+        results.append({
+            "id": post.id,
+            "title": post.title,
+            "snippet": make_snippet(post.content, terms),
+            "createdAt": post.created_at.isoformat() + 'Z',
+            "views": post.views,
+            "tags": post.tags,
+            "url": post.url,
+            "thumbnailUrl": post.thumbnail_url,
+            "commentCount": post.comment_count,
+            "score": score,
+        })
+
+    last = rows[-1] if rows else None
+    return JSONBytesResponse({
+        "query": q,
+        "results": results,
+        "has_next": has_next,
+        "next_cursor": encode_rank_cursor(last[1], last[0]) if has_next else None,
+    })
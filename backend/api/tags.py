@@ -0,0 +1,13 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from api.db import get_sync_read_db
+from api.encoding import JSONBytesResponse
+from services.tag_index import tag_index
+
+router = APIRouter()
+
+# 태그 목록 API (게시글 수 많은 순)
+# 태그별 게시글 수는 게시글 작성/수정/삭제 시 갱신되므로 게시글 테이블을 읽지 않음
+@router.get("/tags")
+def read_tags(limit: int = Query(100, ge=1, le=500), db: Session = Depends(get_sync_read_db)):
+    return JSONBytesResponse({"tags": tag_index.counts(db, limit)})
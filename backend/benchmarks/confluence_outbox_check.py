@@ -0,0 +1,90 @@
+"""
+Confluence 아웃박스를 로컬 Confluence 대역 서버로 확인합니다.
+
+사용법 (backend 디렉터리에서 실행):
+    python -m benchmarks.confluence_outbox_check [--latency 0.5] [--posts 5]
+
+게시글 생성/수정/삭제 API 응답이 Confluence 지연과 무관한지,
+아웃박스 처리(재시도, 생성 응답 유실 포함) 후 대역 서버 상태가 게시글과 일치하는지 확인합니다.
+제목이 같은 게시글 두 개가 각자의 포스트에 매핑되는지도 확인합니다. 불일치하면 exit 1.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.fake_servers import FakeConfluenceServer
+
+
+def run(fake: FakeConfluenceServer, posts: int, latency: float) -> int:
+    from fastapi.testclient import TestClient
+    from database import SessionLocal, engine
+    from models.base import Base
+    from models.confluence import ConfluenceOutbox, ConfluencePage
+    from main import app
+    import services.confluence_service as confluence_service
+
+    engine.echo = False
+    Base.metadata.create_all(bind=engine)
+    # 재시도가 바로 일어나도록 백오프 제거
+    confluence_service.CONFLUENCE_BACKOFF_BASE = 0
+    worker = confluence_service.confluence_outbox_worker
+
+    client = TestClient(app)
+    started = time.perf_counter()
+    post_ids = []
+    for i in range(posts):
+        response = client.post("/posts", json={"title": f"아웃박스 {i}", "content": "본문", "tags": ["t"], "password": "pw"})
+        post_ids.append(response.json()["id"])
+    for _ in range(2):
+        client.post("/posts", json={"title": "같은 제목", "content": "본문", "tags": [], "password": "pw"})
+    client.put(f"/posts/{post_ids[0]}", json={"title": "수정됨", "content": "수정 본문", "tags": []})
+    client.delete(f"/posts/{post_ids[-1]}")
+    write_elapsed = time.perf_counter() - started
+
+    for _ in range(5):
+        worker.drain()
+
+    db = SessionLocal()
+    statuses = [status for (status,) in db.query(ConfluenceOutbox.status)]
+    # 매핑된 포스트마다 해당 게시글의 라벨이 붙어 있어야 함
+    mismatched = [
+        page.post_id
+        for page in db.query(ConfluencePage)
+        if worker.client.post_label(page.post_id) not in fake.pages.get(page.page_id, {}).get("labels", [])
+    ]
+    db.close()
+    titles = sorted(page["title"] for page in fake.pages.values())
+    expected = sorted(["수정됨", "같은 제목", "같은 제목"] + [f"아웃박스 {i}" for i in range(1, posts - 1)])
+    print(f"쓰기 API {posts + 4}건: {write_elapsed:.2f}s (Confluence 지연 {latency}s/요청)")
+    print(f"아웃박스 상태: {dict((s, statuses.count(s)) for s in set(statuses))}")
+    print(f"Confluence 포스트: {titles}")
+    if mismatched:
+        print(f"다른 게시글의 포스트에 매핑됨: {mismatched}")
+    return 0 if titles == expected and set(statuses) == {"done"} and not mismatched else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Confluence 아웃박스 확인")
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--posts", type=int, default=5)
+    args = parser.parse_args()
+
+    fake = FakeConfluenceServer(latency=args.latency, fail_requests=2, lost_creates=1).start()
+    os.environ.update({
+        "CONFLUENCE_BLOG_API_URL": fake.url,
+        "CONFLUENCE_EMAIL": "bench@example.com",
+        "CONFLUENCE_API_TOKEN": "token",
+        "CONFLUENCE_SPACE_KEY": "BENCH",
+    })
+    if not os.getenv("DATABASE_URL"):
+        os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/confluence_check.db"
+    try:
+        sys.exit(run(fake, args.posts, args.latency))
+    finally:
+        fake.stop()
+
+
+if __name__ == "__main__":
+    main()
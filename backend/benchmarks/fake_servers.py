@@ -0,0 +1,266 @@
+"""
+벤치마크/검증용 로컬 대역 서버 모음 (외부 서비스 대신 사용)
+OpenAI / Confluence는 HTTP, SMTP는 aiosmtpd와 비슷한 최소 구현
+
+    server = FakeOpenAIServer(latency=1.0).start()
+    os.environ["OPENAI_BASE_URL"] = server.url
+    ...
+    server.stop()
+"""
+import json
+import re
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+FAKE_URL_ANALYSIS = {
+    "title": "테스트 분석 결과",
+    "summary": ["🚀 테스트\n- 로컬 대역 서버가 생성한 요약입니다."],
+    "tags": ["Test"],
+}
+
+
+class _FakeHTTPServer:
+    """
+    별도 스레드에서 동작하는 ThreadingHTTPServer 래퍼
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    def handle(self, handler: BaseHTTPRequestHandler, body: bytes):
+        raise NotImplementedError
+
+    def _make_handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _dispatch(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                with fake._lock:
+                    fake.request_count += 1
+                if fake.latency:
+                    time.sleep(fake.latency)
+                fake.handle(self, body)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def send_json(self, handler: BaseHTTPRequestHandler, status: int, payload):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+class FakeOpenAIServer(_FakeHTTPServer):
+    """
+    /chat/completions만 흉내내는 OpenAI 대역 서버
+    기술 글 판별 프롬프트에는 "true", 그 외에는 URL 분석 JSON으로 응답
+    """
+
+    @property
+    def url(self) -> str:
+        return super().url + "/v1"
+
+    def handle(self, handler, body):
+        request = json.loads(body or b"{}")
+        prompt = request.get("messages", [{}])[-1].get("content", "")
+        if "'true' 또는 'false'" in prompt:
+            content = "true"
+        else:
+            content = json.dumps(FAKE_URL_ANALYSIS, ensure_ascii=False)
+        self.send_json(handler, 200, {
+            "id": "chatcmpl-fake",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "fake"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        })
+
+
+class FakeConfluenceServer(_FakeHTTPServer):
+    """
+    블로그 포스트 생성/수정/삭제/라벨 검색만 흉내내는 Confluence REST API 대역 서버
+    fail_requests만큼은 500으로 응답 (재시도 확인용)
+    lost_creates만큼은 포스트를 생성한 뒤 500으로 응답 (응답 유실 시 중복 생성 방지 확인용)
+    """
+
+    def __init__(self, latency: float = 0.0, fail_requests: int = 0, lost_creates: int = 0):
+        super().__init__(latency)
+        self.fail_requests = fail_requests
+        self.lost_creates = lost_creates
+        self.pages = {}
+        self._next_id = 1000
+
+    @property
+    def url(self) -> str:
+        return super().url + "/wiki/rest/api/content"
+
+    def handle(self, handler, body):
+        with self._lock:
+            if self.fail_requests > 0:
+                self.fail_requests -= 1
+                return self.send_json(handler, 500, {"message": "fake failure"})
+            path, _, query = handler.path.partition("?")
+            page_id = path.rstrip("/").rsplit("/", 1)[-1]
+            request = json.loads(body or b"{}")
+
+            if handler.command == "POST":
+                self._next_id += 1
+                labels = [label["name"] for label in request.get("metadata", {}).get("labels", [])]
+                page = {"id": str(self._next_id), "title": request["title"], "version": {"number": 1},
+                        "body": request["body"], "labels": labels}
+                self.pages[page["id"]] = page
+                if self.lost_creates > 0:
+                    self.lost_creates -= 1
+                    return self.send_json(handler, 500, {"message": "fake lost response"})
+                return self.send_json(handler, 200, page)
+            if handler.command == "GET" and page_id == "search":
+                cql = parse_qs(query).get("cql", [""])[0]
+                label = re.search(r'label = "([^"]+)"', cql)
+                results = [page for page in self.pages.values() if label and label.group(1) in page["labels"]]
+                return self.send_json(handler, 200, {"results": results})
+
+            page = self.pages.get(page_id)
+            if page is None:
+                return self.send_json(handler, 404, {"message": "not found"})
+            if handler.command == "PUT":
+                if request["version"]["number"] != page["version"]["number"] + 1:
+                    return self.send_json(handler, 409, {"message": "version conflict"})
+                page.update(title=request["title"], body=request["body"], version=request["version"])
+                return self.send_json(handler, 200, page)
+            del self.pages[page_id]
+            handler.send_response(204)
+            handler.end_headers()
+
+
+class FakeSMTPServer:
+    """
+    EHLO / AUTH PLAIN / MAIL / RCPT / DATA / RSET / QUIT만 지원하는 SMTP 대역 서버 (STARTTLS 없음)
+    - connect_latency / auth_latency / message_latency로 실제 서버의 핸드셰이크 비용을 흉내냄
+    - "reject"가 포함된 수신자는 550으로 거부
+    - drop_after_messages를 지정하면 세션당 그 개수만큼 보낸 뒤 연결을 끊음 (재접속 확인용)
+    """
+
+    def __init__(self, connect_latency: float = 0.0, auth_latency: float = 0.0,
+                 message_latency: float = 0.0, drop_after_messages: int = 0):
+        self.connect_latency = connect_latency
+        self.auth_latency = auth_latency
+        self.message_latency = message_latency
+        self.drop_after_messages = drop_after_messages
+        self.connection_count = 0
+        self.delivered = []
+        self._lock = threading.Lock()
+        self._server = None
+
+    def _make_handler(self):
+        fake = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def reply(self, line: str):
+                self.wfile.write((line + "\r\n").encode("ascii"))
+
+            def handle(self):
+                with fake._lock:
+                    fake.connection_count += 1
+                time.sleep(fake.connect_latency)
+                self.reply("220 fake ESMTP")
+                sent = 0
+                recipients = []
+                while True:
+                    line = self.rfile.readline()
+                    if not line:
+                        return
+                    command = line.decode("ascii", errors="replace").strip()
+                    verb = command.split(" ", 1)[0].upper()
+                    if verb in ("EHLO", "HELO"):
+                        self.reply("250-fake")
+                        self.reply("250-AUTH PLAIN")
+                        self.reply("250 8BITMIME")
+                    elif verb == "AUTH":
+                        time.sleep(fake.auth_latency)
+                        self.reply("235 2.7.0 Authentication successful")
+                    elif verb == "MAIL":
+                        recipients = []
+                        self.reply("250 OK")
+                    elif verb == "RCPT":
+                        address = command.split(":", 1)[1].strip(" <>")
+                        if "reject" in address:
+                            self.reply("550 5.1.1 User unknown")
+                        else:
+                            recipients.append(address)
+                            self.reply("250 OK")
+                    elif verb == "DATA":
+                        self.reply("354 End data with <CR><LF>.<CR><LF>")
+                        while self.rfile.readline() not in (b".\r\n", b""):
+                            pass
+                        time.sleep(fake.message_latency)
+                        with fake._lock:
+                            fake.delivered.extend(recipients)
+                        self.reply("250 OK")
+                        sent += 1
+                        if fake.drop_after_messages and sent >= fake.drop_after_messages:
+                            return
+                    elif verb == "QUIT":
+                        self.reply("221 Bye")
+                        return
+                    else:
+                        self.reply("250 OK")
+
+        return Handler
+
+    @property
+    def host(self) -> str:
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self):
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        self._server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
@@ -0,0 +1,585 @@
+"""
+부하 테스트: 시드 데이터가 들어간 DB로 main.py 앱을 띄우고 라우터별로 고정 동시성 요청을 보내
+p50/p95/p99 지연시간, 처리량, 요청당 SQL 개수를 JSON 기준선으로 저장합니다.
+
+사용법 (backend 디렉터리에서 실행):
+    python -m benchmarks.load_test [--posts 10000] [--comments 100000] [--concurrency 16] [--requests 1000]
+                                   [--scenarios posts_list,post_detail,...] [--output load_baseline.json]
+                                   [--compare 이전_기준선.json]
+
+    # 운영 규모 예시 (시드에 수 분 소요, 같은 DB를 재사용하려면 --reuse-db)
+    # --reuse-db는 이전 실행의 쓰기 시나리오가 추가한 게시글/댓글도 남아 있으므로 정밀 비교 시에는 다시 시드
+    python -m benchmarks.load_test --posts 100000 --comments 1000000 --reuse-db
+
+- DATABASE_URL이 없으면 임시 디렉터리의 SQLite 파일을 사용합니다 (게시글/댓글 수별로 파일을 따로 둠).
+  쓰기 동시성까지 보려면 MySQL 검사용 DB를 DATABASE_URL로 지정하세요. 지정한 DB의 데이터는 시드 시 삭제됩니다.
+- OpenAI / Confluence / SMTP는 benchmarks.fake_servers의 로컬 대역 서버로 대체하며 지연시간은 옵션으로 조절합니다.
+- 앱은 uvicorn 별도 프로세스(워커 1개)로 실행하고, SQL 개수/DB 시간은 앱의 GET /metrics에서 시나리오 전후 차이로 계산합니다.
+- 같은 --seed면 같은 데이터/요청 순서를 사용하므로 변경 전후 결과를 --compare로 비교할 수 있습니다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.fake_servers import FakeConfluenceServer, FakeOpenAIServer, FakeSMTPServer
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SEED_TAGS = ["Python", "FastAPI", "SQLAlchemy", "MySQL", "React", "Next.js", "TypeScript", "Docker",
+             "Kubernetes", "Redis", "AWS", "Linux", "Git", "테스트", "성능", "보안", "네트워크", "알고리즘"]
+SEED_WORDS = ["데이터베이스", "인덱스", "트랜잭션", "캐시", "비동기", "스레드", "커넥션", "쿼리", "배포", "모니터링",
+              "latency", "throughput", "python", "fastapi", "mysql", "react", "docker", "kubernetes", "redis",
+              "성능", "최적화", "장애", "로그", "테스트", "리팩터링", "아키텍처", "서버", "클라이언트", "네트워크", "보안"]
+SEED_PASSWORD = "load-test"
+SEED_BATCH = 5000
+# 시드 게시글 작성 시각 범위 (지난 주 게시글이 항상 포함되도록 최근 60일에 고르게 배치)
+SEED_CREATED_SPAN = timedelta(days=60)
+
+
+# ---- 시드 ----
+
+def seed_database(posts: int, comments: int, seed: int):
+    from sqlalchemy import delete, func, insert
+
+    from database import SessionLocal, engine
+    from migrations import run_migrations
+    from models.comment import Comment
+    from models.confluence import ConfluenceOutbox, ConfluencePage
+    from models.post import Post
+    from models.search import SearchDocument, SearchPosting
+    from models.tag import PostTag, Tag
+    from models.weekly_digest import WeeklyDigest
+    from scripts.rebuild_search_index import reindex_posts
+    from services.tag_index import tag_key
+    from services.password_hasher import password_hasher
+
+    engine.echo = False
+    run_migrations(engine)
+    rng = random.Random(seed)
+    password_hash = password_hasher.hash(SEED_PASSWORD)
+    started = time.perf_counter()
+
+    db = SessionLocal()
+    try:
+        for model in (SearchPosting, SearchDocument, PostTag, Tag, Comment, ConfluenceOutbox, ConfluencePage,
+                      WeeklyDigest, Post):
+            db.execute(delete(model))
+        db.commit()
+
+        tag_ids = {}
+        for name in SEED_TAGS:
+            tag = Tag(name=name, normalized_name=tag_key(name), post_count=0)
+            db.add(tag)
+            db.flush()
+            tag_ids[name] = tag.id
+
+        created_step = SEED_CREATED_SPAN / posts
+        first_created_at = datetime.utcnow() - SEED_CREATED_SPAN
+        # 댓글 수는 게시글마다 치우치게 분배 (일부 게시글에 긴 댓글 스레드)
+        comment_counts = [0] * posts
+        for _ in range(comments):
+            comment_counts[int(posts * rng.random() ** 3)] += 1
+
+        tag_counts = Counter()
+        next_id = 1
+        for start in range(0, posts, SEED_BATCH):
+            post_rows, tag_rows = [], []
+            for index in range(start, min(start + SEED_BATCH, posts)):
+                post_id = next_id + index
+                created_at = first_created_at + created_step * index
+                tags = rng.sample(SEED_TAGS, rng.randint(1, 3))
+                post_rows.append({
+                    "id": post_id,
+                    "title": f"{rng.choice(SEED_WORDS)} {rng.choice(SEED_WORDS)} 정리 #{index}",
+                    "content": " ".join(rng.choice(SEED_WORDS) for _ in range(rng.randint(20, 120))),
+                    "created_at": created_at,
+                    "views": rng.randint(0, 5000),
+                    "tags": tags,
+                    "url": f"https://example.com/articles/{index}",
+                    "thumbnail_url": None,
+                    "password_hash": password_hash,
+                    "comment_count": comment_counts[index],
+                })
+                for name in tags:
+                    tag_rows.append({"tag_id": tag_ids[name], "post_id": post_id, "created_at": created_at})
+                    tag_counts[name] += 1
+            db.execute(insert(Post), post_rows)
+            db.execute(insert(PostTag), tag_rows)
+            db.commit()
+        for name, count in tag_counts.items():
+            db.query(Tag).filter(Tag.id == tag_ids[name]).update({Tag.post_count: count})
+        db.commit()
+
+        # 댓글은 게시글 작성 이후 시각으로 게시글 순서대로 생성 (id는 1부터, --reuse-db 확인용)
+        rows = []
+        comment_id = 0
+        for index, count in enumerate(comment_counts):
+            created_at = first_created_at + created_step * index
+            for offset in range(count):
+                comment_id += 1
+                rows.append({
+                    "id": comment_id,
+                    "post_id": next_id + index,
+                    "content": f"{rng.choice(SEED_WORDS)} 관련 댓글 {offset}",
+                    "created_at": created_at + timedelta(seconds=offset + 1),
+                    "password_hash": password_hash,
+                })
+                if len(rows) >= SEED_BATCH:
+                    db.execute(insert(Comment), rows)
+                    db.commit()
+                    rows = []
+        if rows:
+            db.execute(insert(Comment), rows)
+            db.commit()
+    finally:
+        db.close()
+
+    print(f"[LoadTest] 게시글 {posts}건 / 댓글 {comments}건 시드 완료 ({time.perf_counter() - started:.1f}s), 검색 색인 생성 중...")
+    reindex_posts(1000)
+    print(f"[LoadTest] 시드 전체 {time.perf_counter() - started:.1f}s")
+
+
+def is_seeded(posts: int, comments: int) -> bool:
+    """
+    시드한 게시글/댓글(id 1..N)이 그대로 남아 있는지 확인
+    쓰기 시나리오가 추가한 행은 id가 더 크므로 무시 (댓글 수가 더 많이 시드된 DB는 구분하지 않음)
+    """
+    from sqlalchemy import func
+
+    from database import SessionLocal, engine
+    from migrations import run_migrations
+    from models.comment import Comment
+    from models.post import Post
+
+    engine.echo = False
+    run_migrations(engine)
+    db = SessionLocal()
+    try:
+        return (
+            db.query(func.count(Post.id)).filter(Post.id <= posts).scalar() == posts
+            # 시드 게시글은 모두 url이 있고 쓰기 시나리오 게시글은 없음 (더 크게 시드한 DB 구분)
+            and db.query(Post.url).filter(Post.id == posts + 1).scalar() is None
+            and db.query(func.count(Comment.id)).filter(Comment.id <= comments).scalar() == comments
+        )
+    finally:
+        db.close()
+
+
+@dataclass
+class Workload:
+    """요청 생성에 쓰는 시드 데이터 표본"""
+    post_ids: List[int]
+    cursors: List[str]
+    tags: List[str]
+    words: List[str]
+
+
+def load_workload(seed: int, sample_size: int = 2000) -> Workload:
+    from database import SessionLocal
+    from models.post import Post
+    from models.tag import Tag
+    from api.pagination import encode_cursor
+
+    db = SessionLocal()
+    try:
+        post_ids = [row.id for row in db.query(Post.id)]
+        rng = random.Random(seed)
+        sample = rng.sample(post_ids, min(sample_size, len(post_ids)))
+        cursors = [
+            encode_cursor(row.created_at, row.id)
+            for row in db.query(Post.created_at, Post.id).filter(Post.id.in_(sample[:500]))
+        ]
+        tags = [row.name for row in db.query(Tag.name).filter(Tag.post_count > 0)]
+    finally:
+        db.close()
+    return Workload(post_ids=sample, cursors=cursors, tags=tags, words=SEED_WORDS)
+
+
+# ---- 시나리오 ----
+
+@dataclass
+class Scenario:
+    name: str
+    router: str
+    method: str
+    # /metrics의 route 라벨 (경로 템플릿)
+    route: str
+    make: Callable[[random.Random, Workload], Tuple[str, Optional[dict]]]
+
+
+SCENARIOS = [
+    Scenario("posts_list", "posts", "GET", "/posts",
+             lambda rng, w: ("/posts?cursor=&limit=20", None)),
+    Scenario("posts_list_deep", "posts", "GET", "/posts",
+             lambda rng, w: ("/posts?limit=20&cursor=" + rng.choice(w.cursors), None)),
+    Scenario("posts_by_tag", "posts", "GET", "/posts",
+             lambda rng, w: (f"/posts?limit=20&tag={rng.choice(w.tags)}&tag={rng.choice(w.tags)}", None)),
+    Scenario("post_detail", "posts", "GET", "/posts/{post_id}",
+             lambda rng, w: (f"/posts/{rng.choice(w.post_ids)}", None)),
+    Scenario("comments_page", "comments", "GET", "/comments/{post_id}",
+             lambda rng, w: (f"/comments/{rng.choice(w.post_ids)}?after=&limit=20", None)),
+    Scenario("comments_latest", "comments", "GET", "/comments/{post_id}",
+             lambda rng, w: (f"/comments/{rng.choice(w.post_ids)}?after=&limit=20&order=desc", None)),
+    Scenario("search", "search", "GET", "/search",
+             lambda rng, w: (f"/search?q={rng.choice(w.words)}&limit=20", None)),
+    Scenario("tags", "tags", "GET", "/tags",
+             lambda rng, w: ("/tags", None)),
+    Scenario("email_weekly_posts", "emails", "GET", "/email/weekly-posts",
+             lambda rng, w: ("/email/weekly-posts", None)),
+    Scenario("post_create", "posts", "POST", "/posts",
+             lambda rng, w: ("/posts", {
+                 "title": f"부하 테스트 {rng.choice(w.words)}",
+                 "content": " ".join(rng.choice(w.words) for _ in range(60)),
+                 "tags": rng.sample(w.tags, 2),
+                 "url": None,
+                 "thumbnailUrl": None,
+                 "password": SEED_PASSWORD,
+             })),
+    Scenario("comment_create", "comments", "POST", "/comments",
+             lambda rng, w: ("/comments", {
+                 "postId": rng.choice(w.post_ids),
+                 "content": f"{rng.choice(w.words)} 댓글",
+                 "password": SEED_PASSWORD,
+             })),
+    # 기술 키워드가 적은 글이라 로컬 판별 없이 OpenAI(대역 서버) 호출, nonce로 메모 캐시 적중 방지
+    Scenario("analyze_post", "openai", "POST", "/analyze-post",
+             lambda rng, w: ("/analyze-post", {"content": f"오늘 읽은 글에 대한 짧은 메모입니다 {rng.getrandbits(64):x}"})),
+    Scenario("email_send_weekly", "emails", "POST", "/email/send-weekly",
+             lambda rng, w: ("/email/send-weekly", None)),
+]
+
+
+# ---- 측정 ----
+
+METRIC_LINE = re.compile(r'^(\w+)\{(.*)\} (\S+)$')
+LABEL_PAIR = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def parse_metrics(text: str) -> Dict[Tuple[str, str, str], float]:
+    """(지표 이름, method, route) → 값 (요청당 SQL 지표만)"""
+    values = defaultdict(float)
+    for line in text.splitlines():
+        match = METRIC_LINE.match(line)
+        if not match or not match.group(1).startswith("http_request_db_"):
+            continue
+        labels = dict(LABEL_PAIR.findall(match.group(2)))
+        values[(match.group(1), labels.get("method"), labels.get("route"))] += float(match.group(3))
+    return values
+
+
+def parse_external_calls(text: str) -> Dict[str, Dict[str, float]]:
+    calls = defaultdict(lambda: {"count": 0, "errors": 0, "seconds": 0.0})
+    for line in text.splitlines():
+        match = METRIC_LINE.match(line)
+        if not match or not match.group(1).startswith("external_call_duration_seconds_"):
+            continue
+        labels = dict(LABEL_PAIR.findall(match.group(2)))
+        key = f"{labels['service']}.{labels['operation']}"
+        if match.group(1).endswith("_count"):
+            calls[key]["count"] += float(match.group(3))
+            if labels.get("outcome") == "error":
+                calls[key]["errors"] += float(match.group(3))
+        elif match.group(1).endswith("_sum"):
+            calls[key]["seconds"] += float(match.group(3))
+    return calls
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(client, scenario: Scenario, workload: Workload, requests: int, concurrency: int,
+                       seed: int) -> Dict:
+    rng = random.Random(f"{seed}:{scenario.name}")
+    planned = [scenario.make(rng, workload) for _ in range(requests)]
+    latencies: List[float] = []
+    statuses = Counter()
+    pending = iter(planned)
+
+    async def worker():
+        for path, body in pending:
+            started = time.perf_counter()
+            try:
+                response = await client.request(scenario.method, path, json=body)
+                statuses[str(response.status_code)] += 1
+            except Exception as e:
+                statuses[type(e).__name__] += 1
+            latencies.append(time.perf_counter() - started)
+
+    before = parse_metrics((await client.get("/metrics")).text)
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    after = parse_metrics((await client.get("/metrics")).text)
+
+    def delta(name: str) -> float:
+        key = (name, scenario.method, scenario.route)
+        return after.get(key, 0.0) - before.get(key, 0.0)
+
+    served = delta("http_request_db_statements_count") or 1
+    latencies.sort()
+    errors = sum(count for status, count in statuses.items() if not status.startswith(("2", "3")))
+    return {
+        "router": scenario.router,
+        "method": scenario.method,
+        "route": scenario.route,
+        "requests": len(latencies),
+        "errors": errors,
+        "status": dict(sorted(statuses.items())),
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.50) * 1000, 2),
+            "p95": round(percentile(latencies, 0.95) * 1000, 2),
+            "p99": round(percentile(latencies, 0.99) * 1000, 2),
+            "max": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+            "mean": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0,
+        },
+        "queries_per_request": round(delta("http_request_db_statements_sum") / served, 2),
+        "db_ms_per_request": round(delta("http_request_db_duration_seconds_sum") / served * 1000, 3),
+    }
+
+
+async def wait_for_email_job(client, timeout: float) -> Optional[Dict]:
+    """마지막 주간 메일 작업이 끝날 때까지 대기 후 상태 반환"""
+    response = await client.post("/email/send-weekly")
+    if response.status_code != 202:
+        return None
+    job_id = response.json()["jobId"]
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = (await client.get(f"/email/jobs/{job_id}")).json()
+        if job["status"] not in ("queued", "running"):
+            return job
+        await asyncio.sleep(0.2)
+    return None
+
+
+async def drive(base_url: str, scenarios: List[Scenario], workload: Workload, args) -> Tuple[Dict, Dict]:
+    import httpx
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        results = {}
+        for scenario in scenarios:
+            if args.warmup:
+                await run_scenario(client, scenario, workload, args.warmup, args.concurrency, args.seed + 1)
+            result = await run_scenario(client, scenario, workload, args.requests, args.concurrency, args.seed)
+            results[scenario.name] = result
+            print(
+                f"[LoadTest] {scenario.name:<20} p50 {result['latency_ms']['p50']:>8.2f}ms "
+                f"p95 {result['latency_ms']['p95']:>8.2f}ms p99 {result['latency_ms']['p99']:>8.2f}ms "
+                f"{result['throughput_rps']:>8.1f} req/s  SQL {result['queries_per_request']:>5.2f}/req  "
+                f"errors {result['errors']}"
+            )
+        if any(scenario.router == "emails" for scenario in scenarios):
+            job = await wait_for_email_job(client, timeout=300)
+            if job:
+                results["email_job"] = {key: job[key] for key in ("status", "total", "sent", "failed")}
+        external = parse_external_calls((await client.get("/metrics")).text)
+    return results, {
+        key: {
+            "count": int(value["count"]),
+            "errors": int(value["errors"]),
+            "mean_ms": round(value["seconds"] / value["count"] * 1000, 2) if value["count"] else 0.0,
+        }
+        for key, value in sorted(external.items())
+    }
+
+
+# ---- 앱 / 대역 서버 ----
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_app(env: Dict[str, str], port: int, log_path: str) -> subprocess.Popen:
+    log = open(log_path, "w")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning", "--no-access-log"],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=log,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"앱이 시작되지 않았습니다. 로그: {log_path}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"앱 시작 대기 시간 초과. 로그: {log_path}")
+
+
+def app_env(args, openai: FakeOpenAIServer, confluence: FakeConfluenceServer, smtp: FakeSMTPServer) -> Dict[str, str]:
+    env = dict(os.environ)
+    env.update({
+        "OPENAI_BASE_URL": openai.url,
+        "OPENAI_API_KEY": "fake-key",
+        "CONFLUENCE_BLOG_API_URL": confluence.url,
+        "CONFLUENCE_EMAIL": "bench@example.com",
+        "CONFLUENCE_API_TOKEN": "fake-token",
+        "CONFLUENCE_SPACE_KEY": "BENCH",
+        "SMTP_SERVER": smtp.host,
+        "SMTP_PORT": str(smtp.port),
+        "SMTP_USE_TLS": "false",
+        "SMTP_USERNAME": "bench",
+        "SMTP_PASSWORD": "bench",
+        "SENDER_EMAIL": "bench@example.com",
+        "RECIPIENT_EMAILS": ",".join(f"reader{i}@example.com" for i in range(args.recipients)),
+        "BCRYPT_ROUNDS": str(args.bcrypt_rounds),
+        "DB_ASYNC": "true" if args.db_async else "false",
+        # 모든 요청이 같은 IP에서 나가므로 기본은 요청 제한을 끄고 측정
+        "RATE_LIMIT_ENABLED": "true" if args.rate_limit else "false",
+    })
+    return env
+
+
+# ---- 결과 ----
+
+def compare(baseline_path: str, results: Dict):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["scenarios"]
+    print(f"\n[LoadTest] {baseline_path} 대비 변화 (음수 = 빨라짐 / 줄어듦)")
+    print(f"{'scenario':<20} | {'p50':>8} | {'p95':>8} | {'p99':>8} | {'req/s':>8} | {'SQL/req':>8}")
+
+    def change(old: float, new: float) -> str:
+        return f"{(new - old) / old * 100:+7.1f}%" if old else "     n/a"
+
+    for name, result in results.items():
+        old = baseline.get(name)
+        if not old or "latency_ms" not in result:
+            continue
+        print(
+            f"{name:<20} | {change(old['latency_ms']['p50'], result['latency_ms']['p50'])} | "
+            f"{change(old['latency_ms']['p95'], result['latency_ms']['p95'])} | "
+            f"{change(old['latency_ms']['p99'], result['latency_ms']['p99'])} | "
+            f"{change(old['throughput_rps'], result['throughput_rps'])} | "
+            f"{change(old['queries_per_request'], result['queries_per_request'])}"
+        )
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="라우터별 부하 테스트 / 성능 기준선 생성")
+    parser.add_argument("--posts", type=int, default=10000)
+    parser.add_argument("--comments", type=int, default=100000)
+    parser.add_argument("--reuse-db", action="store_true", help="게시글/댓글 수가 같으면 시드를 건너뜀")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=1000, help="시나리오별 요청 수")
+    parser.add_argument("--warmup", type=int, default=50, help="시나리오별 측정 전 요청 수")
+    parser.add_argument("--scenarios", default=",".join(scenario.name for scenario in SCENARIOS))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--openai-latency", type=float, default=0.3)
+    parser.add_argument("--confluence-latency", type=float, default=0.05)
+    parser.add_argument("--smtp-latency", type=float, default=0.01, help="메일 1건 전송 지연 (접속/인증은 5배)")
+    parser.add_argument("--recipients", type=int, default=50)
+    parser.add_argument("--bcrypt-rounds", type=int, default=int(os.getenv("BCRYPT_ROUNDS", "12")))
+    parser.add_argument("--db-async", action="store_true", help="게시글/댓글 API를 비동기 DB 세션으로 실행 (DB_ASYNC=true)")
+    parser.add_argument("--rate-limit", action="store_true", help="요청 제한(429)을 켠 채로 실행")
+    parser.add_argument("--output", default="load_baseline.json")
+    parser.add_argument("--compare", help="비교할 이전 기준선 JSON")
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    by_name = {scenario.name: scenario for scenario in SCENARIOS}
+    unknown = [name for name in names if name not in by_name]
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(unknown)}")
+    scenarios = [by_name[name] for name in names]
+
+    if not os.getenv("DATABASE_URL"):
+        os.environ["DATABASE_URL"] = (
+            f"sqlite:///{tempfile.gettempdir()}/tech_talk_load_{args.posts}_{args.comments}.db"
+        )
+    os.environ["BCRYPT_ROUNDS"] = str(args.bcrypt_rounds)
+
+    if args.reuse_db and is_seeded(args.posts, args.comments):
+        print("[LoadTest] 기존 시드 데이터를 재사용합니다.")
+    else:
+        seed_database(args.posts, args.comments, args.seed)
+    workload = load_workload(args.seed)
+
+    openai = FakeOpenAIServer(latency=args.openai_latency).start()
+    confluence = FakeConfluenceServer(latency=args.confluence_latency).start()
+    smtp = FakeSMTPServer(
+        connect_latency=args.smtp_latency * 5,
+        auth_latency=args.smtp_latency * 5,
+        message_latency=args.smtp_latency,
+    ).start()
+    port = free_port()
+    log_path = os.path.join(tempfile.gettempdir(), f"tech_talk_load_{port}.log")
+    process = start_app(app_env(args, openai, confluence, smtp), port, log_path)
+    try:
+        results, external = asyncio.run(drive(f"http://127.0.0.1:{port}", scenarios, workload, args))
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+        for server in (openai, confluence, smtp):
+            server.stop()
+
+    report = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "database": os.environ["DATABASE_URL"].split(":", 1)[0],
+            "posts": args.posts,
+            "comments": args.comments,
+            "concurrency": args.concurrency,
+            "requests_per_scenario": args.requests,
+            "seed": args.seed,
+            "latency_s": {
+                "openai": args.openai_latency,
+                "confluence": args.confluence_latency,
+                "smtp_message": args.smtp_latency,
+            },
+            "bcrypt_rounds": args.bcrypt_rounds,
+            "db_async": args.db_async,
+            "rate_limit": args.rate_limit,
+        },
+        "scenarios": results,
+        "external_calls": external,
+        "fake_servers": {
+            "openai_requests": openai.request_count,
+            "confluence_requests": confluence.request_count,
+            "smtp_connections": smtp.connection_count,
+            "smtp_delivered": len(smtp.delivered),
+        },
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"[LoadTest] 결과 저장: {args.output} (앱 로그: {log_path})")
+    if args.compare:
+        compare(args.compare, results)
+
+
+if __name__ == "__main__":
+    main()
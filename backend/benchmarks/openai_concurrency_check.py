@@ -0,0 +1,76 @@
+"""
+OpenAI 분석이 진행 중일 때도 다른 API가 계속 응답하는지 확인합니다.
+
+사용법 (backend 디렉터리에서 실행):
+    python -m benchmarks.openai_concurrency_check [--latency 2.0] [--analyses 8]
+
+느린 로컬 OpenAI 대역 서버를 띄운 뒤 /analyze-post 요청을 동시에 보내고,
+그 사이 GET /posts 지연시간을 측정합니다. GET /posts가 분석 지연만큼 막히면 실패(exit 1)합니다.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.fake_servers import FakeOpenAIServer
+
+
+async def run(latency: float, analyses: int) -> int:
+    import httpx
+    from database import dispose_async_engines, engine
+    from models.base import Base
+    from main import app
+
+    engine.echo = False
+    Base.metadata.create_all(bind=engine)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://app") as client:
+        started = time.perf_counter()
+        analysis_tasks = [
+            asyncio.create_task(client.post("/analyze-post", json={"content": f"FastAPI 비동기 처리 {i}"}, timeout=60))
+            for i in range(analyses)
+        ]
+        await asyncio.sleep(0.1)
+
+        read_latencies = []
+        while not all(task.done() for task in analysis_tasks):
+            read_started = time.perf_counter()
+            response = await client.get("/posts")
+            response.raise_for_status()
+            read_latencies.append(time.perf_counter() - read_started)
+            await asyncio.sleep(0.05)
+
+        results = await asyncio.gather(*analysis_tasks)
+        elapsed = time.perf_counter() - started
+    # lifespan을 거치지 않으므로 직접 정리 (DB_ASYNC=true일 때 aiosqlite 연결 스레드가 남아 종료되지 않음)
+    await dispose_async_engines()
+
+    statuses = sorted({response.status_code for response in results})
+    worst = max(read_latencies) if read_latencies else 0.0
+    print(f"analyze-post {analyses}건: {elapsed:.2f}s (status {statuses})")
+    print(f"GET /posts {len(read_latencies)}건: 최대 {worst * 1000:.1f}ms")
+    return 0 if read_latencies and worst < latency / 2 else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 호출 중 이벤트 루프 블로킹 여부 확인")
+    parser.add_argument("--latency", type=float, default=2.0)
+    parser.add_argument("--analyses", type=int, default=8)
+    args = parser.parse_args()
+
+    server = FakeOpenAIServer(latency=args.latency).start()
+    os.environ["OPENAI_BASE_URL"] = server.url
+    os.environ.setdefault("OPENAI_API_KEY", "fake-key")
+    if not os.getenv("DATABASE_URL"):
+        os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/openai_check.db"
+    try:
+        sys.exit(asyncio.run(run(args.latency, args.analyses)))
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
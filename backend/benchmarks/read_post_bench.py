@@ -0,0 +1,99 @@
+"""
+read_post 회귀 벤치마크: 댓글 수가 늘어나도 게시글 상세 조회의 메모리/지연시간이 일정한지 확인합니다.
+
+사용법 (backend 디렉터리에서 실행):
+    python -m benchmarks.read_post_bench [--sizes 10,1000,10000] [--repeat 50]
+
+DATABASE_URL이 없으면 임시 SQLite 파일을 사용합니다.
+기존 방식(joinedload로 전체 댓글 로딩)과 현재 read_post의 DB 조회(load_post)를 나란히 측정합니다.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+if not os.getenv("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/read_post_bench.db"
+
+from sqlalchemy import insert
+from sqlalchemy.orm import joinedload
+
+from database import SessionLocal, engine
+from models.base import Base
+from models.comment import Comment
+from models.post import Post
+from api.posts import load_post
+
+
+def seed_post(db, comment_count: int) -> int:
+    post = Post(title=f"bench {comment_count}", content="본문", password_hash="x", comment_count=comment_count)
+    db.add(post)
+    db.commit()
+    rows = [
+        {"post_id": post.id, "content": f"댓글 {i}", "password_hash": "x"}
+        for i in range(comment_count)
+    ]
+    for start in range(0, len(rows), 5000):
+        db.execute(insert(Comment), rows[start:start + 5000])
+    db.commit()
+    return post.id
+
+
+def legacy_read_post(post_id: int, db):
+    # 변경 전 방식: 전체 댓글을 joinedload 후 10개 + COUNT 쿼리를 다시 실행
+    post = db.query(Post).options(joinedload(Post.comments)).filter(Post.id == post_id).first()
+    comments = (
+        db.query(Comment)
+        .filter(Comment.post_id == post.id)
+        .order_by(Comment.created_at.asc())
+        .limit(10)
+        .all()
+    )
+    db.query(Comment).filter(Comment.post_id == post.id).count()
+    return post, comments
+
+
+def measure(fn, post_id: int, repeat: int):
+    timings = []
+    peak = 0
+    for _ in range(repeat):
+        db = SessionLocal()
+        try:
+            tracemalloc.start()
+            started = time.perf_counter()
+            fn(post_id, db)
+            timings.append((time.perf_counter() - started) * 1000)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        finally:
+            db.close()
+    return statistics.median(timings), peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="read_post 벤치마크")
+    parser.add_argument("--sizes", default="10,1000,10000")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    engine.echo = False
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    post_ids = {size: seed_post(db, size) for size in map(int, args.sizes.split(","))}
+    db.close()
+
+    def current(post_id, db):
+        # read_post의 DB 조회 부분만 측정 (응답 캐시 제외)
+        return load_post(db, post_id, 10)
+
+    print(f"{'comments':>10} | {'legacy ms':>10} | {'legacy KiB':>10} | {'current ms':>10} | {'current KiB':>11}")
+    for size, post_id in post_ids.items():
+        legacy_ms, legacy_kib = measure(legacy_read_post, post_id, args.repeat)
+        current_ms, current_kib = measure(current, post_id, args.repeat)
+        print(f"{size:>10} | {legacy_ms:>10.2f} | {legacy_kib:>10.0f} | {current_ms:>10.2f} | {current_kib:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+게시글 목록 직렬화 벤치마크: 100개 페이지를 응답 bytes로 만드는 시간을 기존 방식과 비교합니다.
+
+사용법 (backend 디렉터리에서 실행):
+    python -m benchmarks.serialization_bench [--posts 100] [--content-chars 2000] [--repeat 200]
+
+DATABASE_URL이 없으면 임시 SQLite 파일을 사용합니다.
+- legacy: ORM Post 객체 조회 → 필드별 dict → jsonable_encoder → JSONResponse 렌더링 (변경 전 경로)
+- projection: 필요한 컬럼만 튜플로 조회 → 미리 만든 인코더로 bytes 기록 (?view=full)
+- excerpt: projection + 본문 앞부분만 조회 (?view=excerpt)
+직렬화만 측정한 값(조회 결과를 미리 받아둔 상태)과 조회까지 포함한 값을 함께 출력합니다.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+if not os.getenv("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/serialization_bench.db"
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import insert
+
+from database import SessionLocal, engine
+from migrations import run_migrations
+from models.post import Post
+from api.encoding import encode_json
+from api.posts import post_summary_columns, serialize_post_summary
+
+
+def seed_posts(count: int, content_chars: int):
+    db = SessionLocal()
+    try:
+        paragraph = "FastAPI와 SQLAlchemy로 만든 게시판의 응답 직렬화 비용을 측정합니다. "
+        content = (paragraph * (content_chars // len(paragraph) + 1))[:content_chars]
+        db.execute(insert(Post), [
+            {
+                "title": f"벤치마크 게시글 {i}",
+                "content": content,
+                "tags": ["Python", "FastAPI"],
+                "url": f"https://example.com/posts/{i}",
+                "thumbnail_url": f"https://example.com/thumbnails/{i}.png",
+                "password_hash": "x" * 60,
+                "views": i,
+                "comment_count": i % 7,
+            }
+            for i in range(count)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+def legacy_query(db, limit: int):
+    return db.query(Post).order_by(Post.created_at.desc(), Post.id.desc()).limit(limit).all()
+
+
+def legacy_serialize(rows) -> bytes:
+    # 변경 전 방식: 필드별 dict를 만든 뒤 FastAPI 기본 응답 경로(jsonable_encoder + JSONResponse)로 렌더링
+    posts = [
+        {
+            "id": post.id,
+            "title": post.title,
+            "content": post.content,
+            "createdAt": post.created_at.isoformat() + 'Z',
+            "views": post.views,
+            "tags": post.tags,
+            "url": post.url,
+            "thumbnailUrl": post.thumbnail_url,
+            "commentCount": post.comment_count,
+        }
+        for post in rows
+    ]
+    return JSONResponse(jsonable_encoder({"posts": posts, "has_next": True})).body
+
+
+def projection_query(view: str):
+    def run(db, limit: int):
+        return (
+            db.query(*post_summary_columns(view))
+            .order_by(Post.created_at.desc(), Post.id.desc())
+            .limit(limit)
+            .all()
+        )
+    return run
+
+
+def projection_serialize(view: str):
+    def run(rows) -> bytes:
+        return encode_json({"posts": [serialize_post_summary(row, view) for row in rows], "has_next": True})
+    return run
+
+
+def measure(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시글 목록 직렬화 벤치마크")
+    parser.add_argument("--posts", type=int, default=100)
+    parser.add_argument("--content-chars", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    engine.echo = False
+    run_migrations(engine)
+    seed_posts(args.posts, args.content_chars)
+
+    variants = [
+        ("legacy", legacy_query, legacy_serialize),
+        ("projection", projection_query("full"), projection_serialize("full")),
+        ("excerpt", projection_query("excerpt"), projection_serialize("excerpt")),
+    ]
+    print(f"page of {args.posts}, content {args.content_chars} chars, median of {args.repeat}")
+    print(f"{'variant':>10} | {'encode ms':>9} | {'query+encode ms':>15} | {'bytes':>8}")
+    db = SessionLocal()
+    try:
+        for name, query, serialize in variants:
+            rows = query(db, args.posts)
+            body = serialize(rows)
+            encode_ms = measure(lambda: serialize(rows), args.repeat)
+            # 매번 새 세션으로 조회해서 identity map 재사용 효과를 제외
+            def end_to_end():
+                session = SessionLocal()
+                try:
+                    serialize(query(session, args.posts))
+                finally:
+                    session.close()
+            total_ms = measure(end_to_end, args.repeat)
+            print(f"{name:>10} | {encode_ms:>9.3f} | {total_ms:>15.3f} | {len(body):>8}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
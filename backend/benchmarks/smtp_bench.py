@@ -0,0 +1,69 @@
+"""
+주간 다이제스트 SMTP 발송 벤치마크: 수신자마다 새 연결(기존 방식) vs BulkMailer(세션 재사용)
+
+사용법 (backend 디렉터리에서 실행):
+    python -m benchmarks.smtp_bench [--recipients 300] [--pool-size 3] [--connect-latency 0.05]
+
+로컬 SMTP 대역 서버(benchmarks.fake_servers.FakeSMTPServer)에 발송하고 초당 발송 수를 출력합니다.
+세션 연결/인증 지연은 실제 SMTP 서버의 TLS 핸드셰이크 + 로그인 비용을 흉내낸 값입니다.
+DATABASE_URL이 없으면 임시 SQLite 파일을 사용합니다 (services.email_service import 시 DB 엔진을 만듦).
+"""
+import argparse
+import os
+import smtplib
+import tempfile
+import time
+
+if not os.getenv("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/smtp_bench.db"
+
+from benchmarks.fake_servers import FakeSMTPServer
+from services.bulk_mailer import BulkMailer
+from services.email_service import EmailService
+
+
+def legacy_send(server: FakeSMTPServer, messages):
+    # 변경 전 방식: 수신자마다 연결 + 로그인 (대역 서버에는 STARTTLS가 없어 생략)
+    for recipient, message in messages:
+        with smtplib.SMTP(server.host, server.port) as connection:
+            connection.login("bench", "password")
+            connection.send_message(message, to_addrs=[recipient])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SMTP 일괄 발송 벤치마크")
+    parser.add_argument("--recipients", type=int, default=300)
+    parser.add_argument("--pool-size", type=int, default=3)
+    parser.add_argument("--connect-latency", type=float, default=0.05)
+    parser.add_argument("--auth-latency", type=float, default=0.05)
+    parser.add_argument("--message-latency", type=float, default=0.005)
+    parser.add_argument("--drop-after", type=int, default=0, help="세션당 N통 후 서버가 연결을 끊음")
+    args = parser.parse_args()
+
+    service = EmailService()
+    service.sender_email = "bench@example.com"
+    html_content = service.create_email_html([{"title": "벤치마크 게시글"}], "2025년 01월 06일", "2025년 01월 12일")
+    messages = [
+        (f"user{i}@example.com", service._build_message(f"user{i}@example.com", html_content, "시작", "끝"))
+        for i in range(args.recipients)
+    ]
+
+    for name in ("legacy", "bulk"):
+        server = FakeSMTPServer(args.connect_latency, args.auth_latency, args.message_latency, args.drop_after).start()
+        started = time.perf_counter()
+        if name == "legacy":
+            legacy_send(server, messages)
+            failed = 0
+        else:
+            mailer = BulkMailer(server.host, server.port, "bench", "password", use_tls=False, pool_size=args.pool_size)
+            failed = sum(1 for result in mailer.send(messages) if not result.success)
+        elapsed = time.perf_counter() - started
+        server.stop()
+        print(
+            f"{name:>6}: {len(server.delivered)}통 / {elapsed:.2f}s = {len(server.delivered) / elapsed:.1f} msg/s "
+            f"(연결 {server.connection_count}회, 실패 {failed})"
+        )
+
+
+if __name__ == "__main__":
+    main()
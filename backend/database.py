@@ -2,15 +2,102 @@ import os
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
+from services.metrics import metrics
+
 # .env 파일 자동 로드
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL 환경변수가 설정되어 있지 않습니다.")
+# 읽기 전용 복제본 (선택, 없으면 모든 조회도 주 DB 사용)
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+
+# 커넥션 풀 설정 (워커 프로세스마다 최대 DB_POOL_SIZE + DB_MAX_OVERFLOW개 연결)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+# 풀이 가득 찼을 때 연결을 기다리는 최대 시간 (초)
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+# MySQL wait_timeout보다 짧게 두어 서버가 끊은 연결을 재사용하지 않도록 함 (초)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# 연결을 꺼낼 때 살아 있는지 확인 (장애 조치/재시작 후 첫 요청 실패 방지)
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+# 모든 SQL을 로그로 출력 (개발용, 느린 요청만 보려면 SLOW_REQUEST_LOG_MS 사용)
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+# true면 게시글/댓글 API가 비동기 드라이버(AsyncSession)로 DB에 접근 (false면 동기 세션 + 스레드풀)
+DB_ASYNC = os.getenv("DB_ASYNC", "false").lower() == "true"
+
+# 동기 URL의 DB 종류별 비동기 드라이버 (mysql+pymysql → mysql+aiomysql)
+ASYNC_DRIVERS = {"mysql": "aiomysql", "sqlite": "aiosqlite"}
+
+
+def engine_options(url: URL) -> dict:
+    options = {
+        "echo": DB_ECHO,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "pool_recycle": DB_POOL_RECYCLE,
+    }
+    # SQLite(로컬 검사/벤치마크용)는 드라이버 기본 풀을 그대로 사용
+    if url.get_backend_name() != "sqlite":
+        options.update(pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW, pool_timeout=DB_POOL_TIMEOUT)
+    return options
+
+
+def create_db_engine(url: str) -> Engine:
+    engine = create_engine(url, **engine_options(make_url(url)))
+    # SQL 실행 횟수/시간을 요청별로 집계 (/metrics)
+    metrics.instrument_engine(engine)
+    return engine
+
+
+def to_async_url(url: str) -> URL:
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise RuntimeError(f"DB_ASYNC를 지원하지 않는 DB입니다: {parsed.get_backend_name()}")
+    return parsed.set(drivername=f"{parsed.get_backend_name()}+{driver}")
+
+
+def create_async_db_engine(url: str) -> AsyncEngine:
+    async_url = to_async_url(url)
+    engine = create_async_engine(async_url, **engine_options(async_url))
+    metrics.instrument_engine(engine.sync_engine)
+    return engine
+
 
 # SQLAlchemy 엔진 및 세션 생성
-engine = create_engine(DATABASE_URL, echo=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
\ No newline at end of file
+engine = create_db_engine(DATABASE_URL)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# 조회 전용 세션 (복제본이 없으면 주 DB)
+replica_engine = create_db_engine(DATABASE_REPLICA_URL) if DATABASE_REPLICA_URL else engine
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+
+
+# 비동기 세션 (DB_ASYNC=true일 때만 생성, 마이그레이션/스케줄러/그 밖의 API는 계속 동기 엔진 사용)
+async_engine = create_async_db_engine(DATABASE_URL) if DB_ASYNC else None
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False) if DB_ASYNC else None
+async_replica_engine = (
+    create_async_db_engine(DATABASE_REPLICA_URL) if DB_ASYNC and DATABASE_REPLICA_URL else async_engine
+)
+AsyncReadSessionLocal = async_sessionmaker(async_replica_engine, autoflush=False) if DB_ASYNC else None
+
+
+def has_replica() -> bool:
+    return replica_engine is not engine
+
+
+def is_replica_bind(bind: Engine) -> bool:
+    """세션이 연결된 엔진이 복제본인지 (비동기 세션은 내부 동기 엔진으로 비교)"""
+    if not has_replica():
+        return False
+    return bind is replica_engine or (async_replica_engine is not None and bind is async_replica_engine.sync_engine)
+
+
+async def dispose_async_engines():
+    for async_db_engine in {async_engine, async_replica_engine} - {None}:
+        await async_db_engine.dispose()
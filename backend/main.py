@@ -4,7 +4,19 @@ from api.posts import router as posts_router
 from api.comments import router as comments_router
 from api.openai import router as openai_router
 from api.emails import router as emails_router
+from api.search import router as search_router
+from api.tags import router as tags_router
+from api.metrics import router as metrics_router
 from scheduler.scheduler import email_scheduler
+from database import engine, dispose_async_engines
+from migrations import run_migrations
+from services.view_counter import view_counter
+from services.password_hasher import password_hasher
+from services.openai_client import openai_gateway
+from services.page_fetcher import page_fetcher
+from services.email_jobs import email_job_runner
+from services.metrics import MetricsMiddleware
+from services.read_routing import ReadYourWritesMiddleware
 from dotenv import load_dotenv
 from contextlib import asynccontextmanager
 
@@ -14,10 +26,22 @@ load_dotenv()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("[App] Tech Talk 애플리케이션이 시작되었습니다.")
+    # 적용되지 않은 스키마 마이그레이션 실행
+    run_migrations(engine)
     email_scheduler.start()
     yield
     print("[App] Tech Talk 애플리케이션이 종료되었습니다.")
     email_scheduler.stop()
+    email_job_runner.shutdown()
+    # 아직 반영되지 않은 조회수를 종료 전에 반영
+    try:
+        view_counter.flush()
+    except Exception as e:
+        print(f"[App] 조회수 반영 실패: {e}")
+    password_hasher.shutdown()
+    await openai_gateway.aclose()
+    await page_fetcher.aclose()
+    await dispose_async_engines()
 
 app = FastAPI(lifespan=lifespan)
 
@@ -30,8 +54,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 처리 시간 / SQL 개수 / DB 시간 기록 (GET /metrics)
+app.add_middleware(MetricsMiddleware)
+
+# 쓰기 직후 같은 클라이언트의 조회는 복제본 대신 주 DB로 (DATABASE_REPLICA_URL 설정 시)
+app.add_middleware(ReadYourWritesMiddleware)
+
 # 라우터 등록
 app.include_router(posts_router)
 app.include_router(comments_router)
 app.include_router(openai_router)
 app.include_router(emails_router)
+app.include_router(search_router)
+app.include_router(tags_router)
+app.include_router(metrics_router)
+
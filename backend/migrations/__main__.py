@@ -0,0 +1,29 @@
+"""
+스키마 마이그레이션 실행/상태 확인
+
+사용법 (backend 디렉터리에서 실행):
+    python -m migrations            # 적용되지 않은 마이그레이션 실행
+    python -m migrations status     # 버전별 적용 여부 출력
+
+애플리케이션 시작 시(lifespan)에도 자동으로 실행됩니다.
+"""
+import sys
+
+from database import engine
+from migrations import migration_status, run_migrations
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else "upgrade"
+    if command == "status":
+        for item in migration_status(engine):
+            print(f"{item['version']:04d}_{item['name']}: {'적용됨' if item['applied'] else '대기'}")
+    elif command == "upgrade":
+        run_migrations(engine)
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
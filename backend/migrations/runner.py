@@ -0,0 +1,129 @@
+import importlib
+import pkgutil
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from types import ModuleType
+from typing import List
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+
+from . import versions
+
+# 여러 워커가 동시에 시작해도 마이그레이션은 한 번만 실행되도록 잡는 MySQL 잠금 이름/대기 시간(초)
+MIGRATION_LOCK_NAME = "tech_talk_schema_migration"
+MIGRATION_LOCK_TIMEOUT = 60
+
+_metadata = MetaData()
+schema_version = Table(
+    "schema_version",
+    _metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("name", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False, default=datetime.utcnow),
+)
+
+
+@dataclass
+class Migration:
+    version: int
+    name: str
+    module: ModuleType
+
+
+def discover() -> List[Migration]:
+    """
+    migrations/versions/m0001_xxx.py 형식의 모듈을 버전 순으로 반환
+    각 모듈은 upgrade(conn) 함수를 가짐
+    """
+    migrations = []
+    for info in pkgutil.iter_modules(versions.__path__):
+        if not info.name.startswith("m"):
+            continue
+        version_text, _, name = info.name[1:].partition("_")
+        if not version_text.isdigit():
+            continue
+        module = importlib.import_module(f"{versions.__name__}.{info.name}")
+        migrations.append(Migration(int(version_text), name, module))
+    migrations.sort(key=lambda migration: migration.version)
+    if len({migration.version for migration in migrations}) != len(migrations):
+        raise RuntimeError("마이그레이션 버전이 중복되었습니다.")
+    return migrations
+
+
+# 마이그레이션 작성용 헬퍼 (모든 마이그레이션은 다시 실행해도 안전하도록 존재 여부를 먼저 확인)
+def has_table(conn: Connection, table: str) -> bool:
+    return inspect(conn).has_table(table)
+
+
+def has_column(conn: Connection, table: str, column: str) -> bool:
+    return any(info["name"] == column for info in inspect(conn).get_columns(table))
+
+
+def has_index(conn: Connection, table: str, index: str) -> bool:
+    return any(info["name"] == index for info in inspect(conn).get_indexes(table))
+
+
+def create_index(conn: Connection, table: str, index: str, columns: List[str], unique: bool = False):
+    if has_index(conn, table, index):
+        return
+    conn.execute(text(f"CREATE {'UNIQUE ' if unique else ''}INDEX {index} ON {table} ({', '.join(columns)})"))
+    print(f"[Migration] 인덱스 생성: {table}.{index} ({', '.join(columns)})")
+
+
+@contextmanager
+def _migration_lock(engine: Engine):
+    if engine.dialect.name != "mysql":
+        yield
+        return
+    with engine.connect() as conn:
+        acquired = conn.execute(
+            text("SELECT GET_LOCK(:name, :timeout)"),
+            {"name": MIGRATION_LOCK_NAME, "timeout": MIGRATION_LOCK_TIMEOUT},
+        ).scalar()
+        if acquired != 1:
+            raise RuntimeError("마이그레이션 잠금을 얻지 못했습니다.")
+        try:
+            yield
+        finally:
+            conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": MIGRATION_LOCK_NAME})
+
+
+def _applied_versions(engine: Engine) -> set:
+    with engine.begin() as conn:
+        _metadata.create_all(conn, checkfirst=True)
+        return set(conn.execute(select(schema_version.c.version)).scalars())
+
+
+def migration_status(engine: Engine) -> List[dict]:
+    applied = _applied_versions(engine)
+    return [
+        {"version": migration.version, "name": migration.name, "applied": migration.version in applied}
+        for migration in discover()
+    ]
+
+
+def run_migrations(engine: Engine) -> List[int]:
+    """
+    적용되지 않은 마이그레이션을 버전 순으로 실행하고 적용한 버전 목록을 반환
+    MySQL은 DDL이 자동 커밋되므로 중간에 실패하면 해당 버전은 기록되지 않고, 다음 실행 때 다시 시도됨
+    """
+    applied_now = []
+    with _migration_lock(engine):
+        applied = _applied_versions(engine)
+        for migration in discover():
+            if migration.version in applied:
+                continue
+            print(f"[Migration] {migration.version:04d}_{migration.name} 적용 시작")
+            with engine.begin() as conn:
+                migration.module.upgrade(conn)
+                conn.execute(schema_version.insert().values(
+                    version=migration.version,
+                    name=migration.name,
+                    applied_at=datetime.utcnow(),
+                ))
+            applied_now.append(migration.version)
+    if applied_now:
+        print(f"[Migration] 마이그레이션 {len(applied_now)}건 적용 완료 (현재 버전 {applied_now[-1]})")
+    return applied_now
@@ -0,0 +1,10 @@
+"""
+post, comment 테이블 생성 (기존에 create_all로 만들어진 DB는 건너뜀)
+"""
+from models.base import Base
+from models.comment import Comment
+from models.post import Post
+
+
+def upgrade(conn):
+    Base.metadata.create_all(conn, tables=[Post.__table__, Comment.__table__], checkfirst=True)
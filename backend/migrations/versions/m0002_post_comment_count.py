@@ -0,0 +1,16 @@
+"""
+post.comment_count 컬럼 추가 후 comment 테이블 기준으로 채움
+(이미 컬럼이 있으면 scripts.backfill_comment_count로 관리되므로 건너뜀)
+"""
+from sqlalchemy import text
+
+from migrations.runner import has_column
+
+
+def upgrade(conn):
+    if has_column(conn, "post", "comment_count"):
+        return
+    conn.execute(text("ALTER TABLE post ADD COLUMN comment_count INTEGER NOT NULL DEFAULT 0"))
+    conn.execute(text(
+        "UPDATE post SET comment_count = (SELECT COUNT(*) FROM comment WHERE comment.post_id = post.id)"
+    ))
@@ -0,0 +1,20 @@
+"""
+URL 분석 캐시, Confluence 아웃박스/페이지 매핑, 주간 다이제스트 스냅샷 테이블 생성
+"""
+from models.analysis_cache import AnalysisCache
+from models.base import Base
+from models.confluence import ConfluenceOutbox, ConfluencePage
+from models.weekly_digest import WeeklyDigest
+
+
+def upgrade(conn):
+    Base.metadata.create_all(
+        conn,
+        tables=[
+            AnalysisCache.__table__,
+            ConfluenceOutbox.__table__,
+            ConfluencePage.__table__,
+            WeeklyDigest.__table__,
+        ],
+        checkfirst=True,
+    )
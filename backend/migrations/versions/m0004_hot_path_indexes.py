@@ -0,0 +1,11 @@
+"""
+목록/상세/댓글/다이제스트 조회에 쓰는 복합 인덱스 추가
+- comment (post_id, created_at, id): 게시글별 댓글을 작성순으로 조회
+- post (created_at, id): 최신순 목록 (커서 페이지네이션), 주간 게시글 구간 조회
+"""
+from migrations.runner import create_index
+
+
+def upgrade(conn):
+    create_index(conn, "comment", "ix_comment_post_id_created_at_id", ["post_id", "created_at", "id"])
+    create_index(conn, "post", "ix_post_created_at_id", ["created_at", "id"])
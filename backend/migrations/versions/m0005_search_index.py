@@ -0,0 +1,10 @@
+"""
+게시글/댓글 검색용 역색인 테이블 생성
+기존 게시글은 python -m scripts.rebuild_search_index로 색인
+"""
+from models.base import Base
+from models.search import SearchDocument, SearchPosting
+
+
+def upgrade(conn):
+    Base.metadata.create_all(conn, tables=[SearchPosting.__table__, SearchDocument.__table__], checkfirst=True)
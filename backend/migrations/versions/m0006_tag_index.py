@@ -0,0 +1,54 @@
+"""
+태그 테이블(tag)과 게시글-태그 연결 테이블(post_tag) 생성 후 기존 post.tags로 채움
+"""
+from sqlalchemy import insert, select, text
+
+from models.base import Base
+from models.post import Post
+from models.tag import PostTag, Tag
+from services.tag_index import normalize_tags, tag_key
+
+BATCH_SIZE = 500
+
+
+def upgrade(conn):
+    Base.metadata.create_all(conn, tables=[Tag.__table__, PostTag.__table__], checkfirst=True)
+    if conn.execute(select(PostTag.post_id).limit(1)).first() is not None:
+        return
+
+    tag_ids = {}
+
+    def tag_id_of(name):
+        # 대소문자만 다른 태그는 같은 태그 (처음 나온 표기를 이름으로 사용)
+        key = tag_key(name)
+        if key not in tag_ids:
+            existing = conn.execute(select(Tag.id).where(Tag.normalized_name == key)).scalar()
+            if existing is None:
+                existing = conn.execute(
+                    insert(Tag).values(name=name, normalized_name=key, post_count=0)
+                ).inserted_primary_key[0]
+            tag_ids[key] = existing
+        return tag_ids[key]
+
+    last_id = 0
+    while True:
+        posts = conn.execute(
+            select(Post.id, Post.created_at, Post.tags)
+            .where(Post.id > last_id)
+            .order_by(Post.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not posts:
+            break
+        rows = [
+            {"tag_id": tag_id, "post_id": post.id, "created_at": post.created_at}
+            for post in posts
+            for tag_id in {tag_id_of(name) for name in normalize_tags(post.tags)}
+        ]
+        if rows:
+            conn.execute(insert(PostTag), rows)
+        last_id = posts[-1].id
+
+    conn.execute(text(
+        "UPDATE tag SET post_count = (SELECT COUNT(*) FROM post_tag WHERE post_tag.tag_id = tag.id)"
+    ))
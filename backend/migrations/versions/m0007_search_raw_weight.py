@@ -0,0 +1,14 @@
+"""
+search_posting.raw_weight 컬럼 추가 (게시글/댓글 변경 시 전체 재색인 대신 변경분만 반영하기 위함)
+기존 행은 weight로 채움 (상한에 걸린 토큰은 python -m scripts.rebuild_search_index로 정확한 값으로 다시 계산)
+"""
+from sqlalchemy import text
+
+from migrations.runner import has_column
+
+
+def upgrade(conn):
+    if has_column(conn, "search_posting", "raw_weight"):
+        return
+    conn.execute(text("ALTER TABLE search_posting ADD COLUMN raw_weight INTEGER NOT NULL DEFAULT 0"))
+    conn.execute(text("UPDATE search_posting SET raw_weight = weight"))
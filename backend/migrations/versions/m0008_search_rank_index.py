@@ -0,0 +1,9 @@
+"""
+search_posting (term, weight, post_id) 인덱스 추가
+검색 시 토큰별 역색인을 점수 순으로 필요한 만큼만 읽기 위함 (전체 역색인 GROUP BY 제거)
+"""
+from migrations.runner import create_index
+
+
+def upgrade(conn):
+    create_index(conn, "search_posting", "ix_search_posting_term_weight", ["term", "weight", "post_id"])
@@ -0,0 +1,9 @@
+"""
+confluence_outbox (post_id, status, id) 인덱스 추가
+아웃박스 처리 대상 조회 시 같은 게시글에 먼저 기록된 미완료 항목이 있는지 확인하기 위함
+"""
+from migrations.runner import create_index
+
+
+def upgrade(conn):
+    create_index(conn, "confluence_outbox", "ix_confluence_outbox_post_status_id", ["post_id", "status", "id"])
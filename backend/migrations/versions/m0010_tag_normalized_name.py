@@ -0,0 +1,41 @@
+"""
+tag.normalized_name 컬럼 추가 (태그를 대소문자 구분 없이 비교하기 위함)
+기존에 대소문자만 다르게 따로 만들어진 태그는 id가 가장 작은 태그로 합친 뒤 게시글 수를 다시 계산
+"""
+from sqlalchemy import text
+
+from migrations.runner import create_index, has_column
+from services.tag_index import tag_key
+
+
+def upgrade(conn):
+    if not has_column(conn, "tag", "normalized_name"):
+        conn.execute(text("ALTER TABLE tag ADD COLUMN normalized_name VARCHAR(100) NOT NULL DEFAULT ''"))
+
+        groups = {}
+        for tag_id, name in conn.execute(text("SELECT id, name FROM tag ORDER BY id")):
+            groups.setdefault(tag_key(name), []).append(tag_id)
+
+        for key, (kept_id, *duplicate_ids) in groups.items():
+            for duplicate_id in duplicate_ids:
+                # 이미 남길 태그가 달린 게시글은 연결만 지우고, 나머지는 남길 태그로 옮김
+                conn.execute(text(
+                    "DELETE FROM post_tag WHERE tag_id = :duplicate_id AND post_id IN "
+                    "(SELECT post_id FROM (SELECT post_id FROM post_tag WHERE tag_id = :kept_id) AS kept)"
+                ), {"duplicate_id": duplicate_id, "kept_id": kept_id})
+                conn.execute(
+                    text("UPDATE post_tag SET tag_id = :kept_id WHERE tag_id = :duplicate_id"),
+                    {"duplicate_id": duplicate_id, "kept_id": kept_id},
+                )
+                conn.execute(text("DELETE FROM tag WHERE id = :duplicate_id"), {"duplicate_id": duplicate_id})
+            conn.execute(
+                text("UPDATE tag SET normalized_name = :key WHERE id = :kept_id"),
+                {"key": key, "kept_id": kept_id},
+            )
+
+        if any(len(tag_ids) > 1 for tag_ids in groups.values()):
+            conn.execute(text(
+                "UPDATE tag SET post_count = (SELECT COUNT(*) FROM post_tag WHERE post_tag.tag_id = tag.id)"
+            ))
+
+    create_index(conn, "tag", "ux_tag_normalized_name", ["normalized_name"], unique=True)
@@ -0,0 +1,13 @@
+"""
+weekly_digest.version / built_version 컬럼 추가 (게시글 변경 시 스냅샷을 바로 다시 만들지 않고 다음 조회 때 다시 만들기 위함)
+기존 스냅샷은 둘 다 0으로 두어 최신 상태로 취급
+"""
+from sqlalchemy import text
+
+from migrations.runner import has_column
+
+
+def upgrade(conn):
+    for column in ("version", "built_version"):
+        if not has_column(conn, "weekly_digest", column):
+            conn.execute(text(f"ALTER TABLE weekly_digest ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0"))
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, DateTime, JSON
+from datetime import datetime
+from .base import Base
+
+class AnalysisCache(Base):
+    __tablename__ = "analysis_cache"
+
+    # sha256(정규화된 URL + 본문 텍스트 해시), URL만으로 찾는 항목은 sha256("url\n" + 정규화된 URL)
+    cache_key = Column(String(64), primary_key=True)
+    url = Column(String(500), nullable=False)
+    result = Column(JSON, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    expires_at = Column(DateTime, nullable=False)
@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, String
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, String, Index
 from datetime import datetime
 from .base import Base
 
 class Comment(Base):
     __tablename__ = "comment"
+    __table_args__ = (
+        # 게시글별 댓글을 작성순으로 조회
+        Index("ix_comment_post_id_created_at_id", "post_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     post_id = Column(Integer, ForeignKey("post.id"), nullable=False)
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index
+from datetime import datetime
+from .base import Base
+
+class ConfluenceOutbox(Base):
+    """게시글 생성/수정/삭제를 Confluence에 반영하기 위한 아웃박스 (게시글과 같은 트랜잭션에서 기록)"""
+    __tablename__ = "confluence_outbox"
+    __table_args__ = (
+        Index("ix_confluence_outbox_status_id", "status", "id"),
+        # 같은 게시글의 앞선 미완료 항목 확인용
+        Index("ix_confluence_outbox_post_status_id", "post_id", "status", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    post_id = Column(Integer, nullable=False)
+    action = Column(String(10), nullable=False)  # create / update / delete
+    payload = Column(JSON)
+    status = Column(String(10), nullable=False, default="pending")  # pending / done / failed
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_error = Column(Text)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+class ConfluencePage(Base):
+    """게시글과 Confluence 블로그 포스트의 매핑 (수정/삭제 및 중복 생성 방지용)"""
+    __tablename__ = "confluence_page"
+
+    post_id = Column(Integer, primary_key=True)
+    page_id = Column(String(50), nullable=False)
+    version = Column(Integer, nullable=False, default=1)
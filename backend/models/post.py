@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .comment import Comment
@@ -6,6 +6,10 @@ from .base import Base
 
 class Post(Base):
     __tablename__ = "post"
+    __table_args__ = (
+        # 최신순 목록 / 커서 페이지네이션 / 주간 구간 조회
+        Index("ix_post_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     title = Column(String(255), nullable=False)
@@ -16,6 +20,8 @@ class Post(Base):
     url = Column(String(500))
     thumbnail_url = Column(String(500))
     password_hash = Column(String(255), nullable=False)
+    # 댓글 수 (댓글 생성/삭제 시 같은 트랜잭션에서 갱신)
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
     
     # Relationship
     comments = relationship(
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from datetime import datetime
+from .base import Base
+
+class SearchPosting(Base):
+    """검색 역색인: 토큰 → 게시글 (제목/태그/본문/댓글 가중치 합)"""
+    __tablename__ = "search_posting"
+    __table_args__ = (
+        # 게시글 단위 재색인/삭제
+        Index("ix_search_posting_post_id", "post_id"),
+        # 토큰별 점수 순 조회 (검색 결과를 점수 순으로 LIMIT만큼만 읽음)
+        Index("ix_search_posting_term_weight", "term", "weight", "post_id"),
+    )
+
+    term = Column(String(64), primary_key=True)
+    post_id = Column(Integer, primary_key=True)
+    # 검색 점수에 쓰는 가중치 (raw_weight를 SEARCH_MAX_TERM_WEIGHT로 제한한 값)
+    weight = Column(Integer, nullable=False)
+    # 제한 전 가중치 합 (댓글 추가/삭제 시 해당 댓글의 가중치만 더하고 빼기 위해 보관)
+    raw_weight = Column(Integer, nullable=False, default=0)
+
+class SearchDocument(Base):
+    """색인된 게시글 목록 (재색인 시 게시글 단위 잠금 및 삭제된 게시글 정리용)"""
+    __tablename__ = "search_document"
+
+    post_id = Column(Integer, primary_key=True)
+    term_count = Column(Integer, nullable=False, default=0)
+    indexed_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
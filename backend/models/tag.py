@@ -0,0 +1,31 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from .base import Base
+
+class Tag(Base):
+    __tablename__ = "tag"
+    __table_args__ = (
+        # 태그 목록 (게시글 수 순)
+        Index("ix_tag_post_count", "post_count"),
+        # 대소문자를 구분하지 않는 태그 조회
+        Index("ux_tag_normalized_name", "normalized_name", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    # 처음 쓰인 표기 (태그 목록에 표시)
+    name = Column(String(100), nullable=False, unique=True)
+    # 비교용 이름 (services.tag_index.tag_key, 소문자)
+    normalized_name = Column(String(100), nullable=False)
+    # 이 태그가 달린 게시글 수 (게시글 생성/수정/삭제 시 같은 트랜잭션에서 갱신)
+    post_count = Column(Integer, nullable=False, default=0)
+
+class PostTag(Base):
+    """게시글-태그 연결 (태그별 최신순 목록을 위해 게시글 작성 시각을 함께 저장)"""
+    __tablename__ = "post_tag"
+    __table_args__ = (
+        Index("ix_post_tag_tag_id_created_at_post_id", "tag_id", "created_at", "post_id"),
+        Index("ix_post_tag_post_id", "post_id"),
+    )
+
+    tag_id = Column(Integer, primary_key=True)
+    post_id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime, nullable=False)
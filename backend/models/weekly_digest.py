@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, JSON
+from datetime import datetime
+from .base import Base
+
+class WeeklyDigest(Base):
+    __tablename__ = "weekly_digest"
+
+    # ISO 주차 (예: "2025-W02")
+    week_key = Column(String(8), primary_key=True)
+    # 해당 주 월요일
+    week_start = Column(Date, nullable=False)
+    # 해당 주 게시글 요약 목록 (작성일 역순)
+    entries = Column(JSON, nullable=False)
+    # 렌더링된 메일 HTML
+    html = Column(Text, nullable=False)
+    # 해당 주 게시글이 바뀔 때마다 1씩 증가 / 스냅샷을 만들 때 읽은 version (작으면 다음 조회 때 다시 만듦)
+    version = Column(Integer, nullable=False, default=0)
+    built_version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,6 +1,11 @@
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from services.email_service import email_service
+from services.email_jobs import email_job_runner
+from services.view_counter import view_counter, VIEW_COUNT_FLUSH_INTERVAL
+from services.confluence_service import confluence_outbox_worker, CONFLUENCE_OUTBOX_INTERVAL
+from services.analysis_cache import analysis_cache, ANALYSIS_CACHE_EVICT_INTERVAL
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -29,18 +34,76 @@ class EmailScheduler:
             name='스케줄러 상태 로그',
             replace_existing=True
         )
+
+        # 누적된 게시글 조회수를 주기적으로 DB에 반영
+        self.scheduler.add_job(
+            func=self.flush_view_counts_job,
+            trigger=IntervalTrigger(seconds=VIEW_COUNT_FLUSH_INTERVAL),
+            id='view_count_flush',
+            name='게시글 조회수 반영',
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True
+        )
+
+        # Confluence 아웃박스 처리
+        self.scheduler.add_job(
+            func=self.drain_confluence_outbox_job,
+            trigger=IntervalTrigger(seconds=CONFLUENCE_OUTBOX_INTERVAL),
+            id='confluence_outbox',
+            name='Confluence 아웃박스 반영',
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True
+        )
+
+        # URL 분석 캐시의 만료/초과 항목 정리
+        self.scheduler.add_job(
+            func=self.evict_analysis_cache_job,
+            trigger=IntervalTrigger(seconds=ANALYSIS_CACHE_EVICT_INTERVAL),
+            id='analysis_cache_evict',
+            name='URL 분석 캐시 정리',
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True
+        )
     
     def send_weekly_email_job(self):
         try:
             logger.info("[Scheduler] 주간 게시글 요약 이메일 발송 시작")
-            success = email_service.send_weekly_email()
-            if success:
-                logger.info("[Scheduler] 주간 게시글 요약 이메일 발송 완료")
-            else:
-                logger.error("[Scheduler] 주간 게시글 요약 이메일 발송 실패")
+            if not email_service.is_configured():
+                logger.error("[Scheduler] 이메일 설정이 완료되지 않아 발송하지 않습니다.")
+                return
+            # 수동 발송과 같은 작업 큐를 사용해서 동시에 두 번 발송되지 않도록 함
+            job = email_job_runner.submit_weekly()
+            logger.info(f"[Scheduler] 주간 게시글 요약 이메일 발송 작업 등록: {job['jobId']}")
         except Exception as e:
             logger.error(f"[Scheduler] 이메일 발송 중 오류 발생: {str(e)}")
     
+    def flush_view_counts_job(self):
+        try:
+            flushed = view_counter.flush()
+            if flushed:
+                logger.info(f"[Scheduler] 게시글 {flushed}건의 조회수 반영 완료")
+        except Exception as e:
+            logger.error(f"[Scheduler] 조회수 반영 중 오류 발생: {str(e)}")
+    
+    def drain_confluence_outbox_job(self):
+        try:
+            processed = confluence_outbox_worker.drain()
+            if processed:
+                logger.info(f"[Scheduler] Confluence 아웃박스 {processed}건 처리")
+        except Exception as e:
+            logger.error(f"[Scheduler] Confluence 아웃박스 처리 중 오류 발생: {str(e)}")
+    
+    def evict_analysis_cache_job(self):
+        try:
+            deleted = analysis_cache.evict()
+            if deleted:
+                logger.info(f"[Scheduler] URL 분석 캐시 {deleted}건 정리")
+        except Exception as e:
+            logger.error(f"[Scheduler] URL 분석 캐시 정리 중 오류 발생: {str(e)}")
+    
     def log_scheduler_status(self):
         jobs = self.scheduler.get_jobs()
         logger.info(f"[Scheduler] 현재 등록된 작업 수: {len(jobs)}")
@@ -0,0 +1,62 @@
+"""
+post.comment_count 컬럼을 추가(없을 경우)하고 comment 테이블 기준으로 값을 다시 계산합니다.
+
+사용법 (backend 디렉터리에서 실행):
+    python -m scripts.backfill_comment_count [--batch-size 1000]
+
+배포 직후 1회 실행하는 백필 용도이며, 값이 어긋났을 때 복구용으로 다시 실행해도 안전합니다.
+"""
+import argparse
+
+from sqlalchemy import func, inspect, select, text, update
+
+from database import engine
+from models.comment import Comment
+from models.post import Post
+
+
+def ensure_column():
+    columns = {column["name"] for column in inspect(engine).get_columns("post")}
+    if "comment_count" in columns:
+        return
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE post ADD COLUMN comment_count INTEGER NOT NULL DEFAULT 0"))
+    print("[Backfill] post.comment_count 컬럼을 추가했습니다.")
+
+
+def backfill(batch_size: int) -> int:
+    """
+    id 구간 단위로 나눠서 갱신 (한 번에 전체 테이블을 잠그지 않도록)
+    """
+    with engine.connect() as conn:
+        max_id = conn.execute(select(func.max(Post.id))).scalar() or 0
+
+    comment_count = (
+        select(func.count(Comment.id))
+        .where(Comment.post_id == Post.id)
+        .scalar_subquery()
+    )
+    updated = 0
+    for start in range(0, max_id, batch_size):
+        with engine.begin() as conn:
+            result = conn.execute(
+                update(Post)
+                .where(Post.id > start, Post.id <= start + batch_size)
+                .values(comment_count=comment_count)
+            )
+            updated += result.rowcount
+    return updated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="post.comment_count 백필/복구")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    ensure_column()
+    updated = backfill(args.batch_size)
+    print(f"[Backfill] 게시글 {updated}건의 댓글 수를 갱신했습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+라우터가 실행하는 SELECT 쿼리마다 EXPLAIN을 돌려서 전체 테이블 스캔이 있으면 실패합니다.
+
+사용법 (backend 디렉터리에서 실행, 운영 DB가 아닌 검사용 빈 DB를 지정):
+    EXPLAIN_CHECK_DATABASE_URL=mysql+pymysql://user:pw@localhost/tech_talk_explain \\
+        python -m scripts.explain_check [--posts 3000] [--comments-per-post 3]
+
+검사용 DB에 마이그레이션을 적용하고 샘플 데이터를 넣은 뒤, 각 API를 호출하면서 실행된 SELECT를 모아
+EXPLAIN(MySQL) / EXPLAIN QUERY PLAN(SQLite)으로 확인합니다.
+전체 스캔이 하나라도 있으면 종료 코드 1로 끝나므로 CI에서 그대로 사용할 수 있습니다.
+"""
+import argparse
+import os
+import re
+import sys
+from datetime import datetime, timedelta
+
+CHECK_DATABASE_URL = os.getenv("EXPLAIN_CHECK_DATABASE_URL")
+if not CHECK_DATABASE_URL:
+    print("EXPLAIN_CHECK_DATABASE_URL 환경변수에 검사용 DB를 지정해주세요. (데이터를 추가합니다)")
+    sys.exit(2)
+# 앱 모듈을 불러오기 전에 검사용 DB로 바꿔둠
+os.environ["DATABASE_URL"] = CHECK_DATABASE_URL
+# 샘플 데이터 생성 속도를 위해 해싱 비용을 낮춤
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, insert, text
+
+from database import SessionLocal, async_engine, engine
+from main import app
+from migrations import run_migrations
+from models.base import Base
+from models.comment import Comment
+from models.post import Post
+from scripts.rebuild_search_index import reindex_posts
+from services.password_hasher import password_hasher
+from services.tag_index import tag_index
+
+SQLITE_FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+
+
+def seed(posts: int, comments_per_post: int):
+    password_hash = password_hasher.hash("password")
+    now = datetime.utcnow()
+    with engine.begin() as conn:
+        if conn.execute(text("SELECT COUNT(*) FROM post")).scalar():
+            return
+        conn.execute(insert(Post), [
+            {
+                "title": f"게시글 {i}",
+                # topicN은 게시글 1%에만 있는 토큰 (드문 토큰 + 흔한 토큰 조합 검색용)
+                "content": "본문 " * 50 + f"topic{i % 100}",
+                "created_at": now - timedelta(hours=i),
+                "views": 0,
+                "tags": ["Python", "FastAPI"] if i % 3 == 0 else ["Python"],
+                "password_hash": password_hash,
+                "comment_count": comments_per_post,
+            }
+            for i in range(posts)
+        ])
+        post_ids = [row[0] for row in conn.execute(text("SELECT id FROM post"))]
+        conn.execute(insert(Comment), [
+            {
+                "post_id": post_id,
+                "content": "댓글",
+                "created_at": now - timedelta(minutes=j),
+                "password_hash": password_hash,
+            }
+            for post_id in post_ids
+            for j in range(comments_per_post)
+        ])
+    # 검색/태그 색인도 함께 생성
+    reindex_posts(500)
+    db = SessionLocal()
+    try:
+        for post in db.query(Post.id, Post.created_at, Post.tags):
+            tag_index.sync_post(db, post.id, post.created_at, post.tags)
+        db.commit()
+    finally:
+        db.close()
+    if engine.dialect.name == "mysql":
+        with engine.begin() as conn:
+            conn.execute(text("ANALYZE TABLE post, comment, search_posting, search_document, tag, post_tag"))
+
+
+def exercise_routers(client: TestClient):
+    """읽기/쓰기 API를 한 번씩 호출 (외부 서비스가 필요한 분석/메일 발송 API는 제외)"""
+    first = client.get("/posts", params={"limit": 10, "cursor": ""}).json()
+    client.get("/posts", params={"limit": 10, "cursor": first["next_cursor"]})
+    client.get("/posts", params={"limit": 10, "cursor": first["next_cursor"], "with_total": True})
+    client.get("/posts", params={"offset": 20, "limit": 10})
+    post_id = first["posts"][0]["id"]
+    client.get(f"/posts/{post_id}")
+    client.get(f"/comments/{post_id}")
+    for order in ("asc", "desc"):
+        comments = client.get(f"/comments/{post_id}", params={"after": "", "limit": 2, "order": order}).json()
+        client.get(f"/comments/{post_id}", params={"after": comments["next_cursor"], "limit": 2, "order": order})
+    # 흔한 토큰 하나 / 흔한 토큰 여러 개 / 드문 토큰 + 흔한 토큰 (각각 다음 페이지까지)
+    for query in ("본문", "게시글 본문", "topic7 본문"):
+        results = client.get("/search", params={"q": query, "limit": 5}).json()
+        client.get("/search", params={"q": query, "limit": 5, "cursor": results["next_cursor"]})
+
+    created = client.post("/posts", json={"title": "검사", "content": "검사 본문", "tags": [], "password": "password"}).json()
+    token = client.post(f"/posts/{created['id']}/verify-password", json={"password": "password"}).json()["editToken"]
+    client.put(
+        f"/posts/{created['id']}",
+        json={"title": "검사 수정", "content": "검사 본문", "tags": []},
+        headers={"X-Edit-Token": token},
+    )
+    comment = client.post("/comments", json={"postId": created["id"], "content": "댓글", "password": "password"}).json()
+    client.patch(f"/comments/{comment['id']}", json={"content": "수정", "password": "password"})
+    client.request("DELETE", f"/comments/{comment['id']}", json={"password": "password"})
+    client.delete(f"/posts/{created['id']}", headers={"X-Edit-Token": token})
+    client.get("/email/weekly-posts")
+    for params in ({"tag": "Python"}, {"tag": ["Python", "FastAPI"], "tag_mode": "and"}, {"tag": ["Python", "FastAPI"]}):
+        page = client.get("/posts", params={**params, "limit": 10}).json()
+        client.get("/posts", params={**params, "limit": 10, "cursor": page["next_cursor"], "with_total": True})
+    client.get("/tags")
+
+
+def full_scans(conn, statement: str, parameters) -> list:
+    """테이블 전체 스캔 목록 (LIMIT이 걸린 서브쿼리 결과를 읽는 것은 제외)"""
+    tables = set(Base.metadata.tables)
+    if engine.dialect.name == "mysql":
+        rows = conn.exec_driver_sql(f"EXPLAIN {statement}", parameters).mappings().all()
+        return [
+            f"{row['table']} (type=ALL, rows={row['rows']})"
+            for row in rows
+            if row["type"] == "ALL" and row["table"] in tables
+        ]
+    if engine.dialect.name == "sqlite":
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+        return [
+            row[-1]
+            for row in rows
+            if SQLITE_FULL_SCAN.match(row[-1]) and SQLITE_FULL_SCAN.match(row[-1]).group(1) in tables
+        ]
+    raise RuntimeError(f"지원하지 않는 DB입니다: {engine.dialect.name}")
+
+
+def check(posts: int, comments_per_post: int) -> int:
+    """
+    검사용 DB를 준비하고 API 호출 중 실행된 SELECT를 EXPLAIN해서 전체 스캔이 있는 쿼리 수를 반환
+    """
+    engine.echo = False
+    run_migrations(engine)
+    seed(posts, comments_per_post)
+
+    statements = {}
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and not executemany:
+            statements.setdefault(statement, parameters)
+
+    # DB_ASYNC=true면 게시글/댓글 API 쿼리는 비동기 엔진으로 실행되므로 함께 수집
+    engines = [engine] + ([async_engine.sync_engine] if async_engine is not None else [])
+    with TestClient(app) as client:
+        # 시작 시 실행되는 마이그레이션/스키마 조회는 제외하고 API 호출 중인 쿼리만 수집
+        for target in engines:
+            event.listen(target, "before_cursor_execute", capture)
+        try:
+            exercise_routers(client)
+        finally:
+            for target in engines:
+                event.remove(target, "before_cursor_execute", capture)
+
+    failures = 0
+    with engine.connect() as conn:
+        for statement, parameters in statements.items():
+            scans = full_scans(conn, statement, parameters)
+            if scans:
+                failures += 1
+                print(f"[Explain] 전체 스캔: {', '.join(scans)}\n    {' '.join(statement.split())}")
+    print(f"[Explain] 쿼리 {len(statements)}개 검사, 전체 스캔 {failures}개")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="라우터 쿼리 EXPLAIN 검사")
+    parser.add_argument("--posts", type=int, default=10000)
+    parser.add_argument("--comments-per-post", type=int, default=3)
+    args = parser.parse_args()
+    sys.exit(1 if check(args.posts, args.comments_per_post) else 0)
+
+
+if __name__ == "__main__":
+    main()
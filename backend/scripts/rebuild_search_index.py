@@ -0,0 +1,101 @@
+"""
+검색 역색인(search_posting / search_document)을 게시글/댓글 테이블 기준으로 다시 만듭니다.
+
+사용법 (backend 디렉터리에서 실행):
+    python -m scripts.rebuild_search_index [--batch-size 200] [--reset]
+
+게시글을 id 순으로 batch-size개씩 읽어서 색인하므로 전체 데이터를 메모리에 올리지 않으며,
+서비스 중에 실행해도 됩니다 (게시글별로 차이만 반영). 마지막에 삭제된 게시글의 색인을 정리합니다.
+--reset은 기존 색인을 모두 지운 뒤 처음부터 만듭니다 (완료 전까지 검색 결과가 비어 있음).
+"""
+import argparse
+from collections import defaultdict
+
+from sqlalchemy import delete
+
+from database import SessionLocal
+from models.comment import Comment
+from models.post import Post
+from models.search import SearchDocument, SearchPosting
+from services.search_index import search_index
+
+
+def reindex_posts(batch_size: int) -> int:
+    indexed = 0
+    last_id = 0
+    while True:
+        db = SessionLocal()
+        try:
+            posts = (
+                db.query(Post.id, Post.title, Post.content, Post.tags)
+                .filter(Post.id > last_id)
+                .order_by(Post.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not posts:
+                return indexed
+            comments_by_post = defaultdict(list)
+            for row in db.query(Comment.post_id, Comment.content).filter(Comment.post_id.in_([post.id for post in posts])):
+                comments_by_post[row.post_id].append(row.content)
+            search_index.index_batch(db, posts, comments_by_post)
+            db.commit()
+        finally:
+            db.close()
+        indexed += len(posts)
+        last_id = posts[-1].id
+        print(f"[Search] 게시글 {indexed}건 색인 (마지막 id {last_id})")
+
+
+def purge_deleted(batch_size: int) -> int:
+    """
+    색인은 남아 있지만 게시글이 없는 문서를 정리
+    """
+    purged = 0
+    last_id = 0
+    while True:
+        db = SessionLocal()
+        try:
+            document_ids = [
+                row.post_id
+                for row in db.query(SearchDocument.post_id)
+                .filter(SearchDocument.post_id > last_id)
+                .order_by(SearchDocument.post_id)
+                .limit(batch_size)
+            ]
+            if not document_ids:
+                return purged
+            existing = {row.id for row in db.query(Post.id).filter(Post.id.in_(document_ids))}
+            for post_id in document_ids:
+                if post_id not in existing:
+                    search_index.remove_post(db, post_id)
+                    purged += 1
+            db.commit()
+        finally:
+            db.close()
+        last_id = document_ids[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검색 역색인 재생성")
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--reset", action="store_true", help="기존 색인을 모두 지우고 다시 생성")
+    args = parser.parse_args()
+
+    if args.reset:
+        db = SessionLocal()
+        try:
+            db.execute(delete(SearchPosting))
+            db.execute(delete(SearchDocument))
+            db.commit()
+        finally:
+            db.close()
+        print("[Search] 기존 색인을 삭제했습니다.")
+
+    indexed = reindex_posts(args.batch_size)
+    purged = purge_deleted(args.batch_size)
+    print(f"[Search] 색인 완료: 게시글 {indexed}건, 삭제된 게시글 정리 {purged}건")
+
+
+if __name__ == "__main__":
+    main()
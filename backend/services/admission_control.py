@@ -0,0 +1,129 @@
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from services.metrics import metrics
+
+# false면 요청 제한을 모두 끔 (부하 테스트 등 한 IP에서 대량 요청을 보낼 때)
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+# 클라이언트별 버킷을 이 개수 이상 기억하면 가득 찬(오래 요청이 없던) 버킷부터 정리
+RATE_LIMIT_MAX_CLIENTS = int(os.getenv("RATE_LIMIT_MAX_CLIENTS", "10000"))
+
+
+@dataclass(frozen=True)
+class AdmissionPolicy:
+    """
+    라우트 클래스별 제한
+    - per_minute / burst: 클라이언트(IP)별 토큰 버킷 (분당 per_minute개 충전, 최대 burst개까지 연속 허용)
+    - concurrency: 워커(프로세스)별로 동시에 처리할 최대 요청 수 (초과 시 대기하지 않고 바로 거절, 워커 N개면 전체 최대 N배)
+    값이 0이면 해당 제한을 사용하지 않음
+    """
+    per_minute: float
+    burst: int
+    concurrency: int
+
+
+def _policy(route_class: str, per_minute: float, burst: int, concurrency: int) -> AdmissionPolicy:
+    prefix = route_class.upper()
+    return AdmissionPolicy(
+        per_minute=float(os.getenv(f"RATE_LIMIT_{prefix}_PER_MINUTE", str(per_minute))),
+        burst=int(os.getenv(f"RATE_LIMIT_{prefix}_BURST", str(burst))),
+        concurrency=int(os.getenv(f"CONCURRENCY_LIMIT_{prefix}", str(concurrency))),
+    )
+
+
+# 라우트 클래스별 기본값 (RATE_LIMIT_<클래스>_PER_MINUTE, RATE_LIMIT_<클래스>_BURST, CONCURRENCY_LIMIT_<클래스>로 변경)
+# - analyze: URL/게시글 분석 (OpenAI 호출, 페이지 다운로드)
+# - password: bcrypt를 사용하는 쓰기 API (게시글/댓글 작성·수정·삭제, 비밀번호 확인)
+# - email: 메일 발송 작업 등록
+ADMISSION_POLICIES: Dict[str, AdmissionPolicy] = {
+    "analyze": _policy("analyze", per_minute=10, burst=5, concurrency=16),
+    "password": _policy("password", per_minute=30, burst=10, concurrency=16),
+    "email": _policy("email", per_minute=2, burst=2, concurrency=0),
+}
+
+
+class AdmissionRejected(Exception):
+    """요청 제한 초과 (reason: rate | concurrency, retry_after: 다시 시도까지 권장 대기 시간(초))"""
+
+    def __init__(self, route_class: str, reason: str, retry_after: int):
+        super().__init__(f"{route_class} 요청 제한 초과 ({reason})")
+        self.route_class = route_class
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionControl:
+    """
+    비용이 큰 API의 요청 제한 (프로세스(워커)별 메모리)
+    - 클라이언트 IP + 라우트 클래스별 토큰 버킷: 한 클라이언트가 반복 호출로 OpenAI 할당량/워커를 독점하지 못하도록 함
+    - 라우트 클래스별 동시 처리 수 상한: 넘치면 줄 세우지 않고 즉시 429 (다른 API의 처리 여력 보호)
+    """
+
+    def __init__(self, policies: Dict[str, AdmissionPolicy], enabled: bool, max_clients: int):
+        self.policies = policies
+        self.enabled = enabled
+        self.max_clients = max_clients
+        # (라우트 클래스, 클라이언트) → (남은 토큰, 마지막 갱신 시각)
+        self._buckets: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self._in_flight: Dict[str, int] = {route_class: 0 for route_class in policies}
+        self._lock = threading.Lock()
+
+    def acquire(self, route_class: str, client: Optional[str]):
+        """
+        요청 처리 전 호출, 제한을 넘으면 AdmissionRejected
+        통과하면 처리 후 반드시 release(route_class) 호출
+        """
+        if not self.enabled:
+            return
+        policy = self.policies[route_class]
+        with self._lock:
+            in_flight = self._in_flight[route_class]
+            if policy.concurrency and in_flight >= policy.concurrency:
+                rejected = AdmissionRejected(route_class, "concurrency", 1)
+            else:
+                rejected = self._take_token(route_class, policy, client or "unknown")
+            if rejected is None:
+                in_flight = self._in_flight[route_class] = in_flight + 1
+        metrics.record_admission(route_class, in_flight, rejected.reason if rejected else None)
+        if rejected is not None:
+            raise rejected
+
+    def release(self, route_class: str):
+        if not self.enabled:
+            return
+        with self._lock:
+            in_flight = self._in_flight[route_class] = self._in_flight[route_class] - 1
+        metrics.record_admission_in_flight(route_class, in_flight)
+
+    def _take_token(self, route_class: str, policy: AdmissionPolicy, client: str) -> Optional[AdmissionRejected]:
+        if not policy.per_minute or not policy.burst:
+            return None
+        rate = policy.per_minute / 60
+        now = time.monotonic()
+        key = (route_class, client)
+        tokens, updated = self._buckets.get(key, (policy.burst, now))
+        tokens = min(policy.burst, tokens + (now - updated) * rate)
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            return AdmissionRejected(route_class, "rate", math.ceil((1 - tokens) / rate))
+        self._buckets[key] = (tokens - 1, now)
+        if len(self._buckets) > self.max_clients:
+            self._prune(now)
+        return None
+
+    def _prune(self, now: float):
+        """다시 가득 찼을 버킷(= 기억하지 않아도 되는 클라이언트) 정리"""
+        kept = {}
+        for (route_class, client), (tokens, updated) in self._buckets.items():
+            policy = self.policies[route_class]
+            if tokens + (now - updated) * policy.per_minute / 60 < policy.burst:
+                kept[(route_class, client)] = (tokens, updated)
+        self._buckets = kept
+
+
+# 전역 요청 제한 인스턴스
+admission_control = AdmissionControl(ADMISSION_POLICIES, RATE_LIMIT_ENABLED, RATE_LIMIT_MAX_CLIENTS)
@@ -0,0 +1,139 @@
+import asyncio
+import hashlib
+import os
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from database import SessionLocal
+from models.analysis_cache import AnalysisCache
+
+# URL 분석 결과 캐시 유효 시간 (초, URL + 본문 기준)
+ANALYSIS_CACHE_TTL = int(os.getenv("ANALYSIS_CACHE_TTL", str(7 * 24 * 3600)))
+# URL만으로 찾는 캐시 유효 시간 (초, 이 시간 동안은 페이지를 다시 받지 않음)
+ANALYSIS_URL_CACHE_TTL = int(os.getenv("ANALYSIS_URL_CACHE_TTL", "3600"))
+# 캐시에 보관할 최대 항목 수 (초과 시 오래된 항목부터 삭제)
+ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "5000"))
+# 만료/초과 항목 정리 주기 (초, 스케줄러에서 실행)
+ANALYSIS_CACHE_EVICT_INTERVAL = int(os.getenv("ANALYSIS_CACHE_EVICT_INTERVAL", "600"))
+
+# 분석 결과에 영향을 주지 않는 추적용 쿼리 파라미터
+TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "mc_cid", "mc_eid", "ref"}
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    같은 페이지를 가리키는 URL이 같은 키가 되도록 정규화
+    (scheme/host 소문자, 기본 포트/fragment/추적 파라미터 제거, 쿼리 정렬)
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith("utm_") and key not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+def make_url_cache_key(url: str) -> str:
+    return hashlib.sha256(f"url\n{normalize_url(url)}".encode("utf-8")).hexdigest()
+
+
+def make_cache_key(url: str, text: str) -> str:
+    text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return hashlib.sha256(f"{normalize_url(url)}\n{text_hash}".encode("utf-8")).hexdigest()
+
+
+class AnalysisCacheStore:
+    """
+    analysis_cache 테이블 기반 URL 분석 결과 캐시 (TTL + 최대 항목 수 제한)
+    저장할 때마다 정리하지 않고 스케줄러가 evict()를 주기적으로 호출 (그 사이에는 최대 항목 수를 잠시 넘을 수 있음)
+    """
+
+    def __init__(self, ttl: int, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        db = SessionLocal()
+        try:
+            entry = db.query(AnalysisCache).filter(AnalysisCache.cache_key == cache_key).first()
+            if not entry or entry.expires_at <= datetime.utcnow():
+                return None
+            return entry.result
+        finally:
+            db.close()
+
+    def put(self, cache_key: str, url: str, result: Dict[str, Any], ttl: Optional[int] = None):
+        db = SessionLocal()
+        try:
+            now = datetime.utcnow()
+            db.merge(AnalysisCache(
+                cache_key=cache_key,
+                url=url[:500],
+                result=result,
+                created_at=now,
+                expires_at=now + timedelta(seconds=self.ttl if ttl is None else ttl),
+            ))
+            db.commit()
+        finally:
+            db.close()
+
+    def evict(self) -> int:
+        """
+        만료된 항목과 최대 항목 수를 넘는 오래된 항목을 삭제하고 삭제한 수를 반환
+        """
+        db = SessionLocal()
+        try:
+            now = datetime.utcnow()
+            deleted = db.query(AnalysisCache).filter(AnalysisCache.expires_at <= now).delete(synchronize_session=False)
+            overflow = db.query(AnalysisCache).count() - self.max_entries
+            if overflow > 0:
+                oldest_keys = [
+                    key for (key,) in db.query(AnalysisCache.cache_key)
+                    .order_by(AnalysisCache.created_at.asc())
+                    .limit(overflow)
+                ]
+                deleted += db.query(AnalysisCache).filter(
+                    AnalysisCache.cache_key.in_(oldest_keys)
+                ).delete(synchronize_session=False)
+            db.commit()
+            return deleted
+        finally:
+            db.close()
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 요청은 첫 요청의 결과를 함께 기다리도록 합침
+    실제 작업은 요청과 분리된 Task로 실행하므로 어느 요청이 취소돼도 나머지 요청은 계속 결과를 기다림
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 기다리는 요청이 모두 취소된 뒤 실패해도 "exception was never retrieved" 경고가 나지 않도록 처리
+        if not task.cancelled():
+            task.exception()
+
+
+# 전역 분석 캐시 인스턴스
+analysis_cache = AnalysisCacheStore(ANALYSIS_CACHE_TTL, ANALYSIS_CACHE_MAX_ENTRIES)
+analysis_flight = SingleFlight()
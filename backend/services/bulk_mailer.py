@@ -0,0 +1,135 @@
+import os
+import queue
+import smtplib
+import threading
+from dataclasses import dataclass
+from email.message import Message
+from typing import Callable, List, Optional, Tuple
+
+from services.metrics import metrics
+
+# 동시에 유지할 SMTP 세션 수
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "3"))
+# 세션 하나로 보낼 최대 메일 수 (초과 시 재접속, 서버별 세션당 제한 대응)
+SMTP_MESSAGES_PER_CONNECTION = int(os.getenv("SMTP_MESSAGES_PER_CONNECTION", "100"))
+# 연결 오류 시 수신자별 재시도 횟수
+SMTP_MAX_RETRIES = int(os.getenv("SMTP_MAX_RETRIES", "2"))
+SMTP_USE_TLS = os.getenv("SMTP_USE_TLS", "true").lower() == "true"
+SMTP_TIMEOUT = float(os.getenv("SMTP_TIMEOUT", "30"))
+
+
+@dataclass
+class DeliveryResult:
+    recipient: str
+    success: bool
+    attempts: int
+    error: Optional[str] = None
+
+
+class BulkMailer:
+    """
+    인증된 SMTP 세션 몇 개를 재사용해서 여러 메일을 병렬로 발송
+    - 연결이 끊기거나 일시 오류가 나면 재접속 후 재시도
+    - 수신자 거부 등 영구 오류는 재시도하지 않음
+    - 수신자별 결과(DeliveryResult)를 반환하고, on_result 콜백으로 진행 상황 전달
+    """
+
+    def __init__(self, server: str, port: int, username: Optional[str], password: Optional[str],
+                 use_tls: bool = SMTP_USE_TLS, pool_size: int = SMTP_POOL_SIZE,
+                 messages_per_connection: int = SMTP_MESSAGES_PER_CONNECTION,
+                 max_retries: int = SMTP_MAX_RETRIES):
+        self.server = server
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.pool_size = pool_size
+        self.messages_per_connection = messages_per_connection
+        self.max_retries = max_retries
+
+    def _connect(self) -> smtplib.SMTP:
+        with metrics.external_call("smtp", "connect"):
+            connection = smtplib.SMTP(self.server, self.port, timeout=SMTP_TIMEOUT)
+            try:
+                if self.use_tls:
+                    connection.starttls()
+                if self.username and self.password:
+                    connection.login(self.username, self.password)
+            except Exception:
+                connection.close()
+                raise
+        return connection
+
+    @staticmethod
+    def _close(connection: Optional[smtplib.SMTP]):
+        if connection is None:
+            return
+        try:
+            connection.quit()
+        except Exception:
+            connection.close()
+
+    def send(self, messages: List[Tuple[str, Message]],
+             on_result: Optional[Callable[[DeliveryResult], None]] = None) -> List[DeliveryResult]:
+        """
+        (수신자, 메시지) 목록을 발송하고 입력 순서대로 결과 반환
+        """
+        results: List[Optional[DeliveryResult]] = [None] * len(messages)
+        pending = queue.Queue()
+        for index, (recipient, message) in enumerate(messages):
+            pending.put((index, recipient, message))
+
+        def worker():
+            connection = None
+            sent_on_connection = 0
+            try:
+                while True:
+                    try:
+                        index, recipient, message = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    if connection is not None and sent_on_connection >= self.messages_per_connection:
+                        self._close(connection)
+                        connection = None
+                    result, connection = self._deliver(connection, recipient, message)
+                    sent_on_connection = sent_on_connection + 1 if connection is not None else 0
+                    results[index] = result
+                    if on_result:
+                        on_result(result)
+            finally:
+                self._close(connection)
+
+        threads = [
+            threading.Thread(target=worker, name=f"smtp-{i}", daemon=True)
+            for i in range(min(self.pool_size, len(messages)))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def _deliver(self, connection: Optional[smtplib.SMTP], recipient: str, message: Message):
+        error = None
+        for attempt in range(1, self.max_retries + 2):
+            try:
+                if connection is None:
+                    connection = self._connect()
+                with metrics.external_call("smtp", "send"):
+                    connection.send_message(message, to_addrs=[recipient])
+                return DeliveryResult(recipient, True, attempt), connection
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused) as e:
+                # 주소 문제는 재시도해도 동일하므로 바로 실패 처리 (세션은 계속 사용)
+                return DeliveryResult(recipient, False, attempt, str(e)), connection
+            except smtplib.SMTPResponseException as e:
+                error = str(e)
+                if 500 <= e.smtp_code < 600:
+                    return DeliveryResult(recipient, False, attempt, error), connection
+                self._close(connection)
+                connection = None
+            except (smtplib.SMTPException, OSError) as e:
+                # 연결 끊김/타임아웃 등은 재접속 후 재시도
+                error = str(e)
+                self._close(connection)
+                connection = None
+        return DeliveryResult(recipient, False, self.max_retries + 1, error), connection
@@ -0,0 +1,344 @@
+import os
+import re
+import html
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from dotenv import load_dotenv
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session, aliased
+
+from database import SessionLocal
+from models.confluence import ConfluenceOutbox, ConfluencePage
+from services.metrics import metrics
+
+# 환경 변수 로드
+load_dotenv()
+
+# 아웃박스 처리 주기 (초)
+CONFLUENCE_OUTBOX_INTERVAL = int(os.getenv("CONFLUENCE_OUTBOX_INTERVAL", "5"))
+# 한 번에 가져올 아웃박스 항목 수 / 동시에 보낼 요청 수
+CONFLUENCE_OUTBOX_BATCH_SIZE = int(os.getenv("CONFLUENCE_OUTBOX_BATCH_SIZE", "50"))
+CONFLUENCE_CONCURRENCY = int(os.getenv("CONFLUENCE_CONCURRENCY", "4"))
+# 재시도 정책 (지수 백오프, 최대 시도 횟수를 넘으면 failed)
+CONFLUENCE_MAX_ATTEMPTS = int(os.getenv("CONFLUENCE_MAX_ATTEMPTS", "8"))
+CONFLUENCE_BACKOFF_BASE = int(os.getenv("CONFLUENCE_BACKOFF_BASE", "10"))
+CONFLUENCE_BACKOFF_MAX = int(os.getenv("CONFLUENCE_BACKOFF_MAX", "3600"))
+# 처리 중인 항목을 다른 워커가 가져가지 않도록 잡아두는 시간 (초)
+CONFLUENCE_LEASE_SECONDS = int(os.getenv("CONFLUENCE_LEASE_SECONDS", "120"))
+CONFLUENCE_TIMEOUT = (3, 10)
+# 생성한 블로그 포스트에 붙이는 게시글 id 라벨 (재시도 시 이미 생성된 포스트를 찾는 용도)
+CONFLUENCE_POST_LABEL_PREFIX = "tech-talk-post-"
+# 처리 완료된 아웃박스 항목 보관 기간 (일)
+CONFLUENCE_OUTBOX_RETENTION_DAYS = int(os.getenv("CONFLUENCE_OUTBOX_RETENTION_DAYS", "7"))
+
+
+def auto_link_urls(text: str) -> str:
+    """
+    본문 내 http/https로 시작하는 URL을 <a href="...">...</a>로 변환
+    href 속성의 URL 내 & 등 특수문자는 html.escape로 이스케이프
+    텍스트(보여지는 부분) 내 & 등도 html.escape로 이스케이프
+    """
+    url_pattern = re.compile(r"(https?://[\w\-._~:/?#\[\]@!$&'()*+,;=%]+)")
+    def escape_url(match):
+        url = match.group(1)
+        safe_url = html.escape(url, quote=True)  # href용
+        safe_text = html.escape(url)             # 텍스트 노드용 (&, <, >)
+        return f'<a href="{safe_url}">{safe_text}</a>'
+    return url_pattern.sub(escape_url, text)
+
+
+def text_to_html_paragraphs(text: str) -> str:
+    """
+    두 줄 이상 줄바꿈은 <p>문단</p>, 한 줄 줄바꿈은 <br/>로 변환
+    연속 줄바꿈(빈 줄)도 <p><br/></p>로 보존
+    URL은 자동으로 <a href>로 변환
+    """
+    text = auto_link_urls(text)
+    # 문단 분리 (두 줄 이상 줄바꿈 기준, 구분자도 보존)
+    paragraphs = re.split(r'(\n{2,})', text)
+    html_paragraphs = []
+    for para in paragraphs:
+        if para.startswith('\n'):
+            # 연속 줄바꿈(빈 줄)은 개수만큼 <p><br/></p> 추가
+            count = para.count('\n') // 2  # 두 줄마다 한 번
+            html_paragraphs.extend(['<p><br/></p>'] * count)
+        elif para.strip() == '':
+            continue  # 완전 빈 문자열은 무시
+        else:
+            html_paragraphs.append('<p>' + para.replace('\n', '<br/>') + '</p>')
+    return ''.join(html_paragraphs)
+
+
+def make_tag_html(tags):
+    if not tags:
+        return ''
+    tag_str = ' '.join(f'#{tag}' for tag in tags)
+    return (
+        '<br/><br/>'  # 본문과 태그 사이 두 줄 띄우기
+        '<div style="color: #888; font-size: 0.95em; margin-top: 16px; '
+        'border-top: 1px solid #eee; padding-top: 8px;">'
+        f'{tag_str}</div>'
+    )
+
+
+def enqueue_confluence_event(db: Session, post_id: int, action: str, title: str = None, content: str = None, tags=None):
+    """
+    게시글 변경을 아웃박스에 기록 (commit은 호출한 쪽의 트랜잭션에서 함께 수행)
+    """
+    payload = None
+    if action != "delete":
+        payload = {"title": title, "content": content, "tags": tags or []}
+    db.add(ConfluenceOutbox(post_id=post_id, action=action, payload=payload))
+
+
+class ConfluenceClient:
+    """
+    Confluence REST API 클라이언트 (requests.Session으로 커넥션 재사용)
+    """
+
+    def __init__(self, pool_size: int):
+        self.url = os.getenv("CONFLUENCE_BLOG_API_URL")
+        self.email = os.getenv("CONFLUENCE_EMAIL")
+        self.api_token = os.getenv("CONFLUENCE_API_TOKEN")
+        self.space_key = os.getenv("CONFLUENCE_SPACE_KEY")
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_maxsize=pool_size))
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=pool_size))
+        self.session.headers.update({
+            "Accept": "application/json",
+            "Content-Type": "application/json"
+        })
+        if self.is_configured:
+            self.url = self.url.rstrip("/")
+            self.session.auth = HTTPBasicAuth(self.email, self.api_token)
+
+    @property
+    def is_configured(self) -> bool:
+        return all([self.url, self.email, self.api_token, self.space_key])
+
+    @staticmethod
+    def post_label(post_id: int) -> str:
+        return f"{CONFLUENCE_POST_LABEL_PREFIX}{post_id}"
+
+    def _payload(self, title: str, content: str, tags) -> dict:
+        html_content = text_to_html_paragraphs(content)
+        if tags:
+            html_content += make_tag_html(tags)
+        return {
+            "type": "blogpost",
+            "title": title,
+            "space": {"key": self.space_key},
+            "body": {
+                "storage": {
+                    "value": html_content,  # HTML 변환된 본문 + 태그
+                    "representation": "storage"
+                }
+            }
+        }
+
+    def find_blog(self, post_id: int) -> Optional[Tuple[str, int]]:
+        """게시글 id 라벨로 이미 생성된 블로그 포스트 조회 (제목은 게시글끼리 겹칠 수 있으므로 사용하지 않음)"""
+        cql = f'type = blogpost AND space = "{self.space_key}" AND label = "{self.post_label(post_id)}"'
+        with metrics.external_call("confluence", "find_blog"):
+            response = self.session.get(
+                f"{self.url}/search",
+                params={"cql": cql, "expand": "version"},
+                timeout=CONFLUENCE_TIMEOUT,
+            )
+            response.raise_for_status()
+        results = response.json().get("results", [])
+        if not results:
+            return None
+        return str(results[0]["id"]), results[0].get("version", {}).get("number", 1)
+
+    def create_blog(self, post_id: int, title: str, content: str, tags) -> Tuple[str, int]:
+        payload = self._payload(title, content, tags)
+        payload["metadata"] = {"labels": [{"prefix": "global", "name": self.post_label(post_id)}]}
+        with metrics.external_call("confluence", "create_blog"):
+            response = self.session.post(self.url, json=payload, timeout=CONFLUENCE_TIMEOUT)
+            response.raise_for_status()
+        data = response.json()
+        return str(data["id"]), data.get("version", {}).get("number", 1)
+
+    def update_blog(self, page_id: str, version: int, title: str, content: str, tags) -> int:
+        payload = self._payload(title, content, tags)
+        payload["version"] = {"number": version + 1}
+        with metrics.external_call("confluence", "update_blog"):
+            response = self.session.put(f"{self.url}/{page_id}", json=payload, timeout=CONFLUENCE_TIMEOUT)
+            response.raise_for_status()
+        return response.json().get("version", {}).get("number", version + 1)
+
+    def delete_blog(self, page_id: str):
+        with metrics.external_call("confluence", "delete_blog"):
+            response = self.session.delete(f"{self.url}/{page_id}", timeout=CONFLUENCE_TIMEOUT)
+            # 이미 삭제된 포스트는 성공으로 처리
+            if response.status_code != 404:
+                response.raise_for_status()
+
+
+class ConfluenceOutboxWorker:
+    """
+    아웃박스를 읽어 Confluence에 반영하는 백그라운드 작업 (스케줄러에서 주기적으로 drain 호출)
+    - 같은 게시글의 이벤트는 기록된 순서대로 하나씩 처리
+    - 실패 시 지수 백오프로 재시도, CONFLUENCE_MAX_ATTEMPTS를 넘으면 failed
+    - 생성은 매핑 테이블/게시글 id 라벨 검색으로 중복 생성 방지 (멱등)
+    """
+
+    def __init__(self, client: ConfluenceClient, concurrency: int, batch_size: int):
+        self.client = client
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self._drain_lock = threading.Lock()
+
+    def drain(self) -> int:
+        """
+        처리할 수 있는 항목을 모두 처리하고 처리한 항목 수를 반환
+        """
+        if not self.client.is_configured:
+            return 0
+        if not self._drain_lock.acquire(blocking=False):
+            return 0
+        try:
+            processed = 0
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="confluence") as executor:
+                while True:
+                    entry_ids = self._next_batch()
+                    if not entry_ids:
+                        break
+                    processed += sum(executor.map(self._process, entry_ids))
+            self._purge_done()
+            return processed
+        finally:
+            self._drain_lock.release()
+
+    def _purge_done(self):
+        db = SessionLocal()
+        try:
+            cutoff = datetime.utcnow() - timedelta(days=CONFLUENCE_OUTBOX_RETENTION_DAYS)
+            db.query(ConfluenceOutbox).filter(
+                ConfluenceOutbox.status == "done",
+                ConfluenceOutbox.created_at < cutoff,
+            ).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    def _next_batch(self) -> List[int]:
+        """
+        지금 처리할 수 있는 항목 id (id 순)
+        - 재시도 대기 중인 항목은 SQL에서 제외 (대기 항목이 많아도 뒤의 처리 가능한 항목이 막히지 않음)
+        - 같은 게시글에 먼저 기록된 미완료 항목이 있으면 제외 (게시글별 순서 보장)
+        """
+        db = SessionLocal()
+        try:
+            earlier = aliased(ConfluenceOutbox)
+            earlier_pending = (
+                select(earlier.id)
+                .where(
+                    earlier.post_id == ConfluenceOutbox.post_id,
+                    earlier.status == "pending",
+                    earlier.id < ConfluenceOutbox.id,
+                )
+                .exists()
+            )
+            rows = (
+                db.query(ConfluenceOutbox.id)
+                .filter(
+                    ConfluenceOutbox.status == "pending",
+                    ConfluenceOutbox.next_attempt_at <= datetime.utcnow(),
+                    ~earlier_pending,
+                )
+                .order_by(ConfluenceOutbox.id.asc())
+                .limit(self.batch_size)
+                .all()
+            )
+            return [entry_id for (entry_id,) in rows]
+        finally:
+            db.close()
+
+    def _process(self, entry_id: int) -> int:
+        db = SessionLocal()
+        try:
+            entry = db.get(ConfluenceOutbox, entry_id)
+            now = datetime.utcnow()
+            # 다른 워커와 동시에 처리하지 않도록 next_attempt_at을 임대 시간만큼 미뤄서 선점
+            claimed = db.execute(
+                update(ConfluenceOutbox)
+                .where(
+                    ConfluenceOutbox.id == entry_id,
+                    ConfluenceOutbox.status == "pending",
+                    ConfluenceOutbox.next_attempt_at == entry.next_attempt_at,
+                )
+                .values(
+                    next_attempt_at=now + timedelta(seconds=CONFLUENCE_LEASE_SECONDS),
+                    attempts=ConfluenceOutbox.attempts + 1,
+                )
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.commit()
+            if not claimed:
+                return 0
+            db.refresh(entry)
+
+            try:
+                self._apply(db, entry)
+                entry.status = "done"
+                entry.last_error = None
+                print(f"[Confluence] {entry.action} 반영 완료: post {entry.post_id}")
+            except Exception as e:
+                db.rollback()
+                entry = db.get(ConfluenceOutbox, entry_id)
+                entry.last_error = str(e)[:1000]
+                if entry.attempts >= CONFLUENCE_MAX_ATTEMPTS:
+                    entry.status = "failed"
+                else:
+                    backoff = min(CONFLUENCE_BACKOFF_BASE * 2 ** (entry.attempts - 1), CONFLUENCE_BACKOFF_MAX)
+                    entry.next_attempt_at = datetime.utcnow() + timedelta(seconds=backoff)
+                print(f"[Confluence] {entry.action} 반영 실패 (post {entry.post_id}, {entry.attempts}회): {e}")
+            db.commit()
+            return 1
+        finally:
+            db.close()
+
+    def _apply(self, db: Session, entry: ConfluenceOutbox):
+        page = db.get(ConfluencePage, entry.post_id)
+        payload = entry.payload or {}
+
+        if entry.action == "delete":
+            if page:
+                self.client.delete_blog(page.page_id)
+                db.delete(page)
+            return
+
+        if page is None:
+            # 이전 시도에서 생성은 됐지만 매핑 저장 전에 실패했을 수 있으므로 재시도 시 게시글 id 라벨로 먼저 확인
+            found = self.client.find_blog(entry.post_id) if entry.attempts > 1 else None
+            if found is None:
+                page_id, version = self.client.create_blog(
+                    entry.post_id, payload["title"], payload["content"], payload["tags"]
+                )
+                # 생성 직후 매핑을 먼저 저장 (이후 단계가 실패해도 재시도 시 중복 생성하지 않음)
+                db.add(ConfluencePage(post_id=entry.post_id, page_id=page_id, version=version))
+                db.commit()
+                return
+            page = ConfluencePage(post_id=entry.post_id, page_id=found[0], version=found[1])
+            db.add(page)
+            if entry.action == "create":
+                return
+
+        if entry.action == "update":
+            page.version = self.client.update_blog(
+                page.page_id, page.version, payload["title"], payload["content"], payload["tags"]
+            )
+
+
+# 전역 Confluence 아웃박스 워커 인스턴스
+confluence_outbox_worker = ConfluenceOutboxWorker(
+    ConfluenceClient(CONFLUENCE_CONCURRENCY), CONFLUENCE_CONCURRENCY, CONFLUENCE_OUTBOX_BATCH_SIZE
+)
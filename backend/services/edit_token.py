@@ -0,0 +1,34 @@
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import time
+
+# 서명 키가 없으면 프로세스마다 임의 생성 (재시작/다중 워커 환경에서는 EDIT_TOKEN_SECRET 설정 필요)
+EDIT_TOKEN_SECRET = (os.getenv("EDIT_TOKEN_SECRET") or secrets.token_hex(32)).encode("utf-8")
+# 수정 토큰 유효 시간 (초)
+EDIT_TOKEN_TTL = int(os.getenv("EDIT_TOKEN_TTL", "600"))
+
+
+def _sign(payload: str) -> str:
+    digest = hmac.new(EDIT_TOKEN_SECRET, payload.encode("utf-8"), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+
+def issue_edit_token(post_id: int) -> str:
+    """
+    비밀번호 검증을 통과한 게시글에 대해 "<post_id>.<만료시각>.<서명>" 형식의 토큰 발급
+    """
+    payload = f"{post_id}.{int(time.time()) + EDIT_TOKEN_TTL}"
+    return f"{payload}.{_sign(payload)}"
+
+
+def verify_edit_token(token: str, post_id: int) -> bool:
+    try:
+        token_post_id, expires_at, signature = token.split(".")
+        if int(token_post_id) != post_id or int(expires_at) < time.time():
+            return False
+    except ValueError:
+        return False
+    return hmac.compare_digest(signature, _sign(f"{token_post_id}.{expires_at}"))
@@ -0,0 +1,155 @@
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+from services.bulk_mailer import DeliveryResult
+from services.email_service import email_service
+
+# 상태 조회용으로 보관할 최근 작업 수
+EMAIL_JOB_HISTORY = int(os.getenv("EMAIL_JOB_HISTORY", "100"))
+
+TEST_EMAIL_HTML = """
+        <html>
+        <body>
+            <h1>Tech Talk 이메일 설정 테스트</h1>
+            <p>이메일 발송이 정상적으로 설정되었습니다.</p>
+            <p>발송 시간: {}</p>
+        </body>
+        </html>
+        """
+
+
+@dataclass
+class EmailJob:
+    id: str
+    kind: str
+    # queued → running → succeeded / failed / skipped
+    status: str = "queued"
+    total: int = 0
+    sent: int = 0
+    failed: int = 0
+    message: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "jobId": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "total": self.total,
+            "sent": self.sent,
+            "failed": self.failed,
+            "message": self.message,
+            "createdAt": self.created_at.isoformat(),
+            "startedAt": self.started_at.isoformat() if self.started_at else None,
+            "finishedAt": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class EmailJobRunner:
+    """
+    메일 발송을 전용 스레드 하나에서 순서대로 실행하는 작업 큐
+    - API는 작업 id만 받고 바로 응답 (이벤트 루프/요청 스레드를 막지 않음)
+    - 같은 종류의 작업이 대기/실행 중이면 새로 만들지 않고 기존 작업을 반환 (중복 발송 방지)
+    - 수신자별 결과를 받을 때마다 sent/failed 진행 상황을 갱신
+    """
+
+    def __init__(self, history: int):
+        self.history = history
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="email-job")
+        self._jobs: "OrderedDict[str, EmailJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.to_dict() if job else None
+
+    def submit_weekly(self) -> Dict:
+        return self._submit("weekly", self._run_weekly)
+
+    def submit_test(self) -> Dict:
+        return self._submit("test", self._run_test)
+
+    def _submit(self, kind: str, run: Callable[[EmailJob], None]) -> Dict:
+        with self._lock:
+            for job in self._jobs.values():
+                if job.kind == kind and job.status in ("queued", "running"):
+                    return job.to_dict()
+            job = EmailJob(id=uuid.uuid4().hex, kind=kind)
+            self._jobs[job.id] = job
+            self._trim()
+            snapshot = job.to_dict()
+        self._executor.submit(self._execute, job, run)
+        return snapshot
+
+    def _trim(self):
+        # 끝난 작업부터 오래된 순으로 정리
+        while len(self._jobs) > self.history:
+            finished = next(
+                (job_id for job_id, job in self._jobs.items() if job.status not in ("queued", "running")),
+                None,
+            )
+            if finished is None:
+                return
+            del self._jobs[finished]
+
+    def _execute(self, job: EmailJob, run: Callable[[EmailJob], None]):
+        with self._lock:
+            job.status = "running"
+            job.started_at = datetime.now()
+        try:
+            run(job)
+            with self._lock:
+                if job.status == "running":
+                    job.status = "succeeded" if job.sent > 0 or job.total == 0 else "failed"
+        except Exception as e:
+            print(f"[EmailJob] 작업 실패 ({job.kind}, {job.id}): {e}")
+            with self._lock:
+                job.status = "failed"
+                job.message = str(e)
+        finally:
+            with self._lock:
+                job.finished_at = datetime.now()
+            print(f"[EmailJob] 작업 종료 ({job.kind}, {job.id}): {job.status}, 성공 {job.sent}건, 실패 {job.failed}건")
+
+    def _progress(self, job: EmailJob) -> Callable[[DeliveryResult], None]:
+        def on_result(result: DeliveryResult):
+            with self._lock:
+                if result.success:
+                    job.sent += 1
+                else:
+                    job.failed += 1
+        return on_result
+
+    def _run_weekly(self, job: EmailJob):
+        prepared = email_service.prepare_weekly_email()
+        if prepared is None:
+            with self._lock:
+                job.status = "skipped"
+                job.message = "지난 주에 새로운 게시글이 없어 이메일을 발송하지 않습니다."
+            return
+        with self._lock:
+            job.total = len(email_service.recipient_emails)
+        email_service.send_bulk(*prepared, on_result=self._progress(job))
+
+    def _run_test(self, job: EmailJob):
+        with self._lock:
+            job.total = len(email_service.recipient_emails)
+        test_html = TEST_EMAIL_HTML.format(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        email_service.send_bulk(test_html, "테스트", "테스트", on_result=self._progress(job))
+
+    def shutdown(self):
+        # 대기 중인 작업은 취소하고 실행 중인 작업만 마무리
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+# 전역 메일 발송 작업 큐 인스턴스
+email_job_runner = EmailJobRunner(EMAIL_JOB_HISTORY)
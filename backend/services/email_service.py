@@ -1,14 +1,13 @@
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from datetime import datetime, timedelta
 from models.post import Post
-from database import SessionLocal
-from jinja2 import Template
-import smtplib
+from database import ReadSessionLocal
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from services.bulk_mailer import BulkMailer, DeliveryResult
+from services.weekly_digest import weekly_digest_store, week_start_of, format_week_range, render_digest
 
 # 환경 변수에서 이메일 설정 가져오기
 SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
@@ -18,6 +17,9 @@ SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")
 SENDER_EMAIL = os.getenv("SENDER_EMAIL")
 RECIPIENT_EMAILS = os.getenv("RECIPIENT_EMAILS", "").split(",") if os.getenv("RECIPIENT_EMAILS") else []
 
+def last_week_start():
+    return week_start_of(datetime.now()) - timedelta(days=7)
+
 class EmailService:
     def __init__(self):
         self.smtp_server = SMTP_SERVER
@@ -26,139 +28,85 @@ class EmailService:
         self.smtp_password = SMTP_PASSWORD
         self.sender_email = SENDER_EMAIL
         self.recipient_emails = [email.strip() for email in RECIPIENT_EMAILS if email.strip()]
+        self.mailer = BulkMailer(self.smtp_server, self.smtp_port, self.smtp_username, self.smtp_password)
     
     def get_weekly_posts(self, db: Session) -> List[Dict[str, Any]]:
-        # 지난 주 월요일부터 일요일까지
-        today = datetime.now()
-        last_monday = today - timedelta(days=today.weekday() + 7)
-        last_sunday = last_monday + timedelta(days=6)
-        
-        posts = (
-            db.query(
-                Post,
-                func.count(Post.id).label("comment_count")
-            )
-            .outerjoin(Post.comments)
-            .filter(
-                Post.created_at >= last_monday,
-                Post.created_at <= last_sunday
-            )
-            .group_by(Post.id)
-            .order_by(Post.created_at.desc())
-            .all()
-        )
+        # 지난 주 월요일부터 일요일까지 (주간 스냅샷 한 행 + 조회수/댓글 수만 조회)
+        digest = weekly_digest_store.read(db, last_week_start())
+        if not digest.entries:
+            return []
         
+        counters = {
+            row.id: row
+            for row in db.query(Post.id, Post.views, Post.comment_count)
+            .filter(Post.id.in_([entry["id"] for entry in digest.entries]))
+        }
         return [
             {
-                "id": post.id,
-                "title": post.title,
-                "content": post.content[:200] + "..." if len(post.content) > 200 else post.content,
-                "created_at": post.created_at.strftime("%Y-%m-%d %H:%M"),
-                "views": post.views,
-                "tags": post.tags or [],
-                "url": post.url,
-                "comment_count": comment_count
+                "id": entry["id"],
+                "title": entry["title"],
+                "content": entry["content"],
+                "created_at": entry["created_at"],
+                "views": counters[entry["id"]].views if entry["id"] in counters else 0,
+                "tags": entry["tags"],
+                "url": entry["url"],
+                "comment_count": counters[entry["id"]].comment_count if entry["id"] in counters else 0
             }
-            for post, comment_count in posts
+            for entry in digest.entries
         ]
     
     def create_email_html(self, posts: List[Dict[str, Any]], week_start: str, week_end: str) -> str:
-        template_str = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset=\"UTF-8\">
-            <title>Tech Talk 주간 신규 게시글 안내</title>
-            <style>
-                body { font-family: 'Pretendard', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: #f5f5f5; color: #222; }
-                .container { background: #fff; max-width: 550px; margin: 40px auto; border-radius: 8px; box-shadow: 0 2px 8px rgba(0,0,0,0.07); padding: 32px; }
-                h1 { color: #0a80ed; font-size: 1.5rem; margin-bottom: 8px; }
-                .period { color: #666; font-size: 1rem; margin-bottom: 24px; }
-                ul { padding-left: 1.2em; }
-                li { margin-bottom: 10px; font-size: 1.08rem; }
-                .footer { margin-top: 32px; color: #888; font-size: 0.95rem; text-align: center; }
-            </style>
-        </head>
-        <body>
-            <div class=\"container\">
-                <h1>Tech Talk 주간 신규 게시글 안내</h1>
-                <div class=\"period\">{{ week_start }} ~ {{ week_end }}</div>
-                {% if posts %}
-                <ul>
-                    {% for post in posts %}
-                        <li>{{ post.title }}</li>
-                    {% endfor %}
-                </ul>
-                {% else %}
-                <div>이번 주에는 새로운 게시글이 없습니다.</div>
-                {% endif %}
-                <div class=\"footer\">이 이메일은 Tech Talk의 주간 신규 게시글 안내 서비스에 따라 자동 발송되었습니다.</div>
-            </div>
-        </body>
-        </html>
-        """
-        template = Template(template_str)
-        return template.render(posts=posts, week_start=week_start, week_end=week_end)
+        return render_digest(posts, week_start, week_end)
     
-    def send_weekly_email(self) -> bool:
-        if not all([self.smtp_username, self.smtp_password, self.sender_email, self.recipient_emails]):
-            print("[Email] 이메일 설정이 완료되지 않았습니다.")
-            return False
-        
+    def is_configured(self) -> bool:
+        return all([self.smtp_username, self.smtp_password, self.sender_email, self.recipient_emails])
+    
+    def prepare_weekly_email(self) -> Optional[Tuple[str, str, str]]:
+        """지난 주 스냅샷에서 (HTML, 시작일, 종료일)을 가져옵니다. 게시글이 없으면 None을 반환합니다."""
+        week_start = last_week_start()
+        db = ReadSessionLocal()
         try:
-            db = SessionLocal()
-            posts = self.get_weekly_posts(db)
-
-            # 게시글이 없으면 발송하지 않음
-            if not posts:
-                print("[Email] 지난 주에 새로운 게시글이 없어 이메일을 발송하지 않습니다.")
-                return False
-            
-            # 지난 주 날짜 계산
-            today = datetime.now()
-            last_monday = today - timedelta(days=today.weekday() + 7)
-            last_sunday = last_monday + timedelta(days=6)
-            
-            week_start = last_monday.strftime("%Y년 %m월 %d일")
-            week_end = last_sunday.strftime("%Y년 %m월 %d일")
-            
-            # 이메일 HTML 생성
-            html_content = self.create_email_html(posts, week_start, week_end)
-            
-            # 이메일 발송
-            for recipient in self.recipient_emails:
-                self._send_email(recipient, html_content, week_start, week_end)
-            
-            print(f"[Email] 주간 게시글 요약 이메일 발송 완료: {len(self.recipient_emails)}명")
-            return True
-            
-        except Exception as e:
-            print(f"[Email] 이메일 발송 실패: {str(e)}")
-            return False
+            digest = weekly_digest_store.read(db, week_start)
+            entries, html_content = digest.entries, digest.html
         finally:
             db.close()
+        
+        # 게시글이 없으면 발송하지 않음
+        if not entries:
+            return None
+        
+        return (html_content, *format_week_range(week_start))
     
-    def _send_email(self, recipient: str, html_content: str, week_start: str, week_end: str):
-        try:
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = f'Tech Talk 주간 게시글 ({week_start} ~ {week_end})'
-            msg['From'] = self.sender_email
-            msg['To'] = recipient
-            
-            # HTML 버전
-            html_part = MIMEText(html_content, 'html', 'utf-8')
-            msg.attach(html_part)
-            
-            # SMTP 서버 연결 및 발송
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
-            
-            print(f"[Email] 이메일 발송 성공: {recipient}")
-            
-        except Exception as e:
-            print(f"[Email] 이메일 발송 실패 ({recipient}): {str(e)}")
+    def _build_message(self, recipient: str, html_content: str, week_start: str, week_end: str) -> MIMEMultipart:
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = f'Tech Talk 주간 게시글 ({week_start} ~ {week_end})'
+        msg['From'] = self.sender_email
+        msg['To'] = recipient
+        
+        # HTML 버전
+        html_part = MIMEText(html_content, 'html', 'utf-8')
+        msg.attach(html_part)
+        return msg
+    
+    def send_bulk(
+        self,
+        html_content: str,
+        week_start: str,
+        week_end: str,
+        recipients: Optional[List[str]] = None,
+        on_result: Optional[Callable[[DeliveryResult], None]] = None,
+    ) -> List[DeliveryResult]:
+        """수신자 전체에게 발송하고 수신자별 결과를 반환합니다."""
+        recipients = self.recipient_emails if recipients is None else recipients
+        messages = [
+            (recipient, self._build_message(recipient, html_content, week_start, week_end))
+            for recipient in recipients
+        ]
+        results = self.mailer.send(messages, on_result=on_result)
+        for result in results:
+            if not result.success:
+                print(f"[Email] 이메일 발송 실패 ({result.recipient}, {result.attempts}회 시도): {result.error}")
+        return results
 
 # 전역 이메일 서비스 인스턴스
 email_service = EmailService() 
\ No newline at end of file
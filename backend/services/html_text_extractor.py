@@ -0,0 +1,128 @@
+import codecs
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import Optional
+
+# 본문 텍스트에서 제외할 태그 (하위 내용 전체 무시)
+SKIP_TAGS = {"script", "style", "nav", "noscript", "template", "svg", "iframe"}
+# 앞뒤 텍스트를 붙이지 않고 공백으로 구분할 블록 태그
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "figcaption", "footer", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr",
+    "li", "main", "ol", "p", "pre", "section", "table", "td", "th", "title", "tr", "ul",
+}
+
+
+@dataclass
+class ExtractedPage:
+    text: str
+    title: Optional[str]
+    description: Optional[str]
+    image: Optional[str]
+
+
+class HtmlTextExtractor(HTMLParser):
+    """
+    바이트 청크를 받는 대로 파싱하면서 보이는 텍스트만 모으는 추출기
+    max_chars에 도달하면 done이 True가 되며, 이후 입력은 무시 (다운로드도 중단 가능)
+    title, og:description, og:image도 같은 패스에서 추출
+    """
+
+    def __init__(self, max_chars: int = 8000):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.done = False
+        self.title: Optional[str] = None
+        self.description: Optional[str] = None
+        self.image: Optional[str] = None
+        self._decoder = None
+        self._chunks = []
+        self._length = 0
+        self._pending_space = False
+        self._skip_depth = 0
+        self._title_parts = None
+
+    def feed_bytes(self, data: bytes, encoding: str = "utf-8") -> bool:
+        """
+        바이트 청크를 파싱하고, 더 읽어야 하면 True 반환
+        """
+        if self.done:
+            return False
+        if self._decoder is None:
+            try:
+                self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+            except LookupError:
+                self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.feed(self._decoder.decode(data))
+        return not self.done
+
+    def result(self) -> ExtractedPage:
+        if not self.done:
+            self.close()
+        return ExtractedPage(
+            text="".join(self._chunks)[:self.max_chars],
+            title=self.title,
+            description=self.description,
+            image=self.image,
+        )
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == "title" and self.title is None:
+            self._title_parts = []
+        elif tag == "meta":
+            self._handle_meta(dict(attrs))
+        if tag in BLOCK_TAGS:
+            self._pending_space = True
+
+    def handle_startendtag(self, tag, attrs):
+        if self.done:
+            return
+        if tag == "meta":
+            self._handle_meta(dict(attrs))
+        elif tag in BLOCK_TAGS:
+            self._pending_space = True
+
+    def handle_endtag(self, tag):
+        if self.done:
+            return
+        if tag in SKIP_TAGS:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+        elif tag == "title" and self._title_parts is not None:
+            self.title = " ".join("".join(self._title_parts).split()) or None
+            self._title_parts = None
+        if tag in BLOCK_TAGS:
+            self._pending_space = True
+
+    def handle_data(self, data):
+        if self.done or self._skip_depth:
+            return
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+        words = data.split()
+        if not words:
+            if data:
+                self._pending_space = True
+            return
+        if self._chunks and (self._pending_space or data[0].isspace()):
+            self._chunks.append(" ")
+            self._length += 1
+        piece = " ".join(words)
+        self._chunks.append(piece)
+        self._length += len(piece)
+        self._pending_space = data[-1].isspace()
+        if self._length >= self.max_chars:
+            self.done = True
+
+    def _handle_meta(self, attrs):
+        key = (attrs.get("property") or attrs.get("name") or "").lower()
+        content = attrs.get("content")
+        if not content:
+            return
+        if key == "og:description" or (key == "description" and self.description is None):
+            self.description = content.strip()
+        elif key == "og:image" and self.image is None:
+            self.image = content.strip()
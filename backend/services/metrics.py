@@ -0,0 +1,334 @@
+import contextvars
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+def _buckets(value: str) -> Tuple[float, ...]:
+    return tuple(sorted(float(bucket) for bucket in value.split(",") if bucket.strip()))
+
+
+# 지연시간 히스토그램 구간 (초)
+METRICS_LATENCY_BUCKETS = _buckets(
+    os.getenv("METRICS_LATENCY_BUCKETS", "0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5,10")
+)
+# 요청당 SQL 개수 히스토그램 구간 (N+1 쿼리 확인용)
+METRICS_STATEMENT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+# 이 시간(ms)보다 오래 걸린 요청은 실행한 SQL 목록과 함께 로그 (0이면 사용 안 함)
+SLOW_REQUEST_LOG_MS = float(os.getenv("SLOW_REQUEST_LOG_MS", "0"))
+# 느린 요청 로그에 남길 최대 SQL 개수 / SQL 길이
+SLOW_REQUEST_MAX_STATEMENTS = int(os.getenv("SLOW_REQUEST_MAX_STATEMENTS", "50"))
+SLOW_REQUEST_STATEMENT_CHARS = 300
+
+
+@dataclass
+class RequestStats:
+    """요청 하나에서 실행한 SQL / 외부 호출 누적값"""
+    statements: int = 0
+    db_seconds: float = 0.0
+    external_seconds: float = 0.0
+    # 느린 요청 로그용 (경과 시간, SQL) 목록, 로그를 끄면 None
+    log: Optional[List[Tuple[float, str]]] = None
+
+
+# 현재 처리 중인 요청의 누적값 (스레드풀에서 실행되는 라우터에도 컨텍스트가 복사되어 전달됨)
+_current_request: contextvars.ContextVar[Optional[RequestStats]] = contextvars.ContextVar(
+    "metrics_current_request", default=None
+)
+
+
+INF_BUCKET = 'le="+Inf"'
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, labels: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        # 라벨 값 → [구간별 개수..., +Inf 개수, 합계]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, values: Tuple[str, ...], amount: float):
+        series = self._series.get(values)
+        if series is None:
+            series = self._series[values] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, amount)] += 1
+        series[-1] += amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for values, series in sorted(self._series.items()):
+            cumulative = 0
+            for bucket, count in zip(self.buckets, series):
+                cumulative += count
+                le = f'le="{_format_number(bucket)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, values, le)} {cumulative}")
+            cumulative += series[len(self.buckets)]
+            lines.append(f"{self.name}_bucket{_format_labels(self.labels, values, INF_BUCKET)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, values)} {_format_number(series[-1])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, values)} {cumulative}")
+        return lines
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labels: Sequence[str]):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, values: Tuple[str, ...], amount: float = 1):
+        self._values[values] = self._values.get(values, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for values, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labels, values)} {_format_number(value)}")
+        return lines
+
+
+class Gauge:
+    def __init__(self, name: str, help_text: str, labels: Sequence[str]):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, values: Tuple[str, ...], amount: float):
+        self._values[values] = amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} gauge"]
+        for values, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labels, values)} {_format_number(value)}")
+        return lines
+
+
+class Metrics:
+    """
+    요청/SQL/외부 호출 지표 (Prometheus 텍스트 형식으로 /metrics에 노출)
+    - 요청: 라우트(경로 템플릿)·상태 코드별 지연시간, 요청당 SQL 개수와 DB 시간
+    - SQL: 엔진 이벤트로 모든 실행을 측정 (스케줄러 등 요청 밖 실행도 포함)
+    - 외부 호출: OpenAI / Confluence / SMTP / 페이지 다운로드 호출 시간과 성공 여부
+    - 요청 제한: 라우트 클래스별 허용/거절 수와 처리 중인 요청 수
+    지표는 프로세스(워커)별이므로 Prometheus에서 워커별로 수집해 합산
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_progress = 0
+        self.request_duration = Histogram(
+            "http_request_duration_seconds", "HTTP 요청 처리 시간",
+            ("method", "route", "status"), METRICS_LATENCY_BUCKETS,
+        )
+        self.request_db_duration = Histogram(
+            "http_request_db_duration_seconds", "HTTP 요청당 SQL 실행 시간 합계",
+            ("method", "route"), METRICS_LATENCY_BUCKETS,
+        )
+        self.request_statements = Histogram(
+            "http_request_db_statements", "HTTP 요청당 실행한 SQL 개수",
+            ("method", "route"), METRICS_STATEMENT_BUCKETS,
+        )
+        self.statement_duration = Histogram(
+            "db_statement_duration_seconds", "SQL 실행 시간 (요청 밖 실행 포함)",
+            ("operation",), METRICS_LATENCY_BUCKETS,
+        )
+        self.external_duration = Histogram(
+            "external_call_duration_seconds", "외부 서비스 호출 시간",
+            ("service", "operation", "outcome"), METRICS_LATENCY_BUCKETS,
+        )
+        self.slow_requests = Counter(
+            "http_slow_requests_total", "SLOW_REQUEST_LOG_MS를 넘은 요청 수", ("method", "route"),
+        )
+        self.admission_admitted = Counter(
+            "http_admission_admitted_total", "요청 제한을 통과한 요청 수", ("route_class",),
+        )
+        self.admission_rejected = Counter(
+            "http_admission_rejected_total", "요청 제한으로 거절(429)한 요청 수 (reason=rate|concurrency)",
+            ("route_class", "reason"),
+        )
+        self.admission_in_flight = Gauge(
+            "http_admission_in_flight", "요청 제한 대상 라우트 클래스별 처리 중인 요청 수", ("route_class",),
+        )
+
+    # ---- 요청 ----
+
+    def start_request(self) -> Tuple[RequestStats, contextvars.Token]:
+        with self._lock:
+            self._in_progress += 1
+        stats = RequestStats(log=[] if SLOW_REQUEST_LOG_MS > 0 else None)
+        return stats, _current_request.set(stats)
+
+    def finish_request(self, token: contextvars.Token, stats: RequestStats,
+                       method: str, route: str, status: int, seconds: float):
+        _current_request.reset(token)
+        slow = SLOW_REQUEST_LOG_MS > 0 and seconds * 1000 >= SLOW_REQUEST_LOG_MS
+        with self._lock:
+            self._in_progress -= 1
+            self.request_duration.observe((method, route, str(status)), seconds)
+            self.request_db_duration.observe((method, route), stats.db_seconds)
+            self.request_statements.observe((method, route), stats.statements)
+            if slow:
+                self.slow_requests.inc((method, route))
+        if slow:
+            self._log_slow_request(stats, method, route, status, seconds)
+
+    def _log_slow_request(self, stats: RequestStats, method: str, route: str, status: int, seconds: float):
+        lines = [
+            f"[Metrics] 느린 요청: {method} {route} {status} {seconds * 1000:.1f}ms "
+            f"(SQL {stats.statements}개 {stats.db_seconds * 1000:.1f}ms, 외부 호출 {stats.external_seconds * 1000:.1f}ms)"
+        ]
+        for elapsed, statement in stats.log or []:
+            lines.append(f"    {elapsed * 1000:8.2f}ms  {statement}")
+        if stats.statements > len(stats.log or []):
+            lines.append(f"    ... SQL {stats.statements - len(stats.log)}개 생략")
+        print("\n".join(lines))
+
+    # ---- SQL ----
+
+    def record_statement(self, statement: str, seconds: float):
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+        if operation not in ("SELECT", "INSERT", "UPDATE", "DELETE"):
+            operation = "OTHER"
+        with self._lock:
+            self.statement_duration.observe((operation,), seconds)
+        stats = _current_request.get()
+        if stats is None:
+            return
+        stats.statements += 1
+        stats.db_seconds += seconds
+        if stats.log is not None and len(stats.log) < SLOW_REQUEST_MAX_STATEMENTS:
+            stats.log.append((seconds, " ".join(statement.split())[:SLOW_REQUEST_STATEMENT_CHARS]))
+
+    def instrument_engine(self, engine: Engine):
+        """엔진의 모든 SQL 실행 시간을 측정 (엔진 생성 직후 한 번 호출)"""
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            started = conn.info.get("metrics_started")
+            if started:
+                self.record_statement(statement, time.perf_counter() - started.pop())
+
+        @event.listens_for(engine, "handle_error")
+        def handle_error(exception_context):
+            # 실패한 SQL은 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+            connection = exception_context.connection
+            if connection is not None and connection.info.get("metrics_started"):
+                connection.info["metrics_started"].pop()
+
+    # ---- 외부 호출 ----
+
+    @contextmanager
+    def external_call(self, service: str, operation: str):
+        """with metrics.external_call("openai", "chat"): ... 형태로 외부 호출 시간 측정"""
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            yield
+            outcome = "ok"
+        finally:
+            seconds = time.perf_counter() - started
+            with self._lock:
+                self.external_duration.observe((service, operation, outcome), seconds)
+            stats = _current_request.get()
+            if stats is not None:
+                stats.external_seconds += seconds
+
+    # ---- 요청 제한 ----
+
+    def record_admission(self, route_class: str, in_flight: int, rejected_reason: Optional[str] = None):
+        with self._lock:
+            if rejected_reason is None:
+                self.admission_admitted.inc((route_class,))
+            else:
+                self.admission_rejected.inc((route_class, rejected_reason))
+            self.admission_in_flight.set((route_class,), in_flight)
+
+    def record_admission_in_flight(self, route_class: str, in_flight: int):
+        with self._lock:
+            self.admission_in_flight.set((route_class,), in_flight)
+
+    # ---- 노출 ----
+
+    def render(self) -> str:
+        with self._lock:
+            lines = [
+                "# HELP http_requests_in_progress 처리 중인 HTTP 요청 수",
+                "# TYPE http_requests_in_progress gauge",
+                f"http_requests_in_progress {self._in_progress}",
+            ]
+            for metric in (
+                self.request_duration,
+                self.request_db_duration,
+                self.request_statements,
+                self.slow_requests,
+                self.statement_duration,
+                self.external_duration,
+                self.admission_admitted,
+                self.admission_rejected,
+                self.admission_in_flight,
+            ):
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    요청마다 처리 시간 / SQL 개수 / DB 시간을 기록하는 ASGI 미들웨어
+    라우트 라벨은 실제 경로가 아닌 경로 템플릿(/posts/{post_id})을 사용하고, 매칭되지 않은 요청은 "unmatched"
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        stats, token = metrics.start_request()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            metrics.finish_request(token, stats, scope["method"], route, status, time.perf_counter() - started)
+
+
+# 전역 지표 인스턴스
+metrics = Metrics()
@@ -0,0 +1,63 @@
+import asyncio
+import os
+from typing import Optional
+
+import openai
+from dotenv import load_dotenv
+
+from services.metrics import metrics
+
+load_dotenv()
+
+# 동시에 진행할 수 있는 OpenAI 호출 수
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))
+# 호출 1건당 제한 시간 (초, 동시성 대기 시간 제외)
+OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "30"))
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "1"))
+# 프록시나 로컬 테스트 서버를 사용할 때 지정
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL")
+
+
+class OpenAIGateway:
+    """
+    앱 수명 동안 공유하는 AsyncOpenAI 클라이언트 (커넥션 풀 재사용)
+    세마포어로 동시 호출 수를 제한하고 호출마다 타임아웃 적용
+    """
+
+    def __init__(self, max_concurrency: int, timeout: float):
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._client: Optional[openai.AsyncOpenAI] = None
+
+    @property
+    def client(self) -> openai.AsyncOpenAI:
+        if self._client is None:
+            self._client = openai.AsyncOpenAI(
+                api_key=os.getenv("OPENAI_API_KEY"),
+                base_url=OPENAI_BASE_URL,
+                timeout=self.timeout,
+                max_retries=OPENAI_MAX_RETRIES,
+            )
+        return self._client
+
+    async def chat(self, **kwargs) -> Optional[str]:
+        """
+        chat.completions.create 호출 후 첫 번째 응답 메시지 반환
+        """
+        async with self._semaphore:
+            # 동시성 대기 시간은 제외하고 실제 호출 시간만 측정
+            with metrics.external_call("openai", "chat"):
+                response = await asyncio.wait_for(
+                    self.client.chat.completions.create(**kwargs),
+                    timeout=self.timeout,
+                )
+        return response.choices[0].message.content
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+# 전역 OpenAI 게이트웨이 인스턴스
+openai_gateway = OpenAIGateway(OPENAI_MAX_CONCURRENCY, OPENAI_TIMEOUT)
@@ -0,0 +1,123 @@
+import asyncio
+import os
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import httpx
+
+from services.metrics import metrics
+
+# 페이지 본문을 최대 몇 바이트까지 읽을지 (초과분은 읽지 않음)
+PAGE_FETCH_MAX_BYTES = int(os.getenv("PAGE_FETCH_MAX_BYTES", str(1024 * 1024)))
+PAGE_FETCH_CONNECT_TIMEOUT = float(os.getenv("PAGE_FETCH_CONNECT_TIMEOUT", "3"))
+# 청크 사이 최대 대기 시간 (느리게 흘려보내는 서버 대응)
+PAGE_FETCH_READ_TIMEOUT = float(os.getenv("PAGE_FETCH_READ_TIMEOUT", "5"))
+# 요청 전체 제한 시간
+PAGE_FETCH_TOTAL_TIMEOUT = float(os.getenv("PAGE_FETCH_TOTAL_TIMEOUT", "10"))
+PAGE_FETCH_MAX_CONNECTIONS = int(os.getenv("PAGE_FETCH_MAX_CONNECTIONS", "20"))
+
+HTML_CONTENT_TYPES = {"text/html", "application/xhtml+xml"}
+USER_AGENT = 'Mozilla/5.0 (compatible; TechTalkBot/1.0)'
+
+
+class PageFetchError(Exception):
+    """HTML이 아니거나 제한 시간 내에 받을 수 없는 페이지"""
+
+
+@dataclass
+class FetchedPage:
+    url: str
+    encoding: str
+    body: bytes
+    truncated: bool
+
+    @property
+    def text(self) -> str:
+        try:
+            return self.body.decode(self.encoding, errors="replace")
+        except LookupError:
+            # 알 수 없는 charset이면 utf-8로 처리
+            return self.body.decode("utf-8", errors="replace")
+
+
+class PageFetcher:
+    """
+    URL 분석용 페이지 다운로드 (앱 수명 동안 커넥션 풀 공유)
+    본문을 스트리밍으로 읽다가 PAGE_FETCH_MAX_BYTES에 도달하면 중단
+    """
+
+    def __init__(self, max_bytes: int, total_timeout: float):
+        self.max_bytes = max_bytes
+        self.total_timeout = total_timeout
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={'User-Agent': USER_AGENT},
+                timeout=httpx.Timeout(
+                    connect=PAGE_FETCH_CONNECT_TIMEOUT,
+                    read=PAGE_FETCH_READ_TIMEOUT,
+                    write=PAGE_FETCH_READ_TIMEOUT,
+                    pool=PAGE_FETCH_CONNECT_TIMEOUT,
+                ),
+                limits=httpx.Limits(
+                    max_connections=PAGE_FETCH_MAX_CONNECTIONS,
+                    max_keepalive_connections=PAGE_FETCH_MAX_CONNECTIONS,
+                ),
+                follow_redirects=True,
+            )
+        return self._client
+
+    async def fetch(self, url: str, on_chunk: Optional[Callable[[bytes, str], bool]] = None) -> FetchedPage:
+        """
+        on_chunk(청크, 인코딩)을 넘기면 본문을 모으지 않고 청크마다 전달하며,
+        on_chunk가 False를 반환하면 그 즉시 다운로드 중단
+        """
+        try:
+            with metrics.external_call("page", "fetch"):
+                return await asyncio.wait_for(self._fetch(url, on_chunk), timeout=self.total_timeout)
+        except asyncio.TimeoutError:
+            raise PageFetchError(f"페이지 응답 시간이 {self.total_timeout:g}초를 초과했습니다.")
+
+    async def _fetch(self, url: str, on_chunk) -> FetchedPage:
+        async with self.client.stream("GET", url) as response:
+            response.raise_for_status()
+            # 본문을 읽기 전에 HTML이 아닌 응답은 거절
+            content_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+            if content_type and content_type not in HTML_CONTENT_TYPES:
+                raise PageFetchError(f"HTML 페이지가 아닙니다: {content_type}")
+
+            encoding = response.charset_encoding or "utf-8"
+            chunks = []
+            size = 0
+            truncated = False
+            async for chunk in response.aiter_bytes():
+                remaining = self.max_bytes - size
+                if len(chunk) >= remaining:
+                    chunk = chunk[:remaining]
+                    truncated = True
+                size += len(chunk)
+                if on_chunk is None:
+                    chunks.append(chunk)
+                elif not on_chunk(chunk, encoding):
+                    truncated = True
+                    break
+                if size >= self.max_bytes:
+                    break
+            return FetchedPage(
+                url=str(response.url),
+                encoding=encoding,
+                body=b"".join(chunks),
+                truncated=truncated,
+            )
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# 전역 페이지 다운로더 인스턴스
+page_fetcher = PageFetcher(PAGE_FETCH_MAX_BYTES, PAGE_FETCH_TOTAL_TIMEOUT)
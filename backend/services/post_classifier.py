@@ -0,0 +1,139 @@
+import hashlib
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter, OrderedDict
+from typing import Dict, Optional, Tuple
+
+# 판별 결과 메모 최대 개수 / 유효 시간 (초)
+POST_CLASSIFY_MEMO_SIZE = int(os.getenv("POST_CLASSIFY_MEMO_SIZE", "2000"))
+POST_CLASSIFY_MEMO_TTL = int(os.getenv("POST_CLASSIFY_MEMO_TTL", str(24 * 3600)))
+# 모델 호출 없이 기술 글로 판단할 최소 기술 키워드 수
+POST_CLASSIFY_TECH_KEYWORDS = int(os.getenv("POST_CLASSIFY_TECH_KEYWORDS", "3"))
+
+TECH_KEYWORDS = {
+    "python", "java", "javascript", "typescript", "kotlin", "golang", "rust", "c++", "swift",
+    "react", "next.js", "vue", "spring", "django", "fastapi", "node.js", "api", "sdk", "http",
+    "sql", "mysql", "postgresql", "redis", "docker", "kubernetes", "aws", "gcp", "azure", "linux",
+    "git", "github", "ci/cd", "llm", "gpt", "머신러닝", "딥러닝", "인공지능", "알고리즘", "자료구조",
+    "프로그래밍", "개발자", "프레임워크", "라이브러리", "데이터베이스", "서버", "클라이언트", "백엔드",
+    "프론트엔드", "배포", "클라우드", "캐시", "인덱스", "쿼리", "컴파일", "리팩토링", "테스트 코드",
+    "네트워크", "운영체제", "아키텍처", "마이크로서비스", "트래픽", "성능", "보안", "취약점", "오픈소스",
+}
+COMMERCIAL_KEYWORDS = {
+    "카톡", "오픈채팅", "텔레그램", "할인", "무료 체험", "무료체험", "이벤트 참여", "구매",
+    "최저가", "수익 보장", "부업", "문의 주세요", "문의주세요", "대출", "홍보",
+}
+PROFANITY_KEYWORDS = {"시발", "씨발", "ㅅㅂ", "병신", "ㅂㅅ", "개새끼", "좆", "fuck", "shit"}
+ASCII_WORD_PATTERN = re.compile(r"[a-z0-9][a-z0-9.+#/]*[a-z0-9+#]|[a-z0-9]")
+PHONE_PATTERN = re.compile(r"01[016789][-. ]?\d{3,4}[-. ]?\d{4}")
+REPEATED_CHAR_PATTERN = re.compile(r"([^\W\d_])\1{9,}")
+
+
+def normalize_content(content: str) -> str:
+    """
+    공백/대소문자/유니코드 표기 차이를 없애서 같은 글이 같은 해시가 되도록 정규화
+    """
+    return " ".join(unicodedata.normalize("NFKC", content).lower().split())
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(normalize_content(content).encode("utf-8")).hexdigest()
+
+
+def _is_abusive(text: str) -> bool:
+    """오해할 여지가 없는 경우만 (욕설, 같은 단어가 대부분인 도배 글)"""
+    if any(word in text for word in PROFANITY_KEYWORDS):
+        return True
+    words = text.split()
+    if len(words) >= 8 and Counter(words).most_common(1)[0][1] / len(words) > 0.5:
+        return True
+    return False
+
+
+def _is_suspicious(text: str) -> bool:
+    """
+    광고/도배일 수도 있지만 기술 글에도 나올 수 있는 신호
+    (예: 쇼핑몰 백엔드 글의 "구매"/"할인", 예시 전화번호, "ㅋㅋㅋ" 반복) → 로컬에서 결정하지 않고 모델이 판단
+    """
+    if any(word in text for word in COMMERCIAL_KEYWORDS) or PHONE_PATTERN.search(text):
+        return True
+    # 같은 글자 10회 이상 반복 (구분선, 숫자 제외)
+    return REPEATED_CHAR_PATTERN.search(text) is not None
+
+
+def prefilter(content: str) -> Optional[bool]:
+    """
+    명백한 경우만 로컬에서 판별 (욕설/단어 도배 → False, 광고 신호 없이 기술 키워드가 충분하면 True)
+    애매하면 None을 반환해서 모델이 판단하도록 함
+    """
+    text = normalize_content(content)
+    if _is_abusive(text):
+        return False
+    if _is_suspicious(text):
+        return None
+    # 영문 키워드는 단어 단위로 ("api"가 "capital"에 걸리지 않도록), 한글 키워드는 부분 일치로 비교
+    ascii_words = set(ASCII_WORD_PATTERN.findall(text))
+    tech_hits = sum(
+        1 for word in TECH_KEYWORDS
+        if (word in ascii_words if word.isascii() else word in text)
+    )
+    if tech_hits >= POST_CLASSIFY_TECH_KEYWORDS:
+        return True
+    return None
+
+
+class PostClassifier:
+    """
+    /analyze-post 판별 단계: 메모(같은 내용 재제출) → 로컬 사전 판별 → 모델
+    단계별로 몇 번 결정했는지 카운터를 유지
+    """
+
+    def __init__(self, memo_size: int, memo_ttl: int):
+        self.memo_size = memo_size
+        self.memo_ttl = memo_ttl
+        self._memo: "OrderedDict[str, Tuple[bool, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = Counter()
+
+    def classify_locally(self, content: str) -> Tuple[str, Optional[bool]]:
+        """
+        (내용 해시, 판별 결과)를 반환. 결과가 None이면 모델 호출 필요
+        """
+        key = content_hash(content)
+        with self._lock:
+            entry = self._memo.get(key)
+            if entry and entry[1] > time.monotonic():
+                self._memo.move_to_end(key)
+                self._counters["memo"] += 1
+                return key, entry[0]
+
+        decision = prefilter(content)
+        if decision is not None:
+            with self._lock:
+                self._counters["prefilter_tech" if decision else "prefilter_reject"] += 1
+        return key, decision
+
+    def record_model_decision(self, key: str, decision: bool):
+        with self._lock:
+            self._counters["model"] += 1
+            self._memo[key] = (decision, time.monotonic() + self.memo_ttl)
+            self._memo.move_to_end(key)
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "memo": self._counters["memo"],
+                "prefilter_tech": self._counters["prefilter_tech"],
+                "prefilter_reject": self._counters["prefilter_reject"],
+                "model": self._counters["model"],
+                "memo_size": len(self._memo),
+            }
+
+
+# 전역 게시글 판별기 인스턴스
+post_classifier = PostClassifier(POST_CLASSIFY_MEMO_SIZE, POST_CLASSIFY_MEMO_TTL)
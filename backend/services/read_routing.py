@@ -0,0 +1,109 @@
+import os
+import re
+import threading
+import time
+from typing import Dict, Optional
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from database import (
+    AsyncReadSessionLocal, AsyncSessionLocal, ReadSessionLocal, SessionLocal, has_replica, is_replica_bind,
+)
+
+# 쓰기 직후 같은 클라이언트의 조회를 주 DB로 보내는 시간 (초, 복제 지연보다 길게)
+DB_REPLICA_STICKY_SECONDS = float(os.getenv("DB_REPLICA_STICKY_SECONDS", "5"))
+# 쓰기 시각을 기록하는 쿠키 (워커가 여러 개여도 같은 브라우저면 주 DB로 조회)
+READ_PRIMARY_COOKIE = "tt_read_primary_until"
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+# DB에 쓰는 경로 (게시글/댓글 작성·수정·삭제, 메일 발송 작업 등록)
+# 분석 API(/analyze-url, /analyze-post)나 비밀번호 확인처럼 DB에 쓰지 않는 POST는 제외
+WRITE_PATH_PATTERN = re.compile(r"^/(posts|comments)(/\d+)?/?$|^/email/(send-weekly|test)/?$")
+
+
+class ReadRouting:
+    """
+    조회 API의 DB 세션 선택 (복제본 / 주 DB)
+    - 기본은 복제본, 같은 클라이언트가 최근 DB_REPLICA_STICKY_SECONDS 안에 쓰기를 했으면 주 DB
+      (방금 작성/수정한 글이 복제 지연 때문에 목록에서 안 보이는 문제 방지)
+    - 클라이언트 구분: 쓰기 응답에 심는 쿠키 + 워커 내 IP별 기록 (쿠키를 보내지 않는 클라이언트 대응)
+    """
+
+    def __init__(self, sticky_seconds: float):
+        self.sticky_seconds = sticky_seconds
+        self._recent_writes: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def mark_write(self, client: Optional[str]) -> float:
+        """쓰기 성공 시 호출, 주 DB로 조회할 기한(epoch 초) 반환"""
+        until = time.time() + self.sticky_seconds
+        if client:
+            with self._lock:
+                self._recent_writes[client] = until
+                if len(self._recent_writes) > 10000:
+                    now = time.time()
+                    self._recent_writes = {
+                        key: expires for key, expires in self._recent_writes.items() if expires > now
+                    }
+        return until
+
+    def prefers_primary(self, request: Request) -> bool:
+        if not has_replica():
+            return True
+        now = time.time()
+        try:
+            if float(request.cookies.get(READ_PRIMARY_COOKIE, 0)) > now:
+                return True
+        except ValueError:
+            pass
+        client = request.client.host if request.client else None
+        with self._lock:
+            return self._recent_writes.get(client, 0) > now
+
+    def session_for(self, request: Request) -> Session:
+        return SessionLocal() if self.prefers_primary(request) else ReadSessionLocal()
+
+    def async_session_for(self, request: Request) -> AsyncSession:
+        return AsyncSessionLocal() if self.prefers_primary(request) else AsyncReadSessionLocal()
+
+    def lag_window(self, db) -> float:
+        """복제본 세션이면 복제 지연을 감안할 시간(초), 주 DB 세션이면 0 (응답 캐시 저장 판단용)"""
+        return self.sticky_seconds if is_replica_bind(db.get_bind()) else 0.0
+
+
+class ReadYourWritesMiddleware:
+    """
+    DB에 쓰는 요청(WRITE_PATH_PATTERN 경로의 POST/PUT/PATCH/DELETE)이 성공하면 클라이언트를 기록하고 쿠키를 심는 ASGI 미들웨어
+    복제본이 없으면 아무것도 하지 않음
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in WRITE_METHODS
+            or not WRITE_PATH_PATTERN.match(scope["path"])
+            or not has_replica()
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                client = scope.get("client")
+                until = read_routing.mark_write(client[0] if client else None)
+                cookie = (
+                    f"{READ_PRIMARY_COOKIE}={int(until) + 1}; Max-Age={int(read_routing.sticky_seconds) + 1}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = list(message.get("headers", [])) + [(b"set-cookie", cookie.encode("latin-1"))]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+# 전역 조회 라우팅 인스턴스
+read_routing = ReadRouting(DB_REPLICA_STICKY_SECONDS)
@@ -0,0 +1,176 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, Optional
+
+# 캐시할 응답 최대 개수 / 유효 시간 (초)
+# 캐시는 프로세스(워커)별이므로 다른 워커에서 수정된 내용은 최대 TTL만큼 늦게 반영됨
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2000"))
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "30"))
+
+# 무효화 태그: 모든 게시글 목록 / 게시글별 (상세 + 그 게시글이 포함된 목록)
+POST_LIST_TAG = "posts"
+
+
+def post_tag(post_id: int) -> str:
+    return f"post:{post_id}"
+
+
+def _without_views(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _without_views(item) for key, item in value.items() if key != "views"}
+    if isinstance(value, list):
+        return [_without_views(item) for item in value]
+    return value
+
+
+def make_etag(body: Any) -> str:
+    """
+    응답 내용으로 만든 버전 (워커/재시작과 무관하게 같은 내용이면 같은 값)
+    조회수는 읽을 때마다 바뀌므로 버전에 포함하지 않음 (약한 ETag)
+    """
+    data = json.dumps(_without_views(body), ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return 'W/"' + hashlib.sha1(data.encode("utf-8")).hexdigest()[:20] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {value.strip() for value in if_none_match.split(",")}
+    # 약한 비교: W/ 접두사 유무는 무시
+    return "*" in candidates or etag in candidates or etag[2:] in candidates
+
+
+@dataclass
+class CachedResponse:
+    body: Any
+    etag: str
+    tags: FrozenSet[str]
+    expires_at: float
+    # 응답마다 달라지는 값 계산용 (예: 게시글 조회수 보정값)
+    extra: Any = None
+    # 인코딩한 응답 본문 (처음 응답할 때 채우고 이후 적중 시 그대로 사용)
+    encoded: Optional[bytes] = None
+
+
+class ResponseCache:
+    """
+    GET 응답 캐시 (LRU + TTL)
+    - 항목마다 무효화 태그를 달고, 쓰기 API가 커밋 후 해당 태그만 무효화
+    - 조회 시작 시점의 세대(generation)를 받아두었다가 저장할 때 그 사이에 무효화가 있었으면 저장하지 않음
+      (커밋 전 데이터를 읽은 요청이 무효화 직후 예전 응답을 다시 넣는 경쟁 방지)
+    - 복제본에서 읽은 응답은 settle_seconds 안에 무효화된 태그가 있으면 저장하지 않음
+      (복제 지연 중인 예전 데이터가 무효화 직후 캐시에 다시 들어가는 것 방지)
+    """
+
+    def __init__(self, max_entries: int, ttl: int):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._keys_by_tag: Dict[str, set] = {}
+        self._invalidated_at: Dict[str, int] = {}
+        self._invalidated_time: Dict[str, float] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._counters = Counter()
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self._counters["miss"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hit"] += 1
+            return entry
+
+    def put(self, key: Hashable, body: Any, tags: Iterable[str], generation: int, extra: Any = None,
+            settle_seconds: float = 0) -> CachedResponse:
+        entry = CachedResponse(
+            body=body,
+            etag=make_etag(body),
+            tags=frozenset(tags),
+            expires_at=time.monotonic() + self.ttl,
+            extra=extra,
+        )
+        with self._lock:
+            if any(self._invalidated_at.get(tag, 0) > generation for tag in entry.tags):
+                self._counters["stale_skip"] += 1
+                return entry
+            if settle_seconds > 0:
+                settled_after = time.monotonic() - settle_seconds
+                if any(self._invalidated_time.get(tag, 0) > settled_after for tag in entry.tags):
+                    self._counters["stale_skip"] += 1
+                    return entry
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            for tag in entry.tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._counters["evicted"] += 1
+        return entry
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def invalidate(self, *tags: str):
+        with self._lock:
+            self._generation += 1
+            now = time.monotonic()
+            for tag in tags:
+                self._invalidated_at[tag] = self._generation
+                self._invalidated_time[tag] = now
+                for key in list(self._keys_by_tag.get(tag, ())):
+                    self._remove(key)
+                    self._counters["invalidated"] += 1
+            # 태그별 무효화 기록은 진행 중인 조회보다 오래된 것만 있으면 되므로 적당히 정리
+            if len(self._invalidated_at) > self.max_entries * 4:
+                cutoff = self._generation - self.max_entries
+                self._invalidated_at = {
+                    tag: generation for tag, generation in self._invalidated_at.items() if generation > cutoff
+                }
+                self._invalidated_time = {
+                    tag: at for tag, at in self._invalidated_time.items() if tag in self._invalidated_at
+                }
+
+    def record_not_modified(self):
+        with self._lock:
+            self._counters["not_modified"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._counters["hit"] + self._counters["miss"]
+            return {
+                "hit": self._counters["hit"],
+                "miss": self._counters["miss"],
+                "hit_ratio": round(self._counters["hit"] / lookups, 4) if lookups else 0.0,
+                "not_modified": self._counters["not_modified"],
+                "invalidated": self._counters["invalidated"],
+                "evicted": self._counters["evicted"],
+                "stale_skip": self._counters["stale_skip"],
+                "size": len(self._entries),
+            }
+
+
+# 전역 응답 캐시 인스턴스
+response_cache = ResponseCache(RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_TTL)
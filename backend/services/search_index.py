@@ -0,0 +1,291 @@
+import os
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, delete, func, insert, or_, update
+from sqlalchemy.orm import Session, aliased
+
+from models.post import Post
+from models.search import SearchDocument, SearchPosting
+
+# 필드별 가중치 (토큰이 한 번 나올 때마다 더함)
+SEARCH_TITLE_WEIGHT = int(os.getenv("SEARCH_TITLE_WEIGHT", "5"))
+SEARCH_TAG_WEIGHT = int(os.getenv("SEARCH_TAG_WEIGHT", "5"))
+SEARCH_CONTENT_WEIGHT = 1
+SEARCH_COMMENT_WEIGHT = 1
+# 같은 토큰 반복으로 점수를 부풀리지 않도록 게시글당 토큰 가중치 상한
+SEARCH_MAX_TERM_WEIGHT = int(os.getenv("SEARCH_MAX_TERM_WEIGHT", "50"))
+# 검색어에서 사용할 최대 토큰 수
+SEARCH_MAX_QUERY_TERMS = int(os.getenv("SEARCH_MAX_QUERY_TERMS", "16"))
+# 여러 토큰 검색 시 가장 드문 토큰의 역색인에서 가중치 순으로 읽을 최대 후보 수
+# (가장 드문 토큰도 이보다 많은 게시글에 있으면 그 토큰 가중치 상위 후보 안에서만 순위를 매김)
+SEARCH_MAX_CANDIDATES = int(os.getenv("SEARCH_MAX_CANDIDATES", "5000"))
+# 결과 미리보기 길이
+SEARCH_SNIPPET_CHARS = 160
+
+TERM_MAX_LENGTH = 64
+# 한글 음절 묶음 / 그 외 문자·숫자 묶음
+TOKEN_PATTERN = re.compile(r"[가-힣]+|[^\W_가-힣]+")
+# 검색어 끝에서 떼어낼 한 글자 조사
+QUERY_PARTICLES = set("을를은는이가에의도로와과")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    검색 토큰 목록 (중복 포함, 빈도 계산용)
+    - 한글은 조사/어미가 붙어도 찾을 수 있도록 음절 bigram으로 분해 ("데이터베이스" → 데이, 이터, 터베, 베이, 이스)
+    - 한 글자 한글 단어는 그대로, 영문/숫자는 소문자 단어 단위
+    """
+    if not text:
+        return []
+    tokens = []
+    for run in TOKEN_PATTERN.findall(unicodedata.normalize("NFKC", text).lower()):
+        if "가" <= run[0] <= "힣":
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run[:TERM_MAX_LENGTH])
+    return tokens
+
+
+def query_terms(query: str) -> List[str]:
+    """
+    검색어 토큰 (중복 제거)
+    세 글자 이상 한글 단어 끝의 조사는 떼고 분해 ("인덱스를" → 인덱, 덱스)
+    """
+    words = []
+    for run in TOKEN_PATTERN.findall(unicodedata.normalize("NFKC", query).lower()):
+        if len(run) >= 3 and "가" <= run[0] <= "힣" and run[-1] in QUERY_PARTICLES:
+            run = run[:-1]
+        words.append(run)
+    return list(dict.fromkeys(tokenize(" ".join(words))))[:SEARCH_MAX_QUERY_TERMS]
+
+
+# 게시글 색인 대상 필드 (제목, 본문, 태그)
+PostFields = Tuple[str, str, Optional[Iterable[str]]]
+
+
+def post_terms(fields: Optional[PostFields]) -> Counter:
+    """게시글 제목/본문/태그의 토큰별 가중치 합 (상한 적용 전)"""
+    weights = Counter()
+    if fields is None:
+        return weights
+    title, content, tags = fields
+    for token in tokenize(title):
+        weights[token] += SEARCH_TITLE_WEIGHT
+    for tag in tags or []:
+        for token in tokenize(tag):
+            weights[token] += SEARCH_TAG_WEIGHT
+    for token in tokenize(content):
+        weights[token] += SEARCH_CONTENT_WEIGHT
+    return weights
+
+
+def comment_terms(content: Optional[str]) -> Counter:
+    """댓글 하나의 토큰별 가중치 합"""
+    weights = Counter()
+    for token in tokenize(content):
+        weights[token] += SEARCH_COMMENT_WEIGHT
+    return weights
+
+
+def document_terms(title: str, content: str, tags: Optional[Iterable[str]], comments: Iterable[str]) -> Dict[str, int]:
+    """게시글 + 전체 댓글의 토큰별 가중치 합 (상한 적용 전, 재색인용)"""
+    weights = post_terms((title, content, tags))
+    for comment in comments:
+        weights.update(comment_terms(comment))
+    return dict(weights)
+
+
+def _delta(before: Counter, after: Counter) -> Dict[str, int]:
+    return {
+        term: after.get(term, 0) - before.get(term, 0)
+        for term in before.keys() | after.keys()
+        if after.get(term, 0) != before.get(term, 0)
+    }
+
+
+def make_snippet(content: str, terms: List[str]) -> str:
+    """
+    본문에서 검색어가 처음 나오는 위치 주변을 잘라서 반환
+    """
+    text = " ".join(content.split())
+    lowered = text.lower()
+    positions = [position for position in (lowered.find(term) for term in terms) if position >= 0]
+    start = max(min(positions) - SEARCH_SNIPPET_CHARS // 4, 0) if positions else 0
+    snippet = text[start:start + SEARCH_SNIPPET_CHARS]
+    return ("..." if start > 0 else "") + snippet + ("..." if start + SEARCH_SNIPPET_CHARS < len(text) else "")
+
+
+class SearchIndex:
+    """
+    게시글 단위 역색인 (search_posting: 토큰, 게시글 id, 가중치)
+    - 게시글/댓글이 바뀌면 같은 트랜잭션에서 바뀐 필드/댓글 하나의 토큰 가중치만 더하고 뺌
+      (댓글이 많은 게시글도 댓글 쓰기 비용이 댓글 길이에만 비례)
+    - 전체 재계산은 재색인 스크립트(scripts.rebuild_search_index)에서만 수행
+    - 검색은 역색인만 읽어서 점수 순 id 목록을 만들고, 해당 id의 게시글만 PK로 조회 (post 테이블 스캔 없음)
+    """
+
+    def _apply(self, db: Session, post_id: int, terms: Dict[str, int]):
+        """게시글의 색인을 terms(상한 적용 전 가중치)로 교체 (재색인용)"""
+        existing = dict(
+            db.query(SearchPosting.term, SearchPosting.raw_weight).filter(SearchPosting.post_id == post_id)
+        )
+        stale = [term for term, weight in existing.items() if terms.get(term) != weight]
+        fresh = [
+            {"term": term, "post_id": post_id, "weight": min(weight, SEARCH_MAX_TERM_WEIGHT), "raw_weight": weight}
+            for term, weight in terms.items()
+            if existing.get(term) != weight
+        ]
+        for start in range(0, len(stale), 500):
+            db.execute(
+                delete(SearchPosting).where(
+                    SearchPosting.post_id == post_id,
+                    SearchPosting.term.in_(stale[start:start + 500]),
+                )
+            )
+        if fresh:
+            db.execute(insert(SearchPosting), fresh)
+
+        document = db.get(SearchDocument, post_id)
+        if document is None:
+            db.add(SearchDocument(post_id=post_id, term_count=len(terms)))
+        else:
+            document.term_count = len(terms)
+
+    def _apply_delta(self, db: Session, post_id: int, delta: Dict[str, int]):
+        """
+        게시글의 토큰별 가중치에 delta를 더함 (0 이하가 된 토큰은 삭제)
+        게시글 행을 잠가서 같은 게시글의 동시 색인 변경을 직렬화
+        """
+        if not delta:
+            return
+        # 세션이 autoflush=False이므로 방금 추가한 게시글을 먼저 반영
+        db.flush()
+        if db.query(Post.id).filter(Post.id == post_id).with_for_update().first() is None:
+            return
+        terms = list(delta)
+        existing = {}
+        for start in range(0, len(terms), 500):
+            existing.update(
+                db.query(SearchPosting.term, SearchPosting.raw_weight).filter(
+                    SearchPosting.post_id == post_id,
+                    SearchPosting.term.in_(terms[start:start + 500]),
+                )
+            )
+        stale, changed, fresh = [], [], []
+        for term, amount in delta.items():
+            weight = existing.get(term, 0) + amount
+            if weight <= 0:
+                if term in existing:
+                    stale.append(term)
+                continue
+            row = {"term": term, "post_id": post_id, "weight": min(weight, SEARCH_MAX_TERM_WEIGHT), "raw_weight": weight}
+            (changed if term in existing else fresh).append(row)
+        for start in range(0, len(stale), 500):
+            db.execute(
+                delete(SearchPosting).where(
+                    SearchPosting.post_id == post_id,
+                    SearchPosting.term.in_(stale[start:start + 500]),
+                )
+            )
+        if changed:
+            db.execute(update(SearchPosting), changed)
+        if fresh:
+            db.execute(insert(SearchPosting), fresh)
+
+        document = db.get(SearchDocument, post_id)
+        if document is None:
+            db.add(SearchDocument(post_id=post_id, term_count=len(fresh)))
+        else:
+            document.term_count += len(fresh) - len(stale)
+
+    def index_post_change(self, db: Session, post_id: int, before: Optional[PostFields], after: Optional[PostFields]):
+        """
+        게시글 생성(before=None)/수정 후 (commit 이전) 호출
+        before/after는 (제목, 본문, 태그), 바뀐 필드의 토큰만 반영하고 댓글 색인은 건드리지 않음
+        """
+        self._apply_delta(db, post_id, _delta(post_terms(before), post_terms(after)))
+
+    def index_comment_change(self, db: Session, post_id: int, before: Optional[str], after: Optional[str]):
+        """
+        댓글 생성(before=None)/수정/삭제(after=None) 후 (commit 이전) 호출
+        해당 댓글의 토큰만 반영 (게시글의 다른 댓글은 읽지 않음)
+        """
+        self._apply_delta(db, post_id, _delta(comment_terms(before), comment_terms(after)))
+
+    def index_batch(self, db: Session, posts: List, comments_by_post: Dict[int, List[str]]):
+        """재색인 스크립트용: 이미 조회한 게시글/댓글로 색인"""
+        for post in posts:
+            self._apply(
+                db,
+                post.id,
+                document_terms(post.title, post.content, post.tags, comments_by_post.get(post.id, [])),
+            )
+
+    def remove_post(self, db: Session, post_id: int):
+        db.execute(delete(SearchPosting).where(SearchPosting.post_id == post_id))
+        db.execute(delete(SearchDocument).where(SearchDocument.post_id == post_id))
+
+    def _document_frequency(self, db: Session, term: str) -> int:
+        """토큰이 있는 게시글 수 (SEARCH_MAX_CANDIDATES + 1에서 멈춤, 가장 드문 토큰 선택용)"""
+        matched = (
+            db.query(SearchPosting.post_id)
+            .filter(SearchPosting.term == term)
+            .limit(SEARCH_MAX_CANDIDATES + 1)
+            .subquery()
+        )
+        return db.query(func.count()).select_from(matched).scalar()
+
+    def search(
+        self,
+        db: Session,
+        terms: List[str],
+        limit: int,
+        after: Optional[Tuple[int, int]] = None,
+    ) -> List[Tuple[int, int]]:
+        """
+        모든 검색 토큰을 포함하는 게시글을 (점수 desc, id desc) 순으로 limit개 반환
+        after=(점수, id)이면 그 다음 위치부터 (키셋 페이지네이션)
+        - 토큰 하나: (term, weight, post_id) 인덱스를 점수 순으로 limit개만 읽음
+        - 여러 토큰: 가장 드문 토큰의 역색인을 후보로 두고 나머지 토큰은 후보별 PK 조회로 점수 합산
+        """
+        if not terms:
+            return []
+        if len(terms) == 1:
+            score = SearchPosting.weight
+            post_id = SearchPosting.post_id
+            query = db.query(post_id, score.label("score")).filter(SearchPosting.term == terms[0])
+        else:
+            frequencies = {term: self._document_frequency(db, term) for term in terms}
+            if not all(frequencies.values()):
+                return []
+            rarest, *others = sorted(terms, key=lambda term: frequencies[term])
+            candidates = (
+                db.query(SearchPosting.post_id, SearchPosting.weight)
+                .filter(SearchPosting.term == rarest)
+                .order_by(SearchPosting.weight.desc(), SearchPosting.post_id.desc())
+                .limit(SEARCH_MAX_CANDIDATES)
+                .subquery()
+            )
+            post_id = candidates.c.post_id
+            score = candidates.c.weight
+            query = db.query(post_id.label("post_id"))
+            for term in others:
+                posting = aliased(SearchPosting)
+                query = query.join(posting, and_(posting.term == term, posting.post_id == post_id))
+                score = score + posting.weight
+            query = query.add_columns(score.label("score"))
+        if after is not None:
+            after_score, after_id = after
+            query = query.filter(or_(score < after_score, and_(score == after_score, post_id < after_id)))
+        rows = query.order_by(score.desc(), post_id.desc()).limit(limit).all()
+        return [(row.post_id, int(row.score)) for row in rows]
+
+
+# 전역 검색 색인 인스턴스
+search_index = SearchIndex()
@@ -0,0 +1,167 @@
+import heapq
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, delete, exists, insert, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
+
+from models.tag import PostTag, Tag
+
+TAG_NAME_MAX_LENGTH = 100
+
+
+def tag_key(name: str) -> str:
+    """대소문자를 구분하지 않고 비교하기 위한 태그 이름 (tag.normalized_name)"""
+    return name.casefold()[:TAG_NAME_MAX_LENGTH]
+
+
+def normalize_tags(tags: Optional[Iterable[str]]) -> List[str]:
+    """앞뒤 공백 제거, 빈 태그/중복(대소문자 무시) 제거 (입력 순서와 처음 나온 표기 유지)"""
+    names = (tag.strip()[:TAG_NAME_MAX_LENGTH] for tag in tags or [] if isinstance(tag, str))
+    unique = {}
+    for name in names:
+        if name:
+            unique.setdefault(tag_key(name), name)
+    return list(unique.values())
+
+
+class TagIndex:
+    """
+    태그 ↔ 게시글 연결 테이블(post_tag)과 태그별 게시글 수(tag.post_count) 관리
+    - 게시글 생성/수정/삭제 시 같은 트랜잭션에서 바뀐 태그만 반영
+    - 태그별 목록은 (tag_id, created_at, post_id) 인덱스 범위만 읽으므로 전체 게시글 수와 무관
+    - 태그는 대소문자를 구분하지 않음 (normalized_name으로 찾고, name은 처음 쓰인 표기)
+    """
+
+    def _tag_ids(self, db: Session, names: List[str]) -> Dict[str, int]:
+        """태그 이름 → id (없으면 생성, 동시에 같은 태그를 만드는 경우 기존 행 사용)"""
+        keys = {name: tag_key(name) for name in names}
+        ids = {
+            row.normalized_name: row.id
+            for row in db.query(Tag.id, Tag.normalized_name).filter(Tag.normalized_name.in_(keys.values()))
+        }
+        for name, key in keys.items():
+            if key in ids:
+                continue
+            try:
+                with db.begin_nested():
+                    tag = Tag(name=name, normalized_name=key, post_count=0)
+                    db.add(tag)
+                    db.flush()
+                ids[key] = tag.id
+            except IntegrityError:
+                ids[key] = db.query(Tag.id).filter(Tag.normalized_name == key).scalar()
+        return {name: ids[key] for name, key in keys.items()}
+
+    def _adjust_counts(self, db: Session, tag_ids: Iterable[int], delta: int):
+        tag_ids = list(tag_ids)
+        if tag_ids:
+            db.execute(
+                update(Tag)
+                .where(Tag.id.in_(tag_ids))
+                .values(post_count=Tag.post_count + delta)
+                .execution_options(synchronize_session=False)
+            )
+
+    def sync_post(self, db: Session, post_id: int, created_at: datetime, tags: Optional[Iterable[str]]):
+        """게시글 생성/수정 직후 (commit 이전) 호출"""
+        current = {row.tag_id for row in db.query(PostTag.tag_id).filter(PostTag.post_id == post_id)}
+        names = normalize_tags(tags)
+        wanted = set(self._tag_ids(db, names).values()) if names else set()
+
+        removed = current - wanted
+        added = wanted - current
+        if removed:
+            db.execute(delete(PostTag).where(PostTag.post_id == post_id, PostTag.tag_id.in_(removed)))
+            self._adjust_counts(db, removed, -1)
+        if added:
+            db.execute(insert(PostTag), [
+                {"tag_id": tag_id, "post_id": post_id, "created_at": created_at}
+                for tag_id in added
+            ])
+            self._adjust_counts(db, added, 1)
+
+    def remove_post(self, db: Session, post_id: int):
+        """게시글 삭제 직후 (commit 이전) 호출"""
+        tag_ids = [row.tag_id for row in db.query(PostTag.tag_id).filter(PostTag.post_id == post_id)]
+        if tag_ids:
+            db.execute(delete(PostTag).where(PostTag.post_id == post_id))
+            self._adjust_counts(db, tag_ids, -1)
+
+    def find_tags(self, db: Session, names: List[str]) -> List[Tuple[int, int]]:
+        """존재하는 태그의 (id, 게시글 수) 목록 (대소문자 무시)"""
+        keys = {tag_key(name) for name in normalize_tags(names)}
+        return [
+            (row.id, row.post_count)
+            for row in db.query(Tag.id, Tag.post_count).filter(Tag.normalized_name.in_(keys))
+        ]
+
+    def _after(self, after: Tuple[datetime, int]):
+        created_at, post_id = after
+        return or_(
+            PostTag.created_at < created_at,
+            and_(PostTag.created_at == created_at, PostTag.post_id < post_id),
+        )
+
+    def _page(self, db: Session, tag_id: int, limit: int, after: Optional[Tuple[datetime, int]], required=()):
+        query = db.query(PostTag.post_id, PostTag.created_at).filter(PostTag.tag_id == tag_id)
+        if after is not None:
+            query = query.filter(self._after(after))
+        for other_id in required:
+            other = aliased(PostTag)
+            query = query.filter(
+                exists().where(other.tag_id == other_id, other.post_id == PostTag.post_id)
+            )
+        rows = (
+            query.order_by(PostTag.created_at.desc(), PostTag.post_id.desc())
+            .limit(limit)
+            .all()
+        )
+        return [(row.created_at, row.post_id) for row in rows]
+
+    def list_posts(
+        self,
+        db: Session,
+        names: List[str],
+        mode: str,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[Tuple[datetime, int]]:
+        """
+        태그가 달린 게시글의 (created_at, post_id)를 최신순으로 limit개 반환
+        - or: 태그별로 limit개씩 읽어서 병합 (중복 제거)
+        - and: 가장 적게 쓰인 태그의 인덱스를 따라가며 나머지 태그를 PK로 확인
+        """
+        names = normalize_tags(names)
+        tags = self.find_tags(db, names)
+        if mode == "and":
+            if len(tags) < len(names) or not tags:
+                return []
+            tags.sort(key=lambda tag: tag[1])
+            rarest, others = tags[0][0], [tag_id for tag_id, _ in tags[1:]]
+            return self._page(db, rarest, limit, after, others)
+
+        pages = [self._page(db, tag_id, limit, after) for tag_id, _ in tags]
+        merged = []
+        for created_at, post_id in heapq.merge(*pages, reverse=True):
+            if merged and merged[-1][1] == post_id:
+                continue
+            merged.append((created_at, post_id))
+            if len(merged) == limit:
+                break
+        return merged
+
+    def counts(self, db: Session, limit: int) -> List[Dict]:
+        rows = (
+            db.query(Tag.name, Tag.post_count)
+            .filter(Tag.post_count > 0)
+            .order_by(Tag.post_count.desc(), Tag.name)
+            .limit(limit)
+            .all()
+        )
+        return [{"name": row.name, "count": row.post_count} for row in rows]
+
+
+# 전역 태그 색인 인스턴스
+tag_index = TagIndex()
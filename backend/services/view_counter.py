@@ -0,0 +1,113 @@
+import os
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import case, update
+
+from database import SessionLocal
+from models.post import Post
+from services.response_cache import RESPONSE_CACHE_TTL
+
+# 누적된 조회수를 DB에 반영하는 주기 (초)
+VIEW_COUNT_FLUSH_INTERVAL = int(os.getenv("VIEW_COUNT_FLUSH_INTERVAL", "10"))
+
+
+class ViewCounter:
+    """
+    게시글 조회수를 메모리에 모아두었다가 주기적으로 한 번의 UPDATE로 반영하는 누산기
+    (조회 요청마다 UPDATE + COMMIT을 하지 않도록 함)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[int, int] = {}
+        # flush가 UPDATE 중인 값 (커밋 전까지는 DB에 없으므로 미반영분으로 계속 셈)
+        self._in_flight: Dict[int, int] = {}
+        # 이 프로세스가 센 누적 조회수 (반영 여부와 무관, 응답 캐시가 캐싱 이후 증가분을 계산할 때 사용)
+        self._totals: Dict[int, int] = {}
+        # 게시글별 마지막 조회 시각 (오래 조회되지 않은 게시글의 누적 조회수 정리용)
+        self._last_seen: Dict[int, float] = {}
+
+    def increment(self, post_id: int) -> int:
+        """
+        조회수를 1 증가시키고, 아직 DB에 반영되지 않은 누적값(반영 중인 값 포함)을 반환
+        """
+        with self._lock:
+            count = self._pending.get(post_id, 0) + 1
+            self._pending[post_id] = count
+            self._totals[post_id] = self._totals.get(post_id, 0) + 1
+            self._last_seen[post_id] = time.monotonic()
+            return count + self._in_flight.get(post_id, 0)
+
+    def total(self, post_id: int) -> int:
+        with self._lock:
+            return self._totals.get(post_id, 0)
+
+    def discard(self, post_id: int):
+        """
+        삭제된 게시글의 누적값 제거
+        """
+        with self._lock:
+            self._pending.pop(post_id, None)
+            self._in_flight.pop(post_id, None)
+            self._totals.pop(post_id, None)
+            self._last_seen.pop(post_id, None)
+
+    def flush(self) -> int:
+        """
+        누적된 조회수를 UPDATE ... CASE 한 번으로 반영하고 반영한 게시글 수를 반환
+        반영 중인 값은 커밋이 끝날 때까지 _in_flight에 남겨 조회 응답의 조회수가 줄어들지 않도록 함
+        실패하면 누적값을 되돌려 다음 주기에 다시 시도
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            deltas, self._pending = self._pending, {}
+            for post_id, delta in deltas.items():
+                self._in_flight[post_id] = self._in_flight.get(post_id, 0) + delta
+
+        db = SessionLocal()
+        committed = False
+        try:
+            db.execute(
+                update(Post)
+                .where(Post.id.in_(list(deltas)))
+                .values(views=Post.views + case(deltas, value=Post.id, else_=0))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            committed = True
+            self._trim_totals()
+            return len(deltas)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+            with self._lock:
+                for post_id, delta in deltas.items():
+                    remaining = self._in_flight.get(post_id, 0) - delta
+                    if remaining > 0:
+                        self._in_flight[post_id] = remaining
+                    else:
+                        self._in_flight.pop(post_id, None)
+                    if not committed:
+                        self._pending[post_id] = self._pending.get(post_id, 0) + delta
+
+    def _trim_totals(self):
+        """
+        응답 캐시 유효 시간보다 오래 조회되지 않은 게시글의 누적 조회수 제거
+        캐시는 조회 직후에만 저장되므로 그 게시글의 캐시 항목은 이미 만료되어 누적값을 참조하지 않음
+        (다시 조회되면 캐시를 새로 만들면서 0부터 다시 셈)
+        """
+        cutoff = time.monotonic() - RESPONSE_CACHE_TTL - 1
+        with self._lock:
+            idle = [post_id for post_id, seen in self._last_seen.items() if seen < cutoff]
+            for post_id in idle:
+                del self._last_seen[post_id]
+                self._totals.pop(post_id, None)
+
+
+# 전역 조회수 누산기 인스턴스
+view_counter = ViewCounter()
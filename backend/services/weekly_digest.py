@@ -0,0 +1,168 @@
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List
+
+from jinja2 import Template
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models.post import Post
+from database import SessionLocal, has_replica
+from models.weekly_digest import WeeklyDigest
+
+# 메일 요약에 넣을 본문 길이
+DIGEST_EXCERPT_CHARS = 200
+
+DIGEST_TEMPLATE = Template("""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset=\"UTF-8\">
+            <title>Tech Talk 주간 신규 게시글 안내</title>
+            <style>
+                body { font-family: 'Pretendard', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: #f5f5f5; color: #222; }
+                .container { background: #fff; max-width: 550px; margin: 40px auto; border-radius: 8px; box-shadow: 0 2px 8px rgba(0,0,0,0.07); padding: 32px; }
+                h1 { color: #0a80ed; font-size: 1.5rem; margin-bottom: 8px; }
+                .period { color: #666; font-size: 1rem; margin-bottom: 24px; }
+                ul { padding-left: 1.2em; }
+                li { margin-bottom: 10px; font-size: 1.08rem; }
+                .footer { margin-top: 32px; color: #888; font-size: 0.95rem; text-align: center; }
+            </style>
+        </head>
+        <body>
+            <div class=\"container\">
+                <h1>Tech Talk 주간 신규 게시글 안내</h1>
+                <div class=\"period\">{{ week_start }} ~ {{ week_end }}</div>
+                {% if posts %}
+                <ul>
+                    {% for post in posts %}
+                        <li>{{ post.title }}</li>
+                    {% endfor %}
+                </ul>
+                {% else %}
+                <div>이번 주에는 새로운 게시글이 없습니다.</div>
+                {% endif %}
+                <div class=\"footer\">이 이메일은 Tech Talk의 주간 신규 게시글 안내 서비스에 따라 자동 발송되었습니다.</div>
+            </div>
+        </body>
+        </html>
+        """)
+
+
+def week_start_of(value: datetime) -> date:
+    """value가 속한 ISO 주의 월요일"""
+    day = value.date() if isinstance(value, datetime) else value
+    return day - timedelta(days=day.weekday())
+
+
+def week_key(week_start: date) -> str:
+    year, week, _ = week_start.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def format_week_range(week_start: date):
+    week_end = week_start + timedelta(days=6)
+    return week_start.strftime("%Y년 %m월 %d일"), week_end.strftime("%Y년 %m월 %d일")
+
+
+def render_digest(entries: List[Dict[str, Any]], week_start: str, week_end: str) -> str:
+    return DIGEST_TEMPLATE.render(posts=entries, week_start=week_start, week_end=week_end)
+
+
+def make_entry(post: Post) -> Dict[str, Any]:
+    content = post.content or ""
+    return {
+        "id": post.id,
+        "title": post.title,
+        "content": content[:DIGEST_EXCERPT_CHARS] + "..." if len(content) > DIGEST_EXCERPT_CHARS else content,
+        "created_at": post.created_at.strftime("%Y-%m-%d %H:%M"),
+        "sort_key": post.created_at.isoformat(),
+        "tags": post.tags or [],
+        "url": post.url,
+    }
+
+
+class WeeklyDigestStore:
+    """
+    ISO 주차별 주간 다이제스트 스냅샷 (게시글 요약 목록 + 렌더링된 메일 HTML)
+    - 게시글 생성/수정/삭제는 커밋한 뒤 해당 주 스냅샷의 version만 올림 (게시글 트랜잭션에서 스냅샷 행을 잠그지 않음)
+    - 미리보기/발송 시 built_version < version이면 게시글 테이블에서 다시 만들고, 아니면 스냅샷 한 행만 읽음
+    - 스냅샷이 없는 주는 처음 읽을 때 만들어 둠
+    """
+
+    def _render(self, db: Session, week_start: date):
+        start = datetime.combine(week_start, datetime.min.time())
+        posts = (
+            db.query(Post.id, Post.title, Post.content, Post.created_at, Post.tags, Post.url)
+            .filter(Post.created_at >= start, Post.created_at < start + timedelta(days=7))
+            .order_by(Post.created_at.desc(), Post.id.desc())
+            .all()
+        )
+        entries = [make_entry(post) for post in posts]
+        return entries, render_digest(entries, *format_week_range(week_start))
+
+    def _rebuild(self, db: Session, digest: WeeklyDigest):
+        # 만들기 전에 version을 읽어 두므로, 만드는 동안 커밋된 게시글 변경은 다음 조회 때 다시 반영됨
+        version = digest.version
+        entries, html = self._render(db, digest.week_start)
+        db.execute(
+            update(WeeklyDigest)
+            .where(WeeklyDigest.week_key == digest.week_key, WeeklyDigest.built_version < version)
+            .values(entries=entries, html=html, built_version=version)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        db.refresh(digest)
+
+    def get(self, db: Session, week_start: date) -> WeeklyDigest:
+        key = week_key(week_start)
+        digest = db.get(WeeklyDigest, key)
+        if digest is None:
+            # 빈 스냅샷을 먼저 넣어 두고 만듦 (그 사이 커밋된 게시글 변경도 version을 올릴 수 있도록)
+            db.add(WeeklyDigest(week_key=key, week_start=week_start, entries=[], html="", version=1, built_version=0))
+            try:
+                db.commit()
+            except IntegrityError:
+                # 다른 요청이 먼저 만든 경우 그 스냅샷을 사용
+                db.rollback()
+            digest = db.get(WeeklyDigest, key)
+        if digest.built_version < digest.version:
+            self._rebuild(db, digest)
+        return digest
+
+    def read(self, read_db: Session, week_start: date) -> WeeklyDigest:
+        """
+        조회 전용 세션(복제본)에서 스냅샷 조회
+        아직 없거나 다시 만들어야 하면 주 DB에서 만들어 반환 (복제본에는 쓸 수 없으므로)
+        """
+        if not has_replica():
+            return self.get(read_db, week_start)
+        digest = read_db.get(WeeklyDigest, week_key(week_start))
+        if digest is not None and digest.built_version >= digest.version:
+            return digest
+        db = SessionLocal()
+        try:
+            digest = self.get(db, week_start)
+            # 세션을 닫은 뒤에도 쓸 수 있도록 값을 읽어 두고 분리
+            digest.entries, digest.html
+            db.expunge(digest)
+            return digest
+        finally:
+            db.close()
+
+    def mark_changed(self, db: Session, created_at: datetime):
+        """
+        게시글 생성/수정/삭제를 커밋한 뒤 호출 (해당 주 스냅샷이 있으면 다음 조회 때 다시 만들도록 표시)
+        게시글 트랜잭션과 분리된 짧은 UPDATE 한 번이므로 게시글 쓰기끼리 스냅샷 행에서 기다리지 않음
+        """
+        db.execute(
+            update(WeeklyDigest)
+            .where(WeeklyDigest.week_key == week_key(week_start_of(created_at)))
+            .values(version=WeeklyDigest.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+
+# 전역 주간 다이제스트 스냅샷 인스턴스
+weekly_digest_store = WeeklyDigestStore()
@@ -0,0 +1,31 @@
+"""
+테스트 공통 설정
+앱 모듈은 불러올 때 환경 변수를 읽으므로, 테스트 모듈을 불러오기 전에 임시 SQLite DB와
+로컬 OpenAI 대역 서버를 가리키도록 먼저 설정합니다.
+"""
+import os
+import tempfile
+
+import pytest
+
+from benchmarks.fake_servers import FakeOpenAIServer
+
+_database_url = f"sqlite:///{tempfile.mkdtemp()}/tech_talk_test.db"
+os.environ["DATABASE_URL"] = _database_url
+os.environ["EXPLAIN_CHECK_DATABASE_URL"] = _database_url
+os.environ["BCRYPT_ROUNDS"] = "4"
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+os.environ["OPENAI_API_KEY"] = "fake-key"
+
+_fake_openai = FakeOpenAIServer().start()
+os.environ["OPENAI_BASE_URL"] = _fake_openai.url
+
+
+@pytest.fixture
+def fake_openai():
+    yield _fake_openai
+    _fake_openai.latency = 0.0
+
+
+def pytest_sessionfinish(session, exitstatus):
+    _fake_openai.stop()
@@ -0,0 +1,6 @@
+from scripts import explain_check
+
+
+def test_router_queries_have_no_full_table_scans():
+    # SQLite는 통계(ANALYZE) 없이 인덱스 기준으로 실행 계획을 세우므로 기본값보다 적은 데이터로 확인
+    assert explain_check.check(posts=1000, comments_per_post=2) == 0
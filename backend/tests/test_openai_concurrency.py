@@ -0,0 +1,9 @@
+import asyncio
+
+from benchmarks import openai_concurrency_check
+
+
+def test_reads_are_not_blocked_by_slow_openai_calls(fake_openai):
+    fake_openai.latency = 1.0
+    assert asyncio.run(openai_concurrency_check.run(latency=1.0, analyses=4)) == 0
+    assert fake_openai.request_count >= 4